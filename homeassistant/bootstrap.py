@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable
 import contextlib
 from functools import partial
 from itertools import chain
@@ -96,9 +97,11 @@ from .setup import (
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_get_setup_critical_path,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
+    async_set_setup_critical_path,
     async_setup_component,
 )
 from .util.async_ import create_eager_task
@@ -772,6 +775,256 @@ async def async_setup_multi_components(
             )
 
 
+class _SetupScheduler:
+    """Set up integrations as soon as the integrations they depend on are set up.
+
+    An integration is started once its dependencies and after dependencies
+    which are scheduled as well have finished setting up, so a slow
+    integration only delays the integrations depending on it. Stage 1
+    integrations do not wait for stage 2 integrations.
+
+    Stage 2 integrations which do not depend on stage 1 integrations, and
+    are not after dependencies of them, are started once the requirements
+    of the stage 1 integrations have been processed. The other stage 2
+    integrations are started once stage 1 is set up.
+    """
+
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        config: dict[str, Any],
+        integration_cache: dict[str, loader.Integration],
+        stage_1_domains: set[str],
+        stage_2_domains: set[str],
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._config = config
+        self._stage_1_domains = stage_1_domains
+        self._stage_2_domains = stage_2_domains
+        self._waiting_on: dict[str, set[str]] = {}
+        self._dependents: defaultdict[str, set[str]] = defaultdict(set)
+        # Domains which may be started once they are not waiting anymore
+        self._allowed: set[str] = set()
+        self._started: dict[str, float] = {}
+        self._finished: dict[str, float] = {}
+        # The dependency which finished last before an integration was started
+        self._gated_by: dict[str, str] = {}
+        # The integration which finished last and completed the setup
+        self._finished_last: str | None = None
+        self._stage_1_remaining = len(stage_1_domains)
+        self._stage_1_done = hass.loop.create_future()
+        self._done = hass.loop.create_future()
+
+        all_domains = stage_1_domains | stage_2_domains
+        stage_1_after_dependencies: set[str] = set()
+        for domain in all_domains:
+            waiting_on: set[str] = set()
+            if (integration := integration_cache.get(domain)) is not None:
+                waiting_on.update(
+                    dep
+                    for dep in chain(
+                        integration.dependencies, integration.after_dependencies
+                    )
+                    if dep != domain
+                    and dep
+                    in (stage_1_domains if domain in stage_1_domains else all_domains)
+                )
+                if domain in stage_1_domains:
+                    stage_1_after_dependencies.update(integration.after_dependencies)
+            self._waiting_on[domain] = waiting_on
+            for dep in waiting_on:
+                self._dependents[dep].add(domain)
+        setup_order = self._break_cycles()
+
+        self._stage_2_early: set[str] = set()
+        for domain in setup_order:
+            if (
+                domain in stage_2_domains
+                and domain not in stage_1_after_dependencies
+                and self._waiting_on[domain] <= self._stage_2_early
+            ):
+                self._stage_2_early.add(domain)
+
+        if not self._stage_1_remaining:
+            self._stage_1_done.set_result(None)
+        if not self._waiting_on:
+            self._done.set_result(None)
+
+    def _break_cycles(self) -> list[str]:
+        """Stop waiting on dependencies of integrations in a cycle.
+
+        They wait for each other while setting up instead. Returns the
+        domains in an order they can be set up in.
+        """
+        setup_order: list[str] = []
+        remaining = {domain: len(deps) for domain, deps in self._waiting_on.items()}
+        ready = [domain for domain, count in remaining.items() if not count]
+        while ready:
+            domain = ready.pop()
+            setup_order.append(domain)
+            del remaining[domain]
+            for dependent in self._dependents.get(domain, ()):
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.append(dependent)
+        for domain in remaining:
+            _LOGGER.warning(
+                "Integration %s has circular dependencies, not waiting on %s",
+                domain,
+                self._waiting_on[domain],
+            )
+            for dep in self._waiting_on[domain]:
+                self._dependents[dep].discard(domain)
+            self._waiting_on[domain] = set()
+        # Integrations in a cycle do not wait for other stage 2 integrations
+        setup_order[:0] = remaining
+        return setup_order
+
+    @core.callback
+    def async_start(self) -> None:
+        """Start setting up the stage 1 integrations.
+
+        Stage 2 integrations are not started before the requirements of the
+        stage 1 integrations are processed so they do not import an outdated
+        version of a package shared with stage 1.
+        """
+        _LOGGER.debug("Setup waits on dependencies: %s", self._waiting_on)
+        self._async_allow(self._stage_1_domains)
+        self._hass.async_create_background_task(
+            self._async_process_stage_1_requirements(),
+            "process stage 1 requirements",
+            eager_start=True,
+        )
+
+    async def _async_process_stage_1_requirements(self) -> None:
+        """Process the stage 1 requirements and start the early stage 2.
+
+        Failures are logged when the integrations are set up.
+        """
+        await asyncio.gather(
+            *(
+                requirements.async_get_integration_with_requirements(self._hass, domain)
+                for domain in self._stage_1_domains
+            ),
+            return_exceptions=True,
+        )
+        self._async_allow(self._stage_2_early)
+
+    @core.callback
+    def async_start_stage_2(self) -> None:
+        """Start setting up all stage 2 integrations."""
+        self._async_allow(self._stage_2_domains)
+
+    @core.callback
+    def async_start_remaining(self) -> None:
+        """Start setting up all integrations not started yet.
+
+        Integrations still waiting on a dependency wait for it while
+        setting up instead.
+        """
+        self._async_allow(self._waiting_on.keys())
+        for waiting_on in self._waiting_on.values():
+            waiting_on.clear()
+        self._async_start_ready(self._waiting_on.keys() - self._started.keys())
+
+    @core.callback
+    def _async_allow(self, domains: Iterable[str]) -> None:
+        """Allow integrations to be started.
+
+        The domains are set to be loaded to enable the after dependencies
+        on them.
+        """
+        allowed = {domain for domain in domains if domain not in self._allowed}
+        self._allowed.update(allowed)
+        async_set_domains_to_be_loaded(
+            self._hass,
+            {
+                domain
+                for domain in allowed
+                if domain not in self._finished
+                and domain not in self._hass.config.components
+            },
+        )
+        self._async_start_ready(allowed)
+
+    @core.callback
+    def _async_start_ready(self, domains: Iterable[str]) -> None:
+        """Start setting up the allowed integrations not waiting on any dependency."""
+        for domain in sorted(domains, key=SETUP_ORDER_SORT_KEY, reverse=True):
+            if (
+                domain in self._started
+                or domain not in self._allowed
+                or self._waiting_on[domain]
+            ):
+                continue
+            self._started[domain] = monotonic()
+            self._hass.async_create_task_internal(
+                async_setup_component(self._hass, domain, self._config),
+                f"setup component {domain}",
+                eager_start=True,
+            ).add_done_callback(partial(self._async_setup_done, domain))
+
+    @core.callback
+    def _async_setup_done(self, domain: str, task: asyncio.Task[bool]) -> None:
+        """Start the integrations which were waiting on an integration."""
+        self._finished[domain] = monotonic()
+        exc = asyncio.CancelledError() if task.cancelled() else task.exception()
+        if exc is not None:
+            _LOGGER.error(
+                "Error setting up integration %s - received exception",
+                domain,
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
+
+        ready: list[str] = []
+        for dependent in self._dependents.pop(domain, ()):
+            waiting_on = self._waiting_on[dependent]
+            if domain in waiting_on:
+                waiting_on.remove(domain)
+                if not waiting_on:
+                    self._gated_by[dependent] = domain
+                    ready.append(dependent)
+        self._async_start_ready(ready)
+
+        if domain in self._stage_1_domains:
+            self._stage_1_remaining -= 1
+            if not self._stage_1_remaining:
+                self._stage_1_done.set_result(None)
+        if len(self._finished) == len(self._waiting_on):
+            self._finished_last = domain
+            self._done.set_result(None)
+
+    async def async_wait_stage_1(self) -> None:
+        """Wait for the stage 1 integrations to be set up."""
+        await asyncio.shield(self._stage_1_done)
+
+    async def async_wait(self) -> None:
+        """Wait for all integrations to be set up."""
+        await asyncio.shield(self._done)
+
+    @core.callback
+    def async_critical_path(self) -> list[tuple[str, float]]:
+        """Return the integrations which delayed the setup the longest.
+
+        Starting with the integration which completed the setup, each
+        integration is preceded by the dependency it was waiting on last.
+        If the setup timed out, the path starts with the integration which
+        finished last, ties are broken by domain.
+        """
+        if not self._finished:
+            return []
+        path: list[tuple[str, float]] = []
+        domain: str | None = self._finished_last or max(
+            self._finished, key=lambda domain: (self._finished[domain], domain)
+        )
+        while domain is not None:
+            path.append((domain, self._finished[domain] - self._started[domain]))
+            domain = self._gated_by.get(domain)
+        path.reverse()
+        return path
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -987,38 +1240,41 @@ async def _async_set_up_integrations(
             async_set_domains_to_be_loaded(hass, to_be_loaded)
             await async_setup_multi_components(hass, domain_group, config)
 
-    # Enables after dependencies when setting up stage 1 domains
-    async_set_domains_to_be_loaded(hass, stage_1_domains)
+    scheduler = _SetupScheduler(
+        hass, config, integration_cache, stage_1_domains, stage_2_domains
+    )
 
     # Start setup
-    if stage_1_domains:
+    if not stage_1_domains:
+        scheduler.async_start()
+    else:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                scheduler.async_start()
+                await scheduler.async_wait_stage_1()
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
 
-    # Add after dependencies when setting up stage 2 domains
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
-
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        scheduler.async_start_stage_2()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await scheduler.async_wait()
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
+            scheduler.async_start_remaining()
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -1033,9 +1289,15 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    async_set_setup_critical_path(hass, scheduler.async_critical_path())
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Integration setup critical path: %s",
+            async_get_setup_critical_path(hass),
+        )
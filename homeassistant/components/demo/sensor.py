@@ -144,6 +144,7 @@ class DemoSensor(SensorEntity):
     _attr_has_entity_name = True
     _attr_name = None
     _attr_should_poll = False
+    _track_dirty_attributes = True
 
     def __init__(
         self,
@@ -180,6 +181,7 @@ class DemoSumSensor(RestoreSensor):
 
     _attr_should_poll = False
     _attr_native_value: float
+    _track_dirty_attributes = True
 
     def __init__(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine, Mapping
 from dataclasses import dataclass, field
 from http import HTTPStatus
@@ -28,6 +29,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
+    LazyPlatform,
     Manifest,
     async_get_custom_components,
     async_get_integration,
@@ -65,9 +67,14 @@ class DiagnosticsPlatformData:
 
 @dataclass(slots=True)
 class DiagnosticsData:
-    """Diagnostic data."""
+    """Diagnostic data.
 
-    platforms: dict[str, DiagnosticsPlatformData] = field(default_factory=dict)
+    The platforms are only imported once their diagnostics are requested.
+    """
+
+    platforms: dict[str, DiagnosticsPlatformData | LazyPlatform] = field(
+        default_factory=dict
+    )
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -75,7 +82,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = DiagnosticsData()
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
+        hass, DOMAIN, _register_diagnostics_platform, lazy=True
     )
 
     websocket_api.async_register_command(hass, handle_info)
@@ -101,24 +108,43 @@ class DiagnosticsProtocol(Protocol):
 
 @callback
 def _register_diagnostics_platform(
-    hass: HomeAssistant, integration_domain: str, platform: DiagnosticsProtocol
+    hass: HomeAssistant, integration_domain: str, platform: LazyPlatform
 ) -> None:
     """Register a diagnostics platform."""
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
-    diagnostics_data.platforms[integration_domain] = DiagnosticsPlatformData(
+    diagnostics_data.platforms[integration_domain] = platform
+
+
+async def _async_get_platform_data(
+    hass: HomeAssistant, domain: str
+) -> DiagnosticsPlatformData | None:
+    """Return the diagnostics platform data, importing the platform if needed."""
+    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    info = diagnostics_data.platforms.get(domain)
+    if not isinstance(info, LazyPlatform):
+        return info
+    try:
+        platform: DiagnosticsProtocol = await info.async_load()
+    except ImportError:
+        _LOGGER.exception("Error importing diagnostics platform of %s", domain)
+        return None
+    data = DiagnosticsPlatformData(
         getattr(platform, "async_get_config_entry_diagnostics", None),
         getattr(platform, "async_get_device_diagnostics", None),
     )
+    diagnostics_data.platforms[domain] = data
+    return data
 
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    domains = list(diagnostics_data.platforms)
     result = [
         {
             "domain": domain,
@@ -127,7 +153,14 @@ def handle_info(
                 DiagnosticsSubType.DEVICE: info.device_diagnostics is not None,
             },
         }
-        for domain, info in diagnostics_data.platforms.items()
+        for domain, info in zip(
+            domains,
+            await asyncio.gather(
+                *(_async_get_platform_data(hass, domain) for domain in domains)
+            ),
+            strict=True,
+        )
+        if info is not None
     ]
     connection.send_result(msg["id"], result)
 
@@ -139,15 +172,14 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
 
-    if (info := diagnostics_data.platforms.get(domain)) is None:
+    if (info := await _async_get_platform_data(hass, domain)) is None:
         connection.send_error(
             msg["id"], websocket_api.ERR_NOT_FOUND, "Domain not supported"
         )
@@ -267,8 +299,7 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
-        if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
+        if (info := await _async_get_platform_data(hass, config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
         filename = f"{config_entry.domain}-{config_entry.entry_id}"
@@ -320,13 +320,8 @@ class SensorFilter(SensorEntity):
 
             # Retrieve the largest window_size of each type
             if largest_window_items > 0:
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
-                    )
+                filter_history = await history.async_get_last_state_changes(
+                    self.hass, largest_window_items, self._entity
                 )
                 if self._entity in filter_history:
                     history_list.extend(filter_history[self._entity])
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.engine.row import Row
 
 from homeassistant.components.recorder.filters import Filters
@@ -22,6 +23,9 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+# The number of rows contexts originate from that are kept between requests
+CONTEXT_ROWS_CACHE_SIZE = 8192
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +37,9 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    context_rows: LRU[bytes, Row] = field(
+        default_factory=lambda: LRU(CONTEXT_ROWS_CACHE_SIZE)
+    )
 
 
 class LazyEventPartialState:
@@ -6,11 +6,14 @@ from collections.abc import Callable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import islice
 import logging
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from typing_extensions import Generator
 
 from homeassistant.components.recorder import get_instance
@@ -38,6 +41,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -65,11 +69,14 @@ from .const import (
 )
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
-from .queries import statement_for_request
-from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries import context_ids_statement_for_request, statement_for_request
+from .queries.common import PSEUDO_EVENT_STATE_CHANGED, context_rows_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of logbook entries humanified at a time when streaming
+EVENTS_CHUNK_SIZE = 1000
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -112,6 +119,7 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.context_rows = logbook_config.context_rows
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
@@ -145,6 +153,23 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return [
+            event
+            for events in self.get_events_chunked(start_day, end_day)
+            for event in events
+        ]
+
+    def get_events_chunked(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[list[dict[str, Any]]]:
+        """Get events for a period of time in chunks.
+
+        Rows of periods longer than a day are streamed from the database
+        and humanified as they are fetched, so only a chunk of the events
+        is held in memory at a time.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -169,9 +194,68 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if (
+                context_ids_stmt := context_ids_statement_for_request(
+                    start_day,
+                    end_day,
+                    event_type_ids,
+                    self.entity_ids,
+                    metadata_ids,
+                    self.device_ids,
+                )
+            ) is not None:
+                self._lookup_context_rows(session, context_ids_stmt)
+            events = _humanify(
+                self.hass,
+                # The period decides if the rows are streamed
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    dt_util.as_utc(start_day),
+                    dt_util.as_utc(end_day),
+                    orm_rows=False,
+                ),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
+            while chunk := list(islice(events, EVENTS_CHUNK_SIZE)):
+                yield chunk
+
+    def _lookup_context_rows(
+        self, session: Session, context_ids_stmt: StatementLambdaElement
+    ) -> None:
+        """Look up the rows the contexts of the logbook rows originate from.
+
+        A context always originates from the first row recorded with it,
+        so the rows are kept between requests and only the ones missing
+        from the cache are selected from the database.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_rows = self.context_rows
+        missing_context_ids: list[bytes] = []
+        for (context_id_bin,) in execute_stmt_lambda_element(
+            session, context_ids_stmt, orm_rows=False
+        ):
+            if context_id_bin is None:
+                continue
+            if (context_row := context_rows.get(context_id_bin)) is not None:
+                context_lookup[context_id_bin] = context_row
+            else:
+                missing_context_ids.append(context_id_bin)
+        if not missing_context_ids:
+            return
+        # The context ids are bound once for events and once for states
+        for context_ids_chunk in chunked_or_all(
+            missing_context_ids, get_instance(self.hass).max_bind_vars // 2
+        ):
+            for context_row in execute_stmt_lambda_element(
+                session, context_rows_stmt(context_ids_chunk), orm_rows=False
+            ):
+                context_id_bin = context_row.context_id_bin
+                if context_id_bin not in context_lookup:
+                    context_lookup[context_id_bin] = context_row
+                    context_rows[context_id_bin] = context_row
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
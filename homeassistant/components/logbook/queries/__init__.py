@@ -12,9 +12,12 @@ from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
-from .devices import devices_stmt
-from .entities import entities_stmt
-from .entities_and_devices import entities_devices_stmt
+from .devices import devices_context_ids_stmt, devices_stmt
+from .entities import entities_context_ids_stmt, entities_stmt
+from .entities_and_devices import (
+    entities_devices_context_ids_stmt,
+    entities_devices_stmt,
+)
 
 
 def statement_for_request(
@@ -76,3 +79,47 @@ def statement_for_request(
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
     )
+
+
+def context_ids_statement_for_request(
+    start_day_dt: dt,
+    end_day_dt: dt,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None = None,
+    states_metadata_ids: Collection[int] | None = None,
+    device_ids: list[str] | None = None,
+) -> StatementLambdaElement | None:
+    """Generate the statement for the context ids of a logbook request.
+
+    The rows the contexts originate from are only looked up separately
+    when the request is limited to entities or devices, otherwise they
+    are part of the rows of the request.
+    """
+    if not entity_ids and not device_ids:
+        return None
+    start_day = start_day_dt.timestamp()
+    end_day = end_day_dt.timestamp()
+    if entity_ids and device_ids:
+        return entities_devices_context_ids_stmt(
+            start_day,
+            end_day,
+            event_type_ids,
+            states_metadata_ids or [],
+            [json_dumps(entity_id) for entity_id in entity_ids],
+            [json_dumps(device_id) for device_id in device_ids],
+        )
+    if entity_ids:
+        return entities_context_ids_stmt(
+            start_day,
+            end_day,
+            event_type_ids,
+            states_metadata_ids or [],
+            [json_dumps(entity_id) for entity_id in entity_ids],
+        )
+    assert device_ids is not None
+    return devices_context_ids_stmt(
+        start_day,
+        end_day,
+        event_type_ids,
+        [json_dumps(device_id) for device_id in device_ids],
+    )
@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import Final
 
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
 from homeassistant.components.recorder.db_schema import (
@@ -142,6 +143,30 @@ def select_states_context_only() -> Select:
     )
 
 
+def context_rows_stmt(context_ids_bin: list[bytes]) -> StatementLambdaElement:
+    """Generate a query for the rows of the context ids marked as context_only.
+
+    The rows are ordered by time so the first row of each context
+    is the row the context originates from.
+    """
+    return lambda_stmt(
+        lambda: apply_events_context_hints(
+            select_events_context_only()
+            .where(Events.context_id_bin.in_(context_ids_bin))
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        )
+        .union_all(
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_ids_bin))
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            )
+        )
+        .order_by(Events.time_fired_ts)
+    )
+
+
 def select_events_without_states(
     start_day: float, end_day: float, event_type_ids: tuple[int, ...]
 ) -> Select:
@@ -106,6 +106,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -128,6 +129,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -140,6 +142,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -161,6 +164,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -168,7 +172,11 @@ async def _async_get_ws_stream_events(
     event_processor: EventProcessor,
     partial: bool,
 ) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
+    """Async wrapper around _ws_stream_get_events.
+
+    All chunks of events except the last one are sent to the websocket
+    as soon as they are fetched, the last one is returned.
+    """
     return await get_instance(hass).async_add_executor_job(
         _ws_stream_get_events,
         msg_id,
@@ -177,6 +185,9 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        lambda message: hass.loop.call_soon_threadsafe(
+            connection.send_message, message
+        ),
     )
 
 
@@ -198,9 +209,18 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    send_message: Callable[[bytes], Any],
 ) -> tuple[bytes, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    events: list[dict[str, Any]] = []
+    for chunk in event_processor.get_events_chunked(start_day, end_day):
+        if events:
+            # More events follow so the client can render these
+            # while the rest of the period is fetched
+            message = _generate_stream_message(events, start_day, end_day)
+            message["partial"] = True
+            send_message(json_bytes(formatter(msg_id, message)))
+        events = chunk
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
@@ -268,12 +268,107 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A topic level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class WildcardSubscriptions:
+    """Match topics against wildcard subscriptions.
+
+    The subscriptions are stored in a trie keyed by topic level so matching
+    a topic scales with the number of topic levels instead of the number
+    of subscriptions.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription is unknown.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the levels no longer leading to any subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription for the exact topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        first_level_wildcards = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                # A multi level wildcard also matches its parent level
+                if (child := children.get("#")) is not None:
+                    matches.extend(child.subscriptions)
+                continue
+            if idx or first_level_wildcards:
+                if (child := children.get("#")) is not None:
+                    matches.extend(child.subscriptions)
+                if (child := children.get("+")) is not None:
+                    stack.append((child, idx + 1))
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -474,7 +569,7 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions = WildcardSubscriptions()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -722,8 +817,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -927,9 +1022,7 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
-
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1133,13 +1226,7 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
@@ -1330,13 +1417,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
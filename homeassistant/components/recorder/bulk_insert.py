@@ -0,0 +1,129 @@
+"""Bulk insert of recorded states and statistics for the recorder."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import StateAttributes, States, StatesMeta, StatisticsBase
+
+
+@lru_cache
+def _insert_columns(table: Table) -> tuple[str, ...]:
+    """Return the columns set when inserting into a table."""
+    return tuple(column.key for column in table.columns if not column.primary_key)
+
+
+def _insert_rows(session: Session, rows: Sequence[Any]) -> None:
+    """Insert rows of the same table and assign their primary keys.
+
+    The rows are inserted with Core instead of being added to the
+    session to avoid the overhead of the ORM unit of work.
+    """
+    table: Table = rows[0].__table__
+    columns = _insert_columns(table)
+    (primary_key,) = table.primary_key.columns
+    params = [{column: row.__dict__.get(column) for column in columns} for row in rows]
+    if session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = session.execute(
+            insert(table).returning(primary_key, sort_by_parameter_order=True),
+            params,
+        )
+        for row, primary_key_value in zip(rows, result.scalars(), strict=True):
+            setattr(row, primary_key.key, primary_key_value)
+        return
+    # The database cannot return the primary keys of a multi
+    # row insert (MySQL) so fallback to one insert per row
+    stmt = insert(table)
+    for row, row_params in zip(rows, params, strict=True):
+        setattr(
+            row,
+            primary_key.key,
+            session.execute(stmt, row_params).inserted_primary_key[0],
+        )
+
+
+def insert_statistics(session: Session, rows: Sequence[StatisticsBase]) -> None:
+    """Insert compiled statistics of the same table and assign their ids."""
+    if rows:
+        _insert_rows(session, rows)
+
+
+class PendingStatesWriter:
+    """Write pending states, states metadata and state attributes in bulk.
+
+    The rows are written in order of their foreign keys when the event
+    session is committed. Their ids are assigned to the objects so the
+    table managers can pick them up in post_commit_pending.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self._states_meta: list[StatesMeta] = []
+        self._state_attributes: list[StateAttributes] = []
+        self._states: list[States] = []
+
+    def add_states_meta(self, states_meta: StatesMeta) -> None:
+        """Add a states metadata row to be written."""
+        self._states_meta.append(states_meta)
+
+    def add_state_attributes(self, state_attributes: StateAttributes) -> None:
+        """Add a state attributes row to be written."""
+        self._state_attributes.append(state_attributes)
+
+    def add_state(self, state: States) -> None:
+        """Add a state row to be written."""
+        self._states.append(state)
+
+    def write(self, session: Session) -> None:
+        """Write all pending rows in the session's transaction."""
+        if self._states_meta:
+            _insert_rows(session, self._states_meta)
+        if self._state_attributes:
+            _insert_rows(session, self._state_attributes)
+        if self._states:
+            self._write_states(session)
+        self.reset()
+
+    def _write_states(self, session: Session) -> None:
+        """Write the pending states.
+
+        A state can reference an old state that is pending as well when the
+        entity changed more than once since the last commit. These states are
+        inserted in generations so the old state id is known before insert.
+        """
+        generations: list[list[States]] = []
+        state_generation: dict[int, int] = {}
+        for state in self._states:
+            if (old_state := state.old_state) is not None and (
+                old_generation := state_generation.get(id(old_state))
+            ) is not None:
+                generation = old_generation + 1
+            else:
+                generation = 0
+            state_generation[id(state)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(state)
+
+        for states in generations:
+            for state in states:
+                if (old_state := state.old_state) is not None:
+                    # The old state id is None if the old state was never
+                    # recorded because its attributes could not be serialized
+                    state.old_state_id = old_state.state_id
+                if (states_meta := state.states_meta_rel) is not None:
+                    state.metadata_id = states_meta.metadata_id
+                if (state_attributes := state.state_attributes) is not None:
+                    state.attributes_id = state_attributes.attributes_id
+            _insert_rows(session, states)
+
+    def reset(self) -> None:
+        """Forget all pending rows."""
+        self._states_meta.clear()
+        self._state_attributes.clear()
+        self._states.clear()
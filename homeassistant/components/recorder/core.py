@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import PendingStatesWriter
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -84,6 +85,8 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history_cache import StatesHistoryCache
+from .metrics import RecorderMetrics
 from .migration import (
     EntityIDMigration,
     EventsContextIDMigration,
@@ -180,6 +183,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        history_cache_size: int = 0,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -227,6 +231,15 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # States are written with bulk inserts instead of the session
+        # since they are by far the most frequently written rows
+        self._pending_states_writer = PendingStatesWriter()
+        self.metrics = RecorderMetrics()
+        # The history cache is only created when enabled since it
+        # trades memory for faster history queries
+        self.states_history_cache: StatesHistoryCache | None = (
+            StatesHistoryCache(history_cache_size) if history_cache_size else None
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -1037,10 +1050,15 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
+        metrics = self.metrics
+        start = time.monotonic()
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
+            metrics.state_processing_time += time.monotonic() - start
         else:
             self._process_non_state_changed_event_into_session(event)
+            metrics.event_processing_time += time.monotonic() - start
+        metrics.pending_events += 1
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1144,7 +1162,7 @@ class Recorder(threading.Thread):
         else:
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
+            self._pending_states_writer.add_states_meta(states_meta)
             dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
@@ -1169,10 +1187,21 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
+            self._pending_states_writer.add_state_attributes(dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if (states_history_cache := self.states_history_cache) is not None:
+            if TYPE_CHECKING:
+                assert dbstate.last_updated_ts is not None
+            states_history_cache.add(
+                entity_id,
+                dbstate.state,
+                dbstate.last_updated_ts,
+                dbstate.last_changed_ts,
+                shared_attrs,
+            )
+        self._event_session_has_pending_writes = True
+        self._pending_states_writer.add_state(dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1211,7 +1240,9 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        start = time.monotonic()
 
+        self._pending_states_writer.write(session)
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1229,6 +1260,7 @@ class Recorder(threading.Thread):
                 )
         session.commit()
 
+        self.metrics.record_commit(time.monotonic() - start)
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1266,6 +1298,12 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_states_writer.reset()
+        # The pending events were rolled back
+        self.metrics.pending_events = 0
+        if self.states_history_cache is not None:
+            # Uncommitted states may have been rolled back
+            self.states_history_cache.clear()
 
         if not self.event_session:
             return
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.util.hass_dict import HassKey
 
 from ... import recorder
 from ..filters import Filters
@@ -15,6 +18,7 @@ from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_last_state_changes_for_entities as _modern_get_last_state_changes_for_entities,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
@@ -24,8 +28,10 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_get_last_state_changes",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_last_state_changes_for_entities",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
@@ -80,6 +86,112 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_last_state_changes_for_entities(
+    hass: HomeAssistant, number_of_states: int, entity_ids: list[str]
+) -> dict[str, list[State]]:
+    """Return the last number_of_states of multiple entities."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_last_state_changes as _legacy_get_last_state_changes,
+        )
+
+        states: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            states.update(
+                _legacy_get_last_state_changes(hass, number_of_states, entity_id)
+            )
+        return states
+    return _modern_get_last_state_changes_for_entities(
+        hass, number_of_states, entity_ids
+    )
+
+
+DATA_LAST_STATE_CHANGES_REQUESTS: HassKey[_LastStateChangesRequests] = HassKey(
+    "recorder_history_last_state_changes_requests"
+)
+
+
+class _LastStateChangesRequests:
+    """Merge requests for the last states of entities into one query.
+
+    The requests made in the same iteration of the event loop for the
+    same number of states are run as a single job in the recorder
+    executor, such as when the entities of an integration are added.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the requests."""
+        self._hass = hass
+        self._pending: dict[
+            int, tuple[list[str], asyncio.Future[dict[str, list[State]]]]
+        ] = {}
+
+    @callback
+    def async_request(
+        self, number_of_states: int, entity_id: str
+    ) -> asyncio.Future[dict[str, list[State]]]:
+        """Request the last number_of_states of an entity."""
+        if not self._pending:
+            self._hass.loop.call_soon(self._async_run)
+        if (pending := self._pending.get(number_of_states)) is None:
+            pending = self._pending[number_of_states] = (
+                [],
+                self._hass.loop.create_future(),
+            )
+        entity_ids, future = pending
+        entity_ids.append(entity_id)
+        return future
+
+    @callback
+    def _async_run(self) -> None:
+        """Run the pending requests."""
+        pending = self._pending
+        self._pending = {}
+        instance = recorder.get_instance(self._hass)
+        for number_of_states, (entity_ids, future) in pending.items():
+            instance.async_add_executor_job(
+                get_last_state_changes_for_entities,
+                self._hass,
+                number_of_states,
+                entity_ids,
+            ).add_done_callback(partial(_async_set_future_from_job, future))
+
+
+@callback
+def _async_set_future_from_job(
+    future: asyncio.Future[dict[str, list[State]]],
+    job: asyncio.Future[dict[str, list[State]]],
+) -> None:
+    """Set the result of a future from the executor job."""
+    if future.done():
+        return
+    if job.cancelled():
+        future.cancel()
+    elif (exc := job.exception()) is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(job.result())
+
+
+async def async_get_last_state_changes(
+    hass: HomeAssistant, number_of_states: int, entity_id: str
+) -> dict[str, list[State]]:
+    """Return the last number_of_states of an entity.
+
+    Requests for multiple entities made at the same time are merged
+    into one query instead of running a query per entity.
+    """
+    if (requests := hass.data.get(DATA_LAST_STATE_CHANGES_REQUESTS)) is None:
+        requests = hass.data[DATA_LAST_STATE_CHANGES_REQUESTS] = (
+            _LastStateChangesRequests(hass)
+        )
+    states = await asyncio.shield(requests.async_request(number_of_states, entity_id))
+    entity_id_lower = entity_id.lower()
+    if entity_id_lower not in states:
+        return {}
+    return {entity_id_lower: list(states[entity_id_lower])}
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
@@ -6,7 +6,7 @@ from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import (
     CompoundSelect,
@@ -30,6 +30,7 @@ from ... import recorder
 from ..const import LAST_REPORTED_SCHEMA_VERSION
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
+from ..history_cache import CachedStateRow, StatesHistoryCache
 from ..models import (
     LazyState,
     datetime_to_timestamp_or_none,
@@ -45,6 +46,13 @@ from .const import (
     STATE_KEY,
 )
 
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+# The number of entities the last states are selected for in one query,
+# which is well below the limit of terms in a compound select of SQLite
+LAST_STATE_CHANGES_QUERY_ENTITIES = 100
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
@@ -229,9 +237,132 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    instance = recorder.get_instance(hass)
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    if (states_history_cache := instance.states_history_cache) is None:
+        return _get_significant_states_from_db(
+            instance,
+            session,
+            start_time_ts,
+            end_time,
+            end_time_ts,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            run_start_ts,
+        )
+    cached_entity_ids, cached_result = _get_significant_states_from_cache(
+        states_history_cache,
+        start_time_ts,
+        end_time_ts,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    )
+    if len(cached_entity_ids) == len(entity_ids):
+        return cached_result
+    db_result = _get_significant_states_from_db(
+        instance,
+        session,
+        start_time_ts,
+        end_time,
+        end_time_ts,
+        [entity_id for entity_id in entity_ids if entity_id not in cached_entity_ids],
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        run_start_ts,
+    )
+    if not cached_result:
+        return db_result
+    # Maintain the order of the requested entity_ids
+    return {
+        entity_id: states
+        for entity_id in entity_ids
+        if (states := cached_result.get(entity_id) or db_result.get(entity_id))
+    }
+
+
+def _get_significant_states_from_cache(
+    states_history_cache: StatesHistoryCache,
+    start_time_ts: float,
+    end_time_ts: float | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+) -> tuple[set[str], dict[str, list[State | dict[str, Any]]]]:
+    """Return significant states for the entities the history cache covers.
+
+    Returns the entity_ids that were found in the cache and their states.
+    """
+    # The cache does not know about metadata_ids so
+    # the position in entity_ids is used instead
+    entity_id_to_metadata_id: dict[str, int | None] = {}
+    rows: list[CachedStateRow] = []
+    for idx, entity_id in enumerate(entity_ids):
+        if (
+            entity_rows := states_history_cache.get_rows(
+                entity_id,
+                idx,
+                start_time_ts,
+                end_time_ts,
+                include_start_time_state,
+                significant_changes_only
+                and split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS,
+                not significant_changes_only,
+                no_attributes,
+            )
+        ) is None:
+            continue
+        entity_id_to_metadata_id[entity_id] = idx
+        rows.extend(entity_rows)
+    if not entity_id_to_metadata_id:
+        return set(), {}
+    return set(entity_id_to_metadata_id), _sorted_states_to_dict(
+        rows,  # type: ignore[arg-type]
+        start_time_ts if include_start_time_state else None,
+        list(entity_id_to_metadata_id),
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _get_significant_states_from_db(
+    instance: Recorder,
+    session: Session,
+    start_time_ts: float,
+    end_time: datetime | None,
+    end_time_ts: float | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    run_start_ts: float | None,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Query the database for significant states."""
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
-    instance = recorder.get_instance(hass)
     if not (
         entity_id_to_metadata_id := instance.states_meta_manager.get_many(
             entity_ids, session, False
@@ -246,13 +377,6 @@ def get_significant_states_with_session(
             if metadata_id is not None
             and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
         ]
-    run_start_ts: float | None = None
-    if include_start_time_state and not (
-        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
-    ):
-        include_start_time_state = False
-    start_time_ts = dt_util.utc_to_timestamp(start_time)
-    end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -550,6 +674,89 @@ def get_last_state_changes(
         )
 
 
+def _get_last_state_changes_for_metadata_ids_stmt(
+    number_of_states: int, metadata_ids: list[int], include_last_reported: bool
+) -> Select:
+    """Get the last states of multiple entities.
+
+    The states of each entity are limited in their own subquery so the
+    database only walks the most recent states of each entity in the
+    metadata_id_last_updated_ts index.
+    """
+    last_state_ids = union_all(
+        *(
+            select(
+                select(States.state_id)
+                .filter(States.metadata_id == metadata_id)
+                .order_by(States.last_updated_ts.desc())
+                .limit(number_of_states)
+                .subquery()
+                .c.state_id
+            )
+            for metadata_id in metadata_ids
+        )
+    ).subquery()
+    return (
+        _stmt_and_join_attributes(False, False, include_last_reported)
+        .join(last_state_ids, States.state_id == last_state_ids.c.state_id)
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .order_by(States.metadata_id, States.state_id)
+    )
+
+
+def get_last_state_changes_for_entities(
+    hass: HomeAssistant, number_of_states: int, entity_ids: list[str]
+) -> dict[str, list[State]]:
+    """Return the last number_of_states of multiple entities.
+
+    Entities without recorded states are not in the result.
+    """
+    has_last_reported = (
+        recorder.get_instance(hass).schema_version >= LAST_REPORTED_SCHEMA_VERSION
+    )
+    entity_ids_lower = list(
+        dict.fromkeys(entity_id.lower() for entity_id in entity_ids)
+    )
+
+    with session_scope(hass=hass, read_only=True) as session:
+        instance = recorder.get_instance(hass)
+        entity_id_to_metadata_id: dict[str, int | None] = {}
+        metadata_ids: list[int] = []
+        for entity_id, metadata_id in instance.states_meta_manager.get_many(
+            entity_ids_lower, session, False
+        ).items():
+            if metadata_id is not None:
+                entity_id_to_metadata_id[entity_id] = metadata_id
+                metadata_ids.append(metadata_id)
+        if not metadata_ids:
+            return {}
+        states: list[Row] = []
+        for idx in range(0, len(metadata_ids), LAST_STATE_CHANGES_QUERY_ENTITIES):
+            states.extend(
+                session.connection()
+                .execute(
+                    _get_last_state_changes_for_metadata_ids_stmt(
+                        number_of_states,
+                        metadata_ids[idx : idx + LAST_STATE_CHANGES_QUERY_ENTITIES],
+                        has_last_reported,
+                    )
+                )
+                .all()
+            )
+        return cast(
+            dict[str, list[State]],
+            _sorted_states_to_dict(
+                states,
+                None,
+                list(entity_id_to_metadata_id),
+                entity_id_to_metadata_id,
+                no_attributes=False,
+            ),
+        )
+
+
 def _get_start_time_state_for_entities_stmt(
     run_start_ts: float,
     epoch_time: float,
@@ -0,0 +1,195 @@
+"""In-memory cache of recent state history for the recorder."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+import threading
+from typing import NamedTuple
+
+
+class CachedStateRow(NamedTuple):
+    """A state row served from the history cache.
+
+    The fields match the columns returned by the history queries
+    so the rows can be processed by the same code as database rows.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+class _EntityHistory:
+    """Columnar history of a single entity ordered by last_updated_ts."""
+
+    __slots__ = (
+        "covered_after",
+        "last_updated_ts",
+        "last_changed_ts",
+        "states",
+        "attributes",
+    )
+
+    def __init__(self, covered_after: float = 0) -> None:
+        """Initialize an empty history."""
+        # States last updated at or before covered_after may exist in
+        # the database without being in the history
+        self.covered_after = covered_after
+        self.last_updated_ts = array("d")
+        self.last_changed_ts: list[float | None] = []
+        self.states: list[str | None] = []
+        self.attributes: list[str] = []
+
+    def trim(self, count: int) -> None:
+        """Remove the count oldest states."""
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        del self.states[:count]
+        del self.attributes[:count]
+
+
+class StatesHistoryCache:
+    """Cache the most recent states recorded for each entity.
+
+    The cache is fed by the recorder thread with the same data that is
+    written to the states table and read by the database executor when
+    history is requested. An entity is only served from the cache when
+    the cache holds its complete history for the requested period,
+    otherwise the database must be queried.
+    """
+
+    def __init__(self, max_states_per_entity: int) -> None:
+        """Initialize the cache."""
+        self._max_states_per_entity = max_states_per_entity
+        self._entities: dict[str, _EntityHistory] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        entity_id: str,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        shared_attrs: str,
+    ) -> None:
+        """Add a recorded state to the cache.
+
+        This must only be called from the recorder thread.
+        """
+        with self._lock:
+            if (history := self._entities.get(entity_id)) is None:
+                history = self._entities[entity_id] = _EntityHistory()
+            elif (
+                history.last_updated_ts
+                and last_updated_ts < (history.last_updated_ts[-1])
+            ):
+                # The clock went backwards, the states would no longer
+                # be ordered so start over with an empty history
+                history = self._entities[entity_id] = _EntityHistory(
+                    history.last_updated_ts[-1]
+                )
+            elif history.attributes and history.attributes[-1] == shared_attrs:
+                # Share the string with the previous state since
+                # attributes rarely change between states
+                shared_attrs = history.attributes[-1]
+            history.last_updated_ts.append(last_updated_ts)
+            history.last_changed_ts.append(last_changed_ts)
+            history.states.append(state)
+            history.attributes.append(shared_attrs)
+            # Trim in batches to avoid shifting the columns on every state
+            if len(history.states) >= self._max_states_per_entity * 2:
+                history.trim(len(history.states) - self._max_states_per_entity)
+
+    def get_rows(
+        self,
+        entity_id: str,
+        metadata_id: int,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        include_last_changed: bool,
+        no_attributes: bool,
+    ) -> list[CachedStateRow] | None:
+        """Return the rows the history queries would return for an entity.
+
+        Returns None if the cache does not hold the complete history of
+        the entity since start_time_ts.
+        """
+        with self._lock:
+            if (history := self._entities.get(entity_id)) is None:
+                return None
+            last_updated_ts = history.last_updated_ts
+            # The state at start_time must be known to be sure
+            # no older states are missing from the history
+            start_state_idx = bisect_left(last_updated_ts, start_time_ts) - 1
+            if (
+                start_state_idx < 0
+                or last_updated_ts[start_state_idx] <= history.covered_after
+            ):
+                return None
+            last_changed_ts = history.last_changed_ts
+            states = history.states
+            attributes = history.attributes
+            rows: list[CachedStateRow] = []
+            if include_start_time_state:
+                rows.append(
+                    CachedStateRow(
+                        metadata_id,
+                        states[start_state_idx],
+                        0,
+                        0 if include_last_changed else None,
+                        None if no_attributes else attributes[start_state_idx],
+                    )
+                )
+            end_idx = (
+                bisect_left(last_updated_ts, end_time_ts)
+                if end_time_ts
+                else len(last_updated_ts)
+            )
+            rows.extend(
+                CachedStateRow(
+                    metadata_id,
+                    states[idx],
+                    last_updated_ts[idx],
+                    last_changed_ts[idx] if include_last_changed else None,
+                    None if no_attributes else attributes[idx],
+                )
+                for idx in range(bisect_right(last_updated_ts, start_time_ts), end_idx)
+                if not significant_changes_only or last_changed_ts[idx] is None
+            )
+        return rows
+
+    def evict_before(self, purge_before_ts: float) -> None:
+        """Remove states that were last updated before purge_before_ts."""
+        with self._lock:
+            for entity_id, history in list(self._entities.items()):
+                if (
+                    count := bisect_left(history.last_updated_ts, purge_before_ts)
+                ) == len(history.last_updated_ts):
+                    del self._entities[entity_id]
+                elif count:
+                    history.trim(count)
+
+    def evict_entities(self, entity_ids: Iterable[str]) -> None:
+        """Remove the history of the given entities."""
+        with self._lock:
+            for entity_id in entity_ids:
+                self._entities.pop(entity_id, None)
+
+    def evict_matching(self, entity_filter: Callable[[str], bool]) -> None:
+        """Remove the history of the entities matching entity_filter."""
+        with self._lock:
+            for entity_id in [
+                entity_id for entity_id in self._entities if entity_filter(entity_id)
+            ]:
+                del self._entities[entity_id]
+
+    def clear(self) -> None:
+        """Remove all states from the cache."""
+        with self._lock:
+            self._entities.clear()
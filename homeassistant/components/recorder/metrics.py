@@ -0,0 +1,77 @@
+"""Metrics about the recorder's writes to the database."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds in seconds of the commit duration histogram buckets
+COMMIT_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+@dataclass(slots=True)
+class RecorderMetrics:
+    """Counters about the work done by the recorder thread.
+
+    The counters are only written by the recorder thread. Readers in
+    the event loop may see values that are one event or commit behind.
+    """
+
+    commits: int = 0
+    committed_events: int = 0
+    pending_events: int = 0
+    last_commit_events: int = 0
+    max_commit_events: int = 0
+    commit_time: float = 0
+    commit_duration_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(COMMIT_DURATION_BUCKETS) + 1)
+    )
+    state_processing_time: float = 0
+    event_processing_time: float = 0
+    purged_rows: int = 0
+    purge_time: float = 0
+    purge_slices: int = 0
+    purge_in_progress: bool = False
+    purge_remaining_seconds: float | None = None
+
+    def record_commit(self, duration: float) -> None:
+        """Record a successful commit of the pending events."""
+        events = self.pending_events
+        self.pending_events = 0
+        self.commits += 1
+        self.committed_events += events
+        self.last_commit_events = events
+        self.max_commit_events = max(self.max_commit_events, events)
+        self.commit_time += duration
+        self.commit_duration_histogram[
+            bisect_left(COMMIT_DURATION_BUCKETS, duration)
+        ] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a JSON serializable dict."""
+        commits = self.commits
+        return {
+            "commits": commits,
+            "committed_events": self.committed_events,
+            "pending_events": self.pending_events,
+            "events_per_commit": self.committed_events / commits if commits else None,
+            "last_commit_events": self.last_commit_events,
+            "max_commit_events": self.max_commit_events,
+            "commit_time": self.commit_time,
+            "average_commit_duration": self.commit_time / commits if commits else None,
+            "commit_duration_histogram": {
+                "buckets": [*COMMIT_DURATION_BUCKETS, None],
+                "counts": list(self.commit_duration_histogram),
+            },
+            "state_processing_time": self.state_processing_time,
+            "event_processing_time": self.event_processing_time,
+            "purged_rows": self.purged_rows,
+            "purge_time": self.purge_time,
+            "purged_rows_per_second": (
+                self.purged_rows / self.purge_time if self.purge_time else None
+            ),
+            "purge_slices": self.purge_slices,
+            "purge_in_progress": self.purge_in_progress,
+            "purge_remaining_seconds": self.purge_remaining_seconds,
+        }
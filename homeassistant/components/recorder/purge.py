@@ -37,6 +37,8 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event_ts,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -53,6 +55,10 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Seconds a purge run may delete batches before it returns to let the
+# recorder commit the queued events, the purge is then queued again
+PURGE_SLICE_SECONDS = 1
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -66,7 +72,12 @@ def purge_old_data(
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    Batches are deleted until PURGE_SLICE_SECONDS have passed. Since the
+    oldest rows are deleted first, the next run continues where this one
+    stopped, also after a restart.
     """
+    deadline = time.monotonic() + PURGE_SLICE_SECONDS
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -87,10 +98,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -108,6 +119,9 @@ def purge_old_data(
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
+            instance.metrics.purge_remaining_seconds = _purge_remaining_seconds(
+                session, purge_before
+            )
             return False
 
         if apply_filter and _purge_filtered_data(instance, session) is False:
@@ -128,6 +142,21 @@ def purge_old_data(
     return True
 
 
+def _purge_remaining_seconds(session: Session, purge_before: datetime) -> float:
+    """Return the seconds of states and events left to purge."""
+    oldest_timestamps = [
+        timestamp
+        for timestamp in (
+            session.execute(find_oldest_state_ts()).scalar(),
+            session.execute(find_oldest_event_ts()).scalar(),
+        )
+        if timestamp is not None
+    ]
+    if not oldest_timestamps:
+        return 0
+    return max(purge_before.timestamp() - float(min(oldest_timestamps)), 0)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -147,7 +176,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_event_ids(instance, session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -178,6 +207,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,6 +231,8 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() >= deadline:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,6 +247,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -234,8 +267,10 @@ def _purge_events_and_data_ids(
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(instance, session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() >= deadline:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -523,6 +558,7 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
 
     deleted_rows = session.execute(delete_states_rows(state_ids))
     _LOGGER.debug("Deleted %s states", deleted_rows)
+    instance.metrics.purged_rows += len(state_ids)
 
     # Evict eny entries in the old_states cache referring to a purged state
     instance.states_manager.evict_purged_state_ids(state_ids)
@@ -570,12 +606,13 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
+def _purge_event_ids(instance: Recorder, session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
         return
     deleted_rows = session.execute(delete_event_rows(event_ids))
     _LOGGER.debug("Deleted %s events", deleted_rows)
+    instance.metrics.purged_rows += len(event_ids)
 
 
 def _purge_old_recorder_runs(
@@ -705,7 +742,7 @@ def _purge_filtered_states(
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
-    _purge_event_ids(session, filtered_event_ids)
+    _purge_event_ids(instance, session, filtered_event_ids)
     unused_attribute_ids_set = _select_unused_attributes_ids(
         instance,
         session,
@@ -755,7 +792,7 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
-    _purge_event_ids(session, event_ids_set)
+    _purge_event_ids(instance, session, event_ids_set)
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, set(data_ids), database_engine
     ):
@@ -769,7 +806,11 @@ def purge_entity_data(
     entity_filter: Callable[[str], bool] | None,
     purge_before: datetime,
 ) -> bool:
-    """Purge states and events of specified entities."""
+    """Purge states and events of specified entities.
+
+    Batches are deleted until PURGE_SLICE_SECONDS have passed.
+    """
+    deadline = time.monotonic() + PURGE_SLICE_SECONDS
     database_engine = instance.database_engine
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
@@ -785,17 +826,18 @@ def purge_entity_data(
         if not selected_metadata_ids:
             return True
 
-        # Purge a max of max_bind_vars, based on the oldest states
+        # Purge batches of max_bind_vars, based on the oldest states
         # or events record.
-        if not _purge_filtered_states(
+        while not _purge_filtered_states(
             instance,
             session,
             selected_metadata_ids,
             database_engine,
             purge_before_timestamp,
         ):
-            _LOGGER.debug("Purging entity data hasn't fully completed yet")
-            return False
+            if time.monotonic() >= deadline:
+                _LOGGER.debug("Purging entity data hasn't fully completed yet")
+                return False
 
         _purge_old_entity_ids(instance, session)
 
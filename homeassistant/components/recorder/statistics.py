@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
@@ -45,6 +48,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .bulk_insert import insert_statistics
 from .const import (
     DOMAIN,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
@@ -147,6 +151,10 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_REDUCED_STATISTICS_CACHE = "recorder_reduced_statistics_cache"
+
+# Number of statistic and period combinations kept in the reduced statistics cache
+REDUCED_STATISTICS_CACHE_SIZE = 4096
 
 
 def mean(values: list[float]) -> float | None:
@@ -437,9 +445,12 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                 }
 
     # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
+    insert_statistics(
+        session,
+        [
+            Statistics.from_stats_ts(metadata_id, summary_item)
+            for metadata_id, summary_item in summary.items()
+        ],
     )
 
 
@@ -466,6 +477,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             start = max(
                 start, process_timestamp(last_run) + StatisticsShortTerm.duration
             )
+        missing_start = start
 
         periods_without_commit = 0
         while start < last_period:
@@ -481,6 +493,11 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    if missing_start < last_period:
+        get_reduced_statistics_cache(instance.hass).invalidate(
+            None, missing_start.replace(minute=0).timestamp()
+        )
+
     return True
 
 
@@ -507,6 +524,12 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    if start.minute == 55:
+        # The hourly statistics were committed
+        get_reduced_statistics_cache(instance.hass).invalidate(
+            None, start.replace(minute=0).timestamp()
+        )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -577,13 +600,20 @@ def _compile_statistics(
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
         updated_metadata_ids.add(metadata_id)
-        if new_stat := _insert_statistics(
-            session,
-            StatisticsShortTerm,
-            metadata_id,
-            stats["stat"],
-        ):
+        if new_stat := StatisticsShortTerm.from_stats(metadata_id, stats["stat"]):
             new_short_term_stats.append(new_stat)
+    # Insert the statistics of all platforms at once, which
+    # populates the ids of the new StatisticsShortTerm rows
+    try:
+        insert_statistics(session, new_short_term_stats)
+    except SQLAlchemyError:
+        _LOGGER.exception(
+            "Unexpected exception when inserting statistics for %s-%s of %s",
+            start,
+            end,
+            ", ".join(stats["meta"]["statistic_id"] for stats in platform_stats),
+        )
+        raise
 
     if start.minute == 55:
         # A full hour is ready, summarize it
@@ -599,7 +629,6 @@ def _compile_statistics(
     if updated_metadata_ids:
         # These are always the newest statistics, so we can update
         # the run cache without having to check the start_ts.
-        session.flush()  # populate the ids of the new StatisticsShortTerm rows
         run_cache = get_short_term_statistics_run_cache(instance.hass)
         # metadata_id is typed to allow None, but we know it's not None here
         # so we can safely cast it to int.
@@ -734,6 +763,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_reduced_statistics_cache(instance.hass).invalidate(statistic_ids, 0)
 
 
 def update_statistics_metadata(
@@ -759,6 +789,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+        get_reduced_statistics_cache(instance.hass).invalidate(
+            (statistic_id, new_statistic_id), 0
+        )
 
 
 async def async_list_statistic_ids(
@@ -1100,6 +1133,303 @@ def _reduce_statistics_per_month(
     )
 
 
+_REDUCE_STATISTICS: dict[
+    str,
+    Callable[
+        [
+            dict[str, list[StatisticsRow]],
+            set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+        ],
+        dict[str, list[StatisticsRow]],
+    ],
+] = {
+    "day": _reduce_statistics_per_day,
+    "week": _reduce_statistics_per_week,
+    "month": _reduce_statistics_per_month,
+}
+
+_REDUCED_TYPES: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+    "last_reset",
+    "max",
+    "mean",
+    "min",
+    "state",
+    "sum",
+}
+
+_REDUCED_VALUE_TYPES: tuple[Literal["max", "mean", "min", "state", "sum"], ...] = (
+    "max",
+    "mean",
+    "min",
+    "state",
+    "sum",
+)
+
+_start_getter = itemgetter("start")
+
+
+@dataclasses.dataclass(slots=True)
+class _ReducedStatistics:
+    """Reduced statistics of the periods from start to end."""
+
+    start: float
+    end: float
+    rows: list[StatisticsRow]
+
+
+class ReducedStatisticsCache:
+    """Cache of hourly statistics reduced to days, weeks and months.
+
+    Only periods which have ended are cached, the rows are in the unit of
+    the statistic. The cached periods of a statistic are cut back when its
+    hourly statistics are compiled, imported, adjusted or converted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._time_zone: tzinfo | None = None
+        self._period_start_end: dict[str, Callable[[float], tuple[float, float]]] = {}
+        self._reduced: LRU[tuple[str, str], _ReducedStatistics] = LRU(
+            REDUCED_STATISTICS_CACHE_SIZE
+        )
+
+    @property
+    def generation(self) -> int:
+        """Return the number of times the cache has been invalidated."""
+        return self._generation
+
+    def _check_time_zone(self) -> None:
+        """Drop the cache if the time zone the periods are local to changed."""
+        if (time_zone := dt_util.get_default_time_zone()) is self._time_zone:
+            return
+        self._time_zone = time_zone
+        self._generation += 1
+        self._reduced.clear()
+        self._period_start_end = {
+            "day": reduce_day_ts_factory()[1],
+            "week": reduce_week_ts_factory()[1],
+            "month": reduce_month_ts_factory()[1],
+        }
+
+    def period_start(self, period: str, timestamp: float) -> float:
+        """Return the start of the period timestamp is within."""
+        with self._lock:
+            self._check_time_zone()
+            return self._period_start_end[period](timestamp)[0]
+
+    def get(
+        self, period: str, statistic_id: str, start_ts: float, end_ts: float | None
+    ) -> tuple[float, list[StatisticsRow]] | None:
+        """Return the end of the cached periods from start_ts and their rows.
+
+        A period which has not ended before end_ts is not returned.
+        """
+        with self._lock:
+            self._check_time_zone()
+            if (
+                reduced := self._reduced.get((period, statistic_id))
+            ) is None or not reduced.start <= start_ts < reduced.end:
+                return None
+            cached_end = reduced.end
+            if end_ts is not None:
+                cached_end = min(cached_end, self._period_start_end[period](end_ts)[0])
+            rows = reduced.rows
+            return cached_end, rows[
+                bisect_left(rows, start_ts, key=_start_getter) : bisect_left(
+                    rows, cached_end, key=_start_getter
+                )
+            ]
+
+    def set(
+        self,
+        generation: int,
+        period: str,
+        statistic_id: str,
+        start_ts: float,
+        end_ts: float,
+        rows: list[StatisticsRow],
+    ) -> None:
+        """Cache the rows of the periods from start_ts to end_ts."""
+        with self._lock:
+            if generation != self._generation:
+                # The hourly statistics changed while they were reduced
+                return
+            key = (period, statistic_id)
+            if (
+                (reduced := self._reduced.get(key)) is not None
+                and reduced.start <= end_ts
+                and start_ts <= reduced.end
+            ):
+                cached = reduced.rows
+                rows = [
+                    *cached[: bisect_left(cached, start_ts, key=_start_getter)],
+                    *rows,
+                    *cached[bisect_left(cached, end_ts, key=_start_getter) :],
+                ]
+                start_ts = min(start_ts, reduced.start)
+                end_ts = max(end_ts, reduced.end)
+            self._reduced[key] = _ReducedStatistics(start_ts, end_ts, rows)
+
+    def invalidate(self, statistic_ids: Iterable[str] | None, start_ts: float) -> None:
+        """Forget the periods ending after start_ts.
+
+        This must be called after the changed hourly statistics
+        are committed to the database.
+        """
+        with self._lock:
+            self._check_time_zone()
+            self._generation += 1
+            if statistic_ids is not None:
+                statistic_ids = set(statistic_ids)
+            for key, reduced in self._reduced.items():
+                period, statistic_id = key
+                if reduced.end <= start_ts or (
+                    statistic_ids is not None and statistic_id not in statistic_ids
+                ):
+                    continue
+                end = self._period_start_end[period](start_ts)[0]
+                if end <= reduced.start:
+                    del self._reduced[key]
+                    continue
+                reduced.end = end
+                reduced.rows = reduced.rows[
+                    : bisect_left(reduced.rows, end, key=_start_getter)
+                ]
+
+
+@singleton(DATA_REDUCED_STATISTICS_CACHE)
+def get_reduced_statistics_cache(hass: HomeAssistant) -> ReducedStatisticsCache:
+    """Get the reduced statistics cache."""
+    return ReducedStatisticsCache()
+
+
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: str,
+) -> dict[str, list[StatisticsRow]]:
+    """Return hourly statistics reduced to days, weeks or months.
+
+    The rows are in the unit of the statistic and have all types. Only the
+    hourly statistics after the cached periods are read from the database.
+    """
+    cache = get_reduced_statistics_cache(hass)
+    generation = cache.generation
+    start_ts = start_time.timestamp()
+    end_ts = end_time.timestamp() if end_time is not None else None
+    # The first period is reduced from part of its hourly statistics if
+    # start_time is not the start of a period, such queries are not cached
+    use_cache = cache.period_start(period, start_ts) == start_ts
+    cached: dict[str, list[StatisticsRow]] = {}
+    fetch_start_ts: float | None = None
+    for statistic_id in metadata:
+        cached_end_ts = start_ts
+        if use_cache and (hit := cache.get(period, statistic_id, start_ts, end_ts)):
+            cached_end_ts, cached[statistic_id] = hit
+        if end_ts is None or cached_end_ts < end_ts:
+            fetch_start_ts = (
+                cached_end_ts
+                if fetch_start_ts is None
+                else min(fetch_start_ts, cached_end_ts)
+            )
+
+    fetched: dict[str, list[StatisticsRow]] = {}
+    if fetch_start_ts is not None:
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(fetch_start_ts),
+            end_time,
+            [metadata_id for metadata_id, _ in metadata.values()],
+            Statistics,
+            _REDUCED_TYPES,
+        )
+        if stats := cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        ):
+            fetched = _REDUCE_STATISTICS[period](
+                _sorted_statistics_to_dict(
+                    hass,
+                    stats,
+                    None,
+                    metadata,
+                    False,
+                    Statistics,
+                    None,
+                    _REDUCED_TYPES,
+                ),
+                _REDUCED_TYPES,
+            )
+        # Cache the periods which have ended before now and end_time,
+        # including those without statistics
+        cache_end_ts = dt_util.utcnow().timestamp()
+        if end_ts is not None:
+            cache_end_ts = min(cache_end_ts, end_ts)
+        cache_end_ts = cache.period_start(period, cache_end_ts)
+        if use_cache and cache_end_ts > fetch_start_ts:
+            for statistic_id in metadata:
+                rows = fetched.get(statistic_id, [])
+                cache.set(
+                    generation,
+                    period,
+                    statistic_id,
+                    fetch_start_ts,
+                    cache_end_ts,
+                    rows[: bisect_left(rows, cache_end_ts, key=_start_getter)],
+                )
+
+    result: dict[str, list[StatisticsRow]] = {}
+    for statistic_id in statistic_ids:
+        rows = cached.get(statistic_id, [])
+        if fetch_start_ts is not None:
+            rows = [
+                *rows[: bisect_left(rows, fetch_start_ts, key=_start_getter)],
+                *fetched.get(statistic_id, []),
+            ]
+        if rows:
+            result[statistic_id] = rows
+    return result
+
+
+def _convert_reduced_statistics(
+    hass: HomeAssistant,
+    reduced: dict[str, list[StatisticsRow]],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Convert reduced statistics to the display unit and keep the wanted types."""
+    result: dict[str, list[StatisticsRow]] = {}
+    want_last_reset = "last_reset" in types
+    value_types = [
+        stat_type for stat_type in _REDUCED_VALUE_TYPES if stat_type in types
+    ]
+    for statistic_id, rows in reduced.items():
+        state_unit = unit = metadata[statistic_id][1]["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert = _get_statistic_to_display_unit_converter(
+            unit, state_unit, units, allow_none=False
+        )
+        converted: list[StatisticsRow] = []
+        for row in rows:
+            new_row: StatisticsRow = {"start": row["start"], "end": row["end"]}
+            if want_last_reset:
+                new_row["last_reset"] = row["last_reset"]
+            for stat_type in value_types:
+                value = row[stat_type]
+                if convert is not None and value is not None:
+                    value = convert(value)
+                new_row[stat_type] = value
+            converted.append(new_row)
+        result[statistic_id] = converted
+    return result
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1755,35 +2085,39 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+    if statistic_ids is not None and period in _REDUCE_STATISTICS:
+        # Periods which have ended are reduced once and then served from the cache
+        if not (
+            reduced := _reduced_statistics_during_period(
+                hass, session, start_time, end_time, statistic_ids, metadata, period
+            )
+        ):
+            return {}
+        result = _convert_reduced_statistics(hass, reduced, metadata, units, types)
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if not stats:
+            return {}
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period in _REDUCE_STATISTICS:
+            result = _REDUCE_STATISTICS[period](result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2445,10 +2779,17 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+
+    if table is Statistics and (
+        start := min((stat["start"] for stat in statistics), default=None)
+    ):
+        get_reduced_statistics_cache(instance.hass).invalidate(
+            (metadata["statistic_id"],), start.timestamp()
         )
 
+    return True
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2489,6 +2830,10 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_reduced_statistics_cache(instance.hass).invalidate(
+        (statistic_id,), start_time.replace(minute=0).timestamp()
+    )
+
     return True
 
 
@@ -2557,6 +2902,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    get_reduced_statistics_cache(instance.hass).invalidate((statistic_id,), 0)
+
 
 @callback
 def async_change_statistics_unit(
@@ -66,6 +66,10 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         super().__init__(recorder)
         self._id_map = LRU(lru_size)
 
+    def get_cache_stats(self) -> tuple[int, int]:
+        """Return the number of cache hits and misses since the last reset."""
+        return self._id_map.get_stats()
+
     def adjust_lru_size(self, new_size: int) -> None:
         """Adjust the LRU cache size.
 
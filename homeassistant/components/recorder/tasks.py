@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
@@ -94,6 +95,10 @@ class UpdateStatesMetadataTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        if instance.states_history_cache is not None:
+            instance.states_history_cache.evict_entities(
+                (self.entity_id, self.new_entity_id)
+            )
         entity_registry.update_states_metadata(
             instance,
             self.entity_id,
@@ -111,9 +116,18 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        if instance.states_history_cache is not None:
+            instance.states_history_cache.evict_before(self.purge_before.timestamp())
+        start = time.monotonic()
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        metrics = instance.metrics
+        metrics.purge_time += time.monotonic() - start
+        metrics.purge_slices += 1
+        metrics.purge_in_progress = not finished
+        if finished:
+            metrics.purge_remaining_seconds = None
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -136,7 +150,17 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
-        if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
+        if instance.states_history_cache is not None:
+            instance.states_history_cache.evict_matching(self.entity_filter)
+        start = time.monotonic()
+        finished = purge.purge_entity_data(
+            instance, self.entity_filter, self.purge_before
+        )
+        metrics = instance.metrics
+        metrics.purge_time += time.monotonic() - start
+        metrics.purge_slices += 1
+        metrics.purge_in_progress = not finished
+        if finished:
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(PurgeEntitiesTask(self.entity_filter, self.purge_before))
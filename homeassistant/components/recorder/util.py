@@ -213,7 +213,9 @@ def execute_stmt_lambda_element(
 
     If the time window passed is greater than one day
     the execution method will switch to yield_per to
-    reduce memory pressure.
+    reduce memory pressure. The rows are then fetched
+    with a server side cursor where the database
+    supports it.
 
     It is not recommended to pass a time window
     when selecting non-ranged rows (ie selecting
@@ -223,13 +225,15 @@ def execute_stmt_lambda_element(
     use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
     for tryno in range(RETRIES):
         try:
-            if orm_rows:
-                executed = session.execute(stmt)
-            else:
-                executed = session.connection().execute(stmt)
             if use_all:
-                return executed.all()
-            return executed.yield_per(yield_per)
+                if orm_rows:
+                    return session.execute(stmt).all()
+                return session.connection().execute(stmt).all()
+            if orm_rows:
+                return session.execute(stmt, execution_options={"yield_per": yield_per})
+            return session.connection().execute(
+                stmt, execution_options={"yield_per": yield_per}
+            )
         except SQLAlchemyError as err:
             _LOGGER.error("Error executing query: %s", err)
             if tryno == RETRIES - 1:
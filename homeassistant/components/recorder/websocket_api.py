@@ -79,6 +79,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_metrics)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
 
@@ -512,3 +513,29 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/metrics",
+    }
+)
+@callback
+def ws_metrics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return metrics about the recorder's writes."""
+    instance = get_instance(hass)
+    hits, misses = instance.state_attributes_manager.get_cache_stats()
+    connection.send_result(
+        msg["id"],
+        instance.metrics.as_dict()
+        | {
+            "backlog": instance.backlog,
+            "state_attributes_cache_hits": hits,
+            "state_attributes_cache_misses": misses,
+            "state_attributes_cache_hit_rate": (
+                hits / (hits + misses) if hits or misses else None
+            ),
+        },
+    )
@@ -193,6 +193,7 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     """Base class for sensor entities."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_OPTIONS})
+    _entity_component_state_only_properties = frozenset({"native_value"})
 
     entity_description: SensorEntityDescription
     _attr_device_class: SensorDeviceClass | None
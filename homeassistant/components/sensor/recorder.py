@@ -5,7 +5,6 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 import datetime
-import itertools
 import logging
 import math
 from typing import Any
@@ -94,39 +93,30 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[float],
+    last_updated: list[datetime.datetime],
+    start: datetime.datetime,
+    end: datetime.datetime,
 ) -> float:
     """Calculate a time weighted average.
 
-    The average is calculated by weighting the states by duration in seconds between
+    The average is calculated by weighting the values by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = [start if updated < start else updated for updated in last_updated]
+    # Adjust start time, if there was no last known state
+    start = start_times[0]
     accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+    # Accumulate the values, weighted by duration until the next state
+    # change or the end of the period. The values are added one by one
+    # as sum() compensates the rounding errors and would change the result.
+    for value, period_start, period_end in zip(
+        values, start_times, [*start_times[1:], end], strict=True
+    ):
+        accumulated += value * (period_end - period_start).total_seconds()
 
     period_seconds = (end - start).total_seconds()
     if period_seconds == 0:
@@ -509,19 +499,21 @@ def compile_statistics(  # noqa: C901
             "unit_of_measurement": statistics_unit,
         }
 
-        # Make calculations
+        # Make calculations on the values of the states
         stat: StatisticData = {"start": start}
+        values = [fstate for fstate, _ in valid_float_states]
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["max"] = max(values)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["min"] = min(values)
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = _time_weighted_average(
+                values,
+                [state.last_updated for _, state in valid_float_states],
+                start,
+                end,
+            )
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
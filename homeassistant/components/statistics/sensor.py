@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -54,6 +52,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .window import SampleWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,6 +179,21 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics which need the minimum and maximum of the samples
+STATS_EXTREMES = {
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+
+# Statistics which need the samples ordered by value
+STATS_ORDER = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -317,8 +331,13 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._window = SampleWindow(
+            self._samples_max_buffer_size,
+            track_extremes=state_characteristic in STATS_EXTREMES,
+            track_order=state_characteristic in STATS_ORDER,
+        )
+        self.states = self._window.states
+        self.ages = self._window.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
@@ -370,12 +389,13 @@ class StatisticsSensor(SensorEntity):
             return
 
         try:
+            value: float | bool
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self._window.append(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -499,8 +519,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._window.popleft()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -654,27 +673,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._window.linear_area / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._window.step_area / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -712,12 +718,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self.ages[self._window.max_index()]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self.ages[self._window.min_index()]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -732,24 +738,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._window.value_max() - self._window.value_min()
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._window.mean()
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
-            return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+            return (
+                math.degrees(math.atan2(self._window.sin_sum, self._window.cos_sum))
+                + 360
+            ) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._window.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -759,34 +766,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self._window.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self._window.variance())
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._window.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._window.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._window.sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -794,29 +794,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._window.value_max()
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._window.value_min()
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._window.variance()
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+            return 100 / age_range_seconds * self._window.step_area
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
@@ -826,10 +822,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return int(self._window.sum)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - int(self._window.sum)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -839,5 +835,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._window.sum
         return None
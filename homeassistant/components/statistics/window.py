@@ -0,0 +1,223 @@
+"""Sliding window of samples with incrementally updated aggregates."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class SampleWindow:
+    """Samples of the source sensor ordered by age.
+
+    The aggregates used by the statistical characteristics are updated
+    when a sample is added to or removed from the window instead of being
+    computed over all samples on every update.
+
+    Running sums are recomputed from the samples once as many samples have
+    been removed as the window holds to keep the rounding errors from
+    accumulating, which keeps the cost per sample constant on average.
+    """
+
+    def __init__(
+        self,
+        maxlen: int | None,
+        track_extremes: bool = False,
+        track_order: bool = False,
+    ) -> None:
+        """Initialize the window.
+
+        The minimum and maximum are only tracked when track_extremes is set
+        and the samples are only kept sorted when track_order is set.
+        """
+        self._maxlen = maxlen
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._timestamps: deque[float] = deque()
+        # Sequence number of the oldest sample
+        self._first_seq = 0
+        self._removals = 0
+        self._max: deque[tuple[int, float | bool]] | None = (
+            deque() if track_extremes else None
+        )
+        self._min: deque[tuple[int, float | bool]] | None = (
+            deque() if track_extremes else None
+        )
+        self._sorted: list[float | bool] | None = [] if track_order else None
+        self._reset_sums()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self.sum: float = 0
+        self._mean: float = 0
+        self._m2: float = 0
+        self.sin_sum: float = 0
+        self.cos_sum: float = 0
+        self.sum_differences: float = 0
+        self.sum_differences_nonnegative: float = 0
+        self.step_area: float = 0
+        self.linear_area: float = 0
+
+    def _recompute_sums(self) -> None:
+        """Recompute the running sums from the samples."""
+        self._reset_sums()
+        self._removals = 0
+        states = self.states
+        timestamps = self._timestamps
+        for idx, value in enumerate(states):
+            self._add_to_sums(value, idx + 1, states[idx - 1] if idx else None)
+            if idx:
+                self._add_to_areas(
+                    states[idx - 1], value, timestamps[idx] - timestamps[idx - 1]
+                )
+
+    def _add_to_sums(self, value: float, count: int, previous: float | None) -> None:
+        """Add a sample to the sums not depending on its age."""
+        self.sum += value
+        delta = value - self._mean
+        self._mean += delta / count
+        self._m2 += delta * (value - self._mean)
+        if math.isfinite(value):
+            radians = math.radians(value)
+            self.sin_sum += math.sin(radians)
+            self.cos_sum += math.cos(radians)
+        else:
+            self.sin_sum = self.cos_sum = math.nan
+        if previous is not None:
+            self.sum_differences += abs(value - previous)
+            self.sum_differences_nonnegative += (
+                value - previous if value >= previous else value
+            )
+
+    def _add_to_areas(self, previous: float, value: float, seconds: float) -> None:
+        """Add the area between two consecutive samples."""
+        self.step_area += previous * seconds
+        self.linear_area += 0.5 * (value + previous) * seconds
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add the newest sample, removing the oldest if the window is full."""
+        if self._maxlen is not None and len(self.states) >= self._maxlen:
+            self.popleft()
+        timestamp = age.timestamp()
+        if self.states:
+            previous = self.states[-1]
+            self._add_to_sums(value, len(self.states) + 1, previous)
+            self._add_to_areas(previous, value, timestamp - self._timestamps[-1])
+        else:
+            self._add_to_sums(value, 1, None)
+        seq = self._first_seq + len(self.states)
+        self.states.append(value)
+        self.ages.append(age)
+        self._timestamps.append(timestamp)
+        if self._max is not None and self._min is not None:
+            # Keep the oldest of equal values so the oldest extreme comes first
+            while self._max and self._max[-1][1] < value:
+                self._max.pop()
+            self._max.append((seq, value))
+            while self._min and self._min[-1][1] > value:
+                self._min.pop()
+            self._min.append((seq, value))
+        if self._sorted is not None:
+            insort(self._sorted, value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        self.ages.popleft()
+        timestamp = self._timestamps.popleft()
+        seq = self._first_seq
+        self._first_seq += 1
+        if self._max is not None and self._min is not None:
+            if self._max[0][0] == seq:
+                self._max.popleft()
+            if self._min[0][0] == seq:
+                self._min.popleft()
+        if self._sorted is not None:
+            idx = bisect_left(self._sorted, value)
+            if idx < len(self._sorted) and self._sorted[idx] == value:
+                del self._sorted[idx]
+            else:
+                # Values which can't be ordered such as NaN
+                self._sorted.remove(value)
+
+        self._removals += 1
+        if (
+            not self.states
+            or self._removals >= len(self.states)
+            or not math.isfinite(value)
+        ):
+            self._recompute_sums()
+            return
+        count = len(self.states)
+        self.sum -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 -= delta * (value - self._mean)
+        radians = math.radians(value)
+        self.sin_sum -= math.sin(radians)
+        self.cos_sum -= math.cos(radians)
+        following = self.states[0]
+        self.sum_differences -= abs(following - value)
+        self.sum_differences_nonnegative -= (
+            following - value if following >= value else following
+        )
+        seconds = self._timestamps[0] - timestamp
+        self.step_area -= value * seconds
+        self.linear_area -= 0.5 * (following + value) * seconds
+
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        return self.sum / len(self.states)
+
+    def variance(self) -> float:
+        """Return the sample variance, there must be at least two samples."""
+        return max(self._m2, 0) / (len(self.states) - 1)
+
+    def max_index(self) -> int:
+        """Return the index of the oldest sample with the maximum value."""
+        assert self._max is not None
+        return self._max[0][0] - self._first_seq
+
+    def min_index(self) -> int:
+        """Return the index of the oldest sample with the minimum value."""
+        assert self._min is not None
+        return self._min[0][0] - self._first_seq
+
+    def value_max(self) -> float | bool:
+        """Return the maximum value."""
+        assert self._max is not None
+        return self._max[0][1]
+
+    def value_min(self) -> float | bool:
+        """Return the minimum value."""
+        assert self._min is not None
+        return self._min[0][1]
+
+    def median(self) -> float:
+        """Return the median of the samples, like statistics.median."""
+        assert self._sorted is not None
+        data = self._sorted
+        count = len(data)
+        if count % 2 == 1:
+            return data[count // 2]
+        idx = count // 2
+        return (data[idx - 1] + data[idx]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of at least two samples.
+
+        This is the same value statistics.quantiles returns with n=100
+        and the exclusive method.
+        """
+        assert self._sorted is not None
+        data = self._sorted
+        count = len(data)
+        scaled = percentile * (count + 1)
+        idx = min(max(scaled // 100, 1), count - 1)
+        delta = scaled - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
@@ -20,11 +20,13 @@ from homeassistant.helpers import (
     integration_platform,
 )
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import bind_hass
+from homeassistant.loader import LazyPlatform, bind_hass
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "system_health"
+DATA_PLATFORMS: HassKey[dict[str, LazyPlatform]] = HassKey(f"{DOMAIN}_platforms")
 
 INFO_CALLBACK_TIMEOUT = 5
 
@@ -63,9 +65,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the System Health component."""
     websocket_api.async_register_command(hass, handle_info)
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DATA_PLATFORMS] = {}
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_system_health_platform
+        hass, DOMAIN, _register_system_health_platform, lazy=True
     )
 
     return True
@@ -73,10 +76,37 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 @callback
 def _register_system_health_platform(
-    hass: HomeAssistant, integration_domain: str, platform: SystemHealthProtocol
+    hass: HomeAssistant, integration_domain: str, platform: LazyPlatform
 ) -> None:
-    """Register a system health platform."""
-    platform.async_register(hass, SystemHealthRegistration(hass, integration_domain))
+    """Register a system health platform to be imported when info is requested."""
+    hass.data[DATA_PLATFORMS][integration_domain] = platform
+
+
+async def async_register_platforms(hass: HomeAssistant) -> None:
+    """Import the system health platforms and register their callbacks."""
+    if not (platforms := hass.data.get(DATA_PLATFORMS)):
+        return
+    domains = list(platforms)
+    results = await asyncio.gather(
+        *(platforms[domain].async_load() for domain in domains),
+        return_exceptions=True,
+    )
+    for domain, result in zip(domains, results, strict=True):
+        # A concurrent call may have registered the platform already
+        if platforms.pop(domain, None) is None:
+            continue
+        if isinstance(result, BaseException):
+            _LOGGER.error(
+                "Error importing system health platform of %s",
+                domain,
+                exc_info=(type(result), result, result.__traceback__),
+            )
+            continue
+        platform: SystemHealthProtocol = result
+        try:
+            platform.async_register(hass, SystemHealthRegistration(hass, domain))
+        except Exception:
+            _LOGGER.exception("Error registering system health platform of %s", domain)
 
 
 async def get_integration_info(
@@ -115,6 +145,7 @@ async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle an info request via a subscription."""
+    await async_register_platforms(hass)
     registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
     data = {}
     pending_info: dict[tuple[str, str], asyncio.Task] = {}
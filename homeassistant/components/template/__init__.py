@@ -11,6 +11,7 @@ from homeassistant.const import CONF_UNIQUE_ID, SERVICE_RELOAD
 from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import discovery
+from homeassistant.helpers.event import async_get_template_render_cache
 from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.service import async_register_admin_service
 from homeassistant.helpers.typing import ConfigType
@@ -43,6 +44,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if conf is None:
             return
 
+        # Drop the renders of the templates which are reloaded
+        async_get_template_render_cache(hass).async_clear()
         await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
 
         if DOMAIN in conf:
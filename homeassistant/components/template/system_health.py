@@ -0,0 +1,29 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_get_template_render_cache
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    stats = async_get_template_render_cache(hass).get_stats()
+    hit_rate = stats["hit_rate"]
+    return {
+        "render_cache_hits": stats["hits"],
+        "render_cache_misses": stats["misses"],
+        "render_cache_hit_rate": None if hit_rate is None else f"{hit_rate:.1%}",
+        "render_cache_size": stats["size"],
+    }
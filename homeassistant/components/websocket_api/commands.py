@@ -60,6 +60,7 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import async_get_entity_subscriptions
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -363,30 +364,6 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
@@ -404,15 +381,10 @@ def handle_subscribe_entities(
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg["id"]] = async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(
+        connection.send_state_diff, connection.user, message_id_as_bytes, entity_ids
     )
     connection.send_result(msg["id"])
 
@@ -10,7 +10,13 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
@@ -37,6 +43,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_state_diff",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -59,6 +66,11 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # The websocket handler replaces this to merge the
+        # state diffs for clients which fall behind
+        self.send_state_diff: Callable[[bytes, Event[EventStateChangedData]], None] = (
+            self._send_state_diff
+        )
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -80,6 +92,15 @@ class ActiveConnection:
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
 
+    @callback
+    def _send_state_diff(
+        self, message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    ) -> None:
+        """Send a subscribe_entities state diff."""
+        self.send_message(
+            messages.cached_state_diff_message(message_id_as_bytes, event)
+        )
+
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
         description = self.user.name or ""
@@ -34,6 +34,10 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which the subscribe_entities state
+# diffs of an entity are merged until they are written to the client.
+PENDING_MSG_MERGE_STATE_DIFFS: Final = 512
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
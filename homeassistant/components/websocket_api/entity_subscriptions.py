@@ -0,0 +1,136 @@
+"""Forward state changes to the subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptions] = HassKey(
+    f"{DOMAIN}.entity_subscriptions"
+)
+
+
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("message_id_as_bytes", "send_state_diff", "user")
+
+    def __init__(
+        self,
+        send_state_diff: Callable[[bytes, Event[EventStateChangedData]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_state_diff = send_state_diff
+        self.user = user
+        self.message_id_as_bytes = message_id_as_bytes
+
+
+class EntitySubscriptions:
+    """Forward state changes to the subscribe_entities subscriptions.
+
+    A single state_changed listener serves the subscriptions of all
+    connections. Subscriptions to specific entities are indexed by
+    entity_id so a state change only visits the subscriptions it is
+    forwarded to, and the permissions of a user are checked once per
+    state change no matter how many connections the user has.
+    """
+
+    __slots__ = ("_all", "_by_entity_id", "_hass", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._all: set[_EntitySubscription] = set()
+        self._by_entity_id: dict[str, set[_EntitySubscription]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        send_state_diff: Callable[[bytes, Event[EventStateChangedData]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+        entity_ids: set[str],
+    ) -> CALLBACK_TYPE:
+        """Subscribe to changes of entity_ids, or all entities if empty."""
+        subscription = _EntitySubscription(send_state_diff, user, message_id_as_bytes)
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, set()).add(subscription)
+        else:
+            self._all.add(subscription)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        return partial(self._async_unsubscribe, subscription, entity_ids)
+
+    @callback
+    def _async_unsubscribe(
+        self, subscription: _EntitySubscription, entity_ids: set[str]
+    ) -> None:
+        """Remove a subscription."""
+        if entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                subscriptions = by_entity_id[entity_id]
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del by_entity_id[entity_id]
+        else:
+            self._all.discard(subscription)
+        if not self._all and not self._by_entity_id and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward an entity state changed event to the subscriptions."""
+        entity_id = event.data["entity_id"]
+        # Copy the subscriptions since sending a message can close
+        # a connection, which removes its subscriptions
+        subscriptions = [*self._all]
+        if entity_subscriptions := self._by_entity_id.get(entity_id):
+            subscriptions.extend(entity_subscriptions)
+        allowed_by_user_id: dict[str, bool] = {}
+        for subscription in subscriptions:
+            user = subscription.user
+            if (allowed := allowed_by_user_id.get(user.id)) is None:
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                permissions = user.permissions
+                allowed = allowed_by_user_id[user.id] = (
+                    user.is_admin
+                    or permissions.access_all_entities(POLICY_READ)
+                    or permissions.check_entity(entity_id, POLICY_READ)
+                )
+            if allowed:
+                subscription.send_state_diff(subscription.message_id_as_bytes, event)
+
+
+@callback
+def async_get_entity_subscriptions(hass: HomeAssistant) -> EntitySubscriptions:
+    """Return the subscribe_entities subscriptions."""
+    if (entity_subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        entity_subscriptions = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = (
+            EntitySubscriptions(hass)
+        )
+    return entity_subscriptions
@@ -8,13 +8,13 @@ from collections.abc import Callable, Coroutine
 import datetime as dt
 from functools import partial
 import logging
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from aiohttp import WSMsgType, web
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
@@ -25,6 +25,7 @@ from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
+    PENDING_MSG_MERGE_STATE_DIFFS,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -32,7 +33,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import PendingStateDiff, cached_state_diff_message, message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -79,6 +80,7 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_pending_state_diffs",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -101,7 +103,9 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | PendingStateDiff] = deque()
+        # Merged state diffs in the queue by subscription and entity_id
+        self._pending_state_diffs: dict[tuple[bytes, str], PendingStateDiff] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
 
@@ -152,13 +156,30 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if isinstance(message, PendingStateDiff):
+                        if (
+                            serialized := self._pending_state_diff_message(message)
+                        ) is None:
+                            continue
+                        message = serialized
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
+                if self._pending_state_diffs:
+                    queued_messages = self._pending_state_diff_messages()
+                    message_queue.clear()
+                    if not queued_messages:
+                        continue
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(queued_messages), b"]")
+                    )
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(cast(deque[bytes], message_queue)), b"]")
+                    )
+                    message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
@@ -172,6 +193,21 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _pending_state_diff_message(self, pending: PendingStateDiff) -> bytes | None:
+        """Stop merging into a pending state diff and serialize it."""
+        del self._pending_state_diffs[(pending.message_id_as_bytes, pending.entity_id)]
+        return pending.as_message()
+
+    def _pending_state_diff_messages(self) -> list[bytes]:
+        """Return the queued messages with the pending state diffs serialized."""
+        messages: list[bytes] = []
+        for message in self._message_queue:
+            if not isinstance(message, PendingStateDiff):
+                messages.append(message)
+            elif (serialized := self._pending_state_diff_message(message)) is not None:
+                messages.append(serialized)
+        return messages
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -180,7 +216,32 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_state_diff(
+        self, message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    ) -> None:
+        """Queue a subscribe_entities state diff.
+
+        Once the client falls behind, the state diffs of an entity are
+        merged until they are written, so the client ends up with the
+        latest state without the queue growing with every change.
+        """
+        data = event.data
+        key = (message_id_as_bytes, data["entity_id"])
+        if (pending := self._pending_state_diffs.get(key)) is not None:
+            pending.new_state = data["new_state"]
+            return
+        if self._closing or len(self._message_queue) < PENDING_MSG_MERGE_STATE_DIFFS:
+            self._send_message(cached_state_diff_message(message_id_as_bytes, event))
+            return
+        pending = self._pending_state_diffs[key] = PendingStateDiff(
+            message_id_as_bytes, data["entity_id"], data["old_state"], data["new_state"]
+        )
+        self._send_message(pending)
+
+    @callback
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | PendingStateDiff
+    ) -> None:
         """Queue sending a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -360,6 +421,7 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
+            connection.send_state_diff = self._send_state_diff
             self._writer_task = create_eager_task(self._writer(send_bytes_text))
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -177,6 +177,49 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+class PendingStateDiff:
+    """State changes of an entity merged into one diff.
+
+    Used to merge the state diffs for a client which falls behind
+    until the diff is written to it.
+    """
+
+    __slots__ = ("entity_id", "message_id_as_bytes", "new_state", "old_state")
+
+    def __init__(
+        self,
+        message_id_as_bytes: bytes,
+        entity_id: str,
+        old_state: State | None,
+        new_state: State | None,
+    ) -> None:
+        """Initialize the diff from the state the client has."""
+        self.message_id_as_bytes = message_id_as_bytes
+        self.entity_id = entity_id
+        self.old_state = old_state
+        self.new_state = new_state
+
+    def as_message(self) -> bytes | None:
+        """Serialize the diff, None if the client does not need it."""
+        if self.old_state is None and self.new_state is None:
+            # The entity was added and removed again
+            return None
+        partial_message = (
+            _message_to_json_bytes_or_none(
+                {
+                    "type": "event",
+                    "event": _state_diff(
+                        self.entity_id, self.old_state, self.new_state
+                    ),
+                }
+            )
+            or INVALID_JSON_PARTIAL_MESSAGE
+        )
+        return b"".join(
+            (partial_message[:-1], b',"id":', self.message_id_as_bytes, b"}")
+        )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -195,9 +238,22 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
+    data = event.data
+    return _state_diff(data["entity_id"], data["old_state"], data["new_state"])
+
+
+def _state_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Return the minimal diff from old_state to new_state."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
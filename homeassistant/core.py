@@ -37,6 +37,7 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -1385,6 +1386,11 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+# Maps a key getter to the buckets of jobs listening for each key
+_KeyedListenersType = dict[
+    Callable[[Any], str | None], dict[str, list[_FilterableJobType[Any]]]
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1424,13 +1430,20 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._keyed_listeners: dict[EventType[Any] | str, _KeyedListenersType] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1446,9 +1459,15 @@ class EventBus:
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
 
+        Each key getter registered with async_listen_keyed is counted
+        as a single listener for its event type.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(jobs) for key, jobs in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(keyed_listeners)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1514,6 +1533,10 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            listeners = listeners + self._async_keyed_jobs(keyed_listeners, event_data)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1543,6 +1566,30 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_keyed_jobs(
+        self, keyed_listeners: _KeyedListenersType, event_data: Any
+    ) -> list[_FilterableJobType[Any]]:
+        """Return the keyed jobs that match the event data.
+
+        Keyed jobs never have an event filter since the bucket
+        lookup already selected them.
+        """
+        jobs: list[_FilterableJobType[Any]] = []
+        for key_getter, buckets in keyed_listeners.items():
+            try:
+                key = key_getter(event_data)
+            except Exception:
+                _LOGGER.exception("Error in event key getter")
+                continue
+            if key is None:
+                continue
+            if bucket := buckets.get(key):
+                jobs.extend(bucket)
+            if key != MATCH_ALL and (bucket := buckets.get(MATCH_ALL)):
+                jobs.extend(bucket)
+        return jobs
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1637,6 +1684,92 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_getter: Callable[[_DataT], str | None],
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type indexed by key.
+
+        The key_getter, which must be a callable decorated with @callback,
+        extracts the key from the event data or returns None if the event
+        should not be dispatched to any keyed listener. The listener will
+        only be called for events where the key is one of the passed keys.
+        Listening to the ``MATCH_ALL`` key receives all events where the
+        key_getter returns a key.
+
+        Listeners are stored in buckets per key, so the cost of firing an
+        event grows with the number of matching listeners instead of the
+        number of registered listeners. The key_getter should be a module
+        level function, as listeners sharing the same key_getter share
+        the same index.
+
+        This method must be run in the event loop.
+        """
+        if not is_callback_check_partial(key_getter):
+            raise HomeAssistantError(f"Key getter {key_getter} is not a callback")
+        if isinstance(keys, str):
+            keys = (keys,)
+        else:
+            keys = tuple(keys)
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen keyed {event_type} {keys}", job_type=job_type),
+            None,
+        )
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is None:
+            keyed_listeners = self._keyed_listeners[event_type] = {}
+        if (buckets := keyed_listeners.get(key_getter)) is None:
+            buckets = keyed_listeners[key_getter] = {}
+        for key in keys:
+            if (bucket := buckets.get(key)) is None:
+                buckets[key] = [filterable_job]
+            else:
+                bucket.append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            key_getter,
+            keys,
+            filterable_job,
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_getter: Callable[[_DataT], str | None],
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            buckets = keyed_listeners[key_getter]
+            for key in keys:
+                bucket = buckets[key]
+                bucket.remove(filterable_job)
+                if not bucket:
+                    del buckets[key]
+        except (KeyError, ValueError):
+            # KeyError if the event_type, key_getter or key did not exist
+            # ValueError if listener did not exist within the key
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        if not buckets:
+            del keyed_listeners[key_getter]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1989,6 +2122,17 @@ class State:
         )
 
 
+class StateWrite(NamedTuple):
+    """A state to write to the state machine with async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2255,7 +2399,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2327,6 +2473,137 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        state_writes: Iterable[StateWrite],
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        This has the same semantics as calling async_set for each state write,
+        except all states share the same timestamp and, unless the state write
+        has its own context, the same context.
+
+        All states are validated before any of them is written, so if
+        InvalidStateError or InvalidEntityFormatError is raised, the state
+        machine is left untouched. The events are fired once all the states
+        have been written.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        states_data = self._states_data
+        # States written earlier in this batch, used if the same entity_id
+        # is written more than once
+        pending: dict[str, State] = {}
+        # (entity_id, old_state, new_state, context), new_state is
+        # None if the state was only reported
+        writes: list[tuple[str, State | None, State | None, Context | None]] = []
+
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            ctx,
+            state_info,
+        ) in state_writes:
+            new_state = str(new_state)
+            attributes = attributes or {}
+            if (old_state := pending.get(entity_id)) is None and (
+                old_state := states_data.get(entity_id)
+            ) is None:
+                # If the state is missing, try to convert the entity_id to lowercase
+                # and try again.
+                entity_id = entity_id.lower()
+                if (old_state := pending.get(entity_id)) is None:
+                    old_state = states_data.get(entity_id)
+
+            if old_state is None:
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                same_attr = (
+                    old_state.attributes is attributes
+                    or old_state.attributes == attributes
+                )
+                last_changed = old_state.last_changed if same_state else None
+
+            if same_state and same_attr:
+                writes.append((entity_id, old_state, None, ctx or context))
+                continue
+
+            if ctx is None:
+                if context is None:
+                    context = Context(id=ulid_at_time(timestamp))
+                ctx = context
+
+            if same_attr:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                attributes = old_state.attributes
+
+            # This is intentionally called with positional only arguments for
+            # performance reasons
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                now,
+                ctx,
+                old_state is None,
+                state_info,
+                timestamp,
+            )
+            pending[entity_id] = state
+            writes.append((entity_id, old_state, state, ctx))
+
+        states = self._states
+        for entity_id, old_state, written_state, _ in writes:
+            if written_state is not None:
+                if old_state is not None:
+                    old_state.expire()
+                states[entity_id] = written_state
+
+        fire = self._bus.async_fire_internal
+        for entity_id, old_state, written_state, ctx in writes:
+            if written_state is None:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                old_last_reported = old_state.last_reported
+                old_state.last_reported = now
+                old_state.last_reported_timestamp = timestamp
+                fire(
+                    EVENT_STATE_REPORTED,
+                    {
+                        "entity_id": entity_id,
+                        "old_last_reported": old_last_reported,
+                        "new_state": old_state,
+                    },
+                    context=ctx,
+                    time_fired=timestamp,
+                )
+                continue
+            state_changed_data: EventStateChangedData = {
+                "entity_id": entity_id,
+                "old_state": old_state,
+                "new_state": written_state,
+            }
+            fire(
+                EVENT_STATE_CHANGED,
+                state_changed_data,
+                context=ctx,
+                time_fired=timestamp,
+            )
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -45,6 +45,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    StateWrite,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -57,6 +58,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -280,6 +282,9 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - The _attr_-property setter and deleter will flag the state attributes as
+      dirty unless the property is in the _state_only_properties or the
+      _entity_component_state_only_properties of the class
     """
 
     def __new__(
@@ -309,16 +314,17 @@ class CachedProperties(type):
         Wrap _attr_ for cached properties in property objects.
         """
 
-        def deleter(name: str) -> Callable[[Any], None]:
+        def deleter(name: str, state_only: bool) -> Callable[[Any], None]:
             """Create a deleter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
 
             def _deleter(o: Any) -> None:
                 """Delete an _attr_ property.
 
-                Does two things:
+                Does three things:
                 - Delete the __attr_ attribute
                 - Invalidate the cache of the cached property
+                - Flag the state attributes as dirty
 
                 Raises AttributeError if the __attr_ attribute does not exist
                 """
@@ -326,10 +332,12 @@ class CachedProperties(type):
                 o.__dict__.pop(name, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
+                if not state_only:
+                    o._state_attributes_dirty = True  # noqa: SLF001
 
             return _deleter
 
-        def setter(name: str) -> Callable[[Any, Any], None]:
+        def setter(name: str, state_only: bool) -> Callable[[Any, Any], None]:
             """Create a setter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
 
@@ -337,20 +345,27 @@ class CachedProperties(type):
                 """Set an _attr_ property to the backing __attr attribute.
 
                 Also invalidates the corresponding cached_property by calling
-                delattr on it.
+                delattr on it and flags the state attributes as dirty.
                 """
                 if getattr(o, private_attr_name, _SENTINEL) == val:
                     return
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if not state_only:
+                    o._state_attributes_dirty = True  # noqa: SLF001
 
             return _setter
 
         def make_property(name: str) -> property:
             """Help create a property object."""
+            state_only = name in getattr(
+                cls, "_state_only_properties", ()
+            ) or name in getattr(cls, "_entity_component_state_only_properties", ())
             return property(
-                fget=attrgetter(f"__attr_{name}"), fset=setter(name), fdel=deleter(name)
+                fget=attrgetter(f"__attr_{name}"),
+                fset=setter(name, state_only),
+                fdel=deleter(name, state_only),
             )
 
         def wrap_attr(cls: CachedProperties, property_name: str) -> None:
@@ -514,6 +529,25 @@ class Entity(
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
 
+    # Set by entities whose state attributes only depend on _attr_ properties
+    # which are replaced rather than mutated in place. The state attributes
+    # of such entities are only calculated again when an _attr_ property
+    # which is not state only was changed since the last write, otherwise
+    # the attributes of the last write are reused.
+    _track_dirty_attributes: bool = False
+    # _attr_ properties which do not affect the state attributes
+    _state_only_properties: frozenset[str] = frozenset(
+        {"force_update", "should_poll", "state"}
+    )
+    # _attr_ properties of entity component base classes which do not affect
+    # the state attributes, such as the native value of a sensor
+    _entity_component_state_only_properties: frozenset[str] = frozenset()
+    # If an _attr_ property was changed since the state attributes were calculated
+    _state_attributes_dirty = True
+    # The state attributes of the last write and what they were calculated from
+    __last_state_attributes: ReadOnlyDict[str, Any] | None = None
+    __last_state_attributes_key: tuple[Any, ...] | None = None
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -1111,9 +1145,19 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (state_write := self._async_prepare_state_write()) is not None:
+            self._async_set_state_write(*state_write)
+
+    @callback
+    def _async_prepare_state_write(self) -> tuple[StateWrite, float] | None:
+        """Calculate the state to write to the state machine.
+
+        Returns a tuple (state_write, timestamp), or None if the
+        state should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1129,9 +1173,36 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
+        attributes_key: tuple[Any, ...] | None = None
+        if self._track_dirty_attributes:
+            # The availability is part of the key since it can be a property
+            # which does not depend on an _attr_ property, the unit system
+            # since the units of the state attributes can depend on it
+            attributes_key = (
+                self.available,
+                entry,
+                self.device_entry,
+                hass.data.get(DATA_CUSTOMIZE),
+                hass.config.units,
+            )
+            if (
+                not self._state_attributes_dirty
+                and (last_attributes := self.__last_state_attributes) is not None
+                and attributes_key == self.__last_state_attributes_key
+            ):
+                time_now = timer()
+                return (
+                    self.__async_state_write(
+                        self._stringify_state(attributes_key[0]),
+                        last_attributes,
+                        time_now,
+                    ),
+                    time_now,
+                )
+
         state, attr, capabilities, shadowed_attr = self.__async_calculate_state()
         time_now = timer()
 
@@ -1196,6 +1267,20 @@ class Entity(
         ):
             attr.update(custom)
 
+        if attributes_key is not None:
+            # The state machine keeps a ReadOnlyDict as is, which lets it
+            # compare the attributes by identity when they are reused
+            attr = self.__last_state_attributes = ReadOnlyDict(attr)
+            self.__last_state_attributes_key = attributes_key
+            self._state_attributes_dirty = False
+
+        return (self.__async_state_write(state, attr, time_now), time_now)
+
+    @callback
+    def __async_state_write(
+        self, state: str, attr: Mapping[str, Any], time_now: float
+    ) -> StateWrite:
+        """Return the state write of a calculated state."""
         if (
             self._context_set is not None
             and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
@@ -1203,22 +1288,41 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        return StateWrite(
+            self.entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+        )
+
+    @callback
+    def _async_set_state_write(self, state_write: StateWrite, timestamp: float) -> None:
+        """Write a calculated state to the state machine."""
+        hass = self.hass
         try:
             hass.states.async_set(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
+                state_write.entity_id,
+                state_write.state,
+                state_write.attributes,
+                state_write.force_update,
+                state_write.context,
+                state_write.state_info,
+                timestamp,
             )
         except InvalidStateError:
             _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+                "Failed to set state for %s, fall back to %s",
+                state_write.entity_id,
+                STATE_UNKNOWN,
             )
             hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+                state_write.entity_id,
+                STATE_UNKNOWN,
+                {},
+                state_write.force_update,
+                state_write.context,
             )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
@@ -25,6 +25,7 @@ from homeassistant.core import (
     HassJob,
     HomeAssistant,
     ServiceCall,
+    StateWrite,
     SupportsResponse,
     callback,
     split_entity_id,
@@ -35,6 +36,7 @@ from homeassistant.exceptions import (
     ConfigEntryError,
     ConfigEntryNotReady,
     HomeAssistantError,
+    InvalidStateError,
     PlatformNotReady,
 )
 from homeassistant.generated import languages
@@ -157,6 +159,11 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Seconds a service call targeting several entities waits for an
+        # entity of the platform before continuing without it
+        self.service_call_deadline: float | None = getattr(
+            platform, "SERVICE_CALL_DEADLINE", None
+        )
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -970,6 +977,37 @@ class EntityPlatform:
         ):
             self.async_unsub_polling()
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity]) -> None:
+        """Write the state of multiple entities to the state machine at once.
+
+        This is intended for integrations that receive updates for many
+        entities at the same time. The states share one timestamp and
+        the state changed events are fired after all states are written.
+
+        This method must be run in the event loop.
+        """
+        state_writes: list[tuple[Entity, StateWrite, float]] = []
+        for entity in entities:
+            if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+                entity._async_verify_state_writable()  # noqa: SLF001
+            if (prepared := entity._async_prepare_state_write()) is not None:  # noqa: SLF001
+                state_writes.append((entity, *prepared))
+
+        if not state_writes:
+            return
+
+        try:
+            self.hass.states.async_set_many(
+                [state_write for _, state_write, _ in state_writes],
+                timestamp=state_writes[-1][2],
+            )
+        except InvalidStateError:
+            # Nothing was written, fall back to writing the states one by one
+            # so only the invalid states are replaced
+            for entity, state_write, timestamp in state_writes:
+                entity._async_set_state_write(state_write, timestamp)  # noqa: SLF001
+
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
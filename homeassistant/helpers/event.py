@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
@@ -14,7 +13,10 @@ from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
 
+from lru import LRU
+
 from homeassistant.const import (
+    EVENT_COMPONENT_LOADED,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
@@ -31,7 +33,6 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
@@ -41,6 +42,7 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 
 from . import frame
+from .area_registry import EVENT_AREA_REGISTRY_UPDATED
 from .device_registry import (
     EVENT_DEVICE_REGISTRY_UPDATED,
     EventDeviceRegistryUpdatedData,
@@ -49,27 +51,13 @@ from .entity_registry import (
     EVENT_ENTITY_REGISTRY_UPDATED,
     EventEntityRegistryUpdatedData,
 )
+from .floor_registry import EVENT_FLOOR_REGISTRY_UPDATED
+from .label_registry import EVENT_LABEL_REGISTRY_UPDATED
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
-_TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventEntityRegistryUpdatedData]
-] = HassKey("track_entity_registry_updated_data")
-_TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventDeviceRegistryUpdatedData]
-] = HassKey("track_device_registry_updated_data")
-
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -83,6 +71,21 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+_TEMPLATE_RENDER_CACHE: HassKey[TemplateRenderCache] = HassKey("template_render_cache")
+_TEMPLATE_RENDER_CACHE_SIZE = 1024
+# Events after which cached renders of templates using the registries or
+# translations can be stale. Translations are loaded when an integration
+# is set up and when the language is changed.
+_TEMPLATE_RENDER_CACHE_CLEARING_EVENTS = (
+    EVENT_AREA_REGISTRY_UPDATED,
+    EVENT_COMPONENT_LOADED,
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EVENT_FLOOR_REGISTRY_UPDATED,
+    EVENT_LABEL_REGISTRY_UPDATED,
+)
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 
 
@@ -90,32 +93,8 @@ _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 class _KeyedEventTracker(Generic[_TypedDictT]):
     """Class to track events by key."""
 
-    key: HassKey[_KeyedEventData[_TypedDictT]]
     event_type: EventType[_TypedDictT] | str
-    dispatcher_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            Event[_TypedDictT],
-        ],
-        None,
-    ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
-
-
-@dataclass(slots=True, frozen=True)
-class _KeyedEventData(Generic[_TypedDictT]):
-    """Class to track data for events by key."""
-
-    listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    key_getter: Callable[[_TypedDictT], str | None]
 
 
 @dataclass(slots=True)
@@ -322,40 +301,14 @@ def async_track_state_change_event(
 
 
 @callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
+def _async_state_change_key(event_data: EventStateChangedData) -> str:
+    """Return the key for state changes, the entity_id."""
+    return event_data["entity_id"]
 
 
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_change_filter,
+    key_getter=_async_state_change_key,
 )
 
 
@@ -377,24 +330,6 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
-@callback
-def _remove_listener(
-    hass: HomeAssistant,
-    tracker: _KeyedEventTracker[_TypedDictT],
-    keys: Iterable[str],
-    job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-) -> None:
-    """Remove listener."""
-    for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
-            del callbacks[key]
-
-    if not callbacks:
-        hass.data.pop(tracker.key).listener()
-
-
 # tracker, not hass is intentionally the first argument here since its
 # constant and may be used in a partial in the future
 def _async_track_event(
@@ -411,77 +346,22 @@ def _async_track_event(
     if not keys:
         return _remove_empty_listener
 
-    hass_data = hass.data
-    tracker_key = tracker.key
-    if tracker_key in hass_data:
-        event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
-    else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
-        hass_data[tracker_key] = event_data
-
-    job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
-
-    if isinstance(keys, str):
-        # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
-        keys = (keys,)
-    else:
-        for key in keys:
-            callbacks[key].append(job)
-
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
-
-
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event: Event[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+    return hass.bus.async_listen_keyed(
+        tracker.event_type, tracker.key_getter, keys, action, job_type
+    )
 
 
 @callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+def _async_entity_registry_updated_key(
     event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
+) -> str:
+    """Return the key for entity registry updates, the old or current entity_id."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]  # mypy bug?
 
 
 _KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_ENTITY_REGISTRY_UPDATED_DATA,
     event_type=EVENT_ENTITY_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
+    key_getter=_async_entity_registry_updated_key,
 )
 
 
@@ -505,40 +385,16 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
+def _async_device_registry_updated_key(
     event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
+) -> str:
+    """Return the key for device registry updates, the device_id."""
+    return event_data["device_id"]
 
 
 _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    key_getter=_async_device_registry_updated_key,
 )
 
 
@@ -559,36 +415,13 @@ def async_track_device_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of an added state, or None if the state was not added."""
+    if event_data["old_state"] is not None:
+        return None
+    # If old_state is None, new_state must be set but
+    # mypy doesn't know that
+    return event_data["new_state"].domain  # type: ignore[union-attr]
 
 
 @bind_hass
@@ -605,10 +438,8 @@ def async_track_state_added_domain(
 
 
 _KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
+    key_getter=_async_domain_added_key,
 )
 
 
@@ -626,26 +457,18 @@ def _async_track_state_added_domain(
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of a removed state, or None if the state was not removed."""
+    if event_data["new_state"] is not None:
+        return None
+    # If new_state is None, old_state must be set but
+    # mypy doesn't know that
+    return event_data["old_state"].domain  # type: ignore[union-attr]
 
 
 _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+    key_getter=_async_domain_removed_key,
 )
 
 
@@ -925,6 +748,129 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class TemplateRenderCache:
+    """Cache the renders of templates tracked by template trackers.
+
+    Renders are shared between templates with the same source and variables.
+    A cached render is only used while every state it read is still the
+    current state of its entity. The state objects are compared by identity
+    since the state machine creates a new state object on every change.
+
+    Renders which read no entity, depend on the time, on collections of
+    states or which have a rate limit are not cached as they can change
+    without any of the states they read changing. The cache is cleared when
+    a registry is updated or translations are loaded, since a template can
+    also read those.
+    """
+
+    __slots__ = ("_hass", "_renders", "hits", "misses")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._renders: LRU[
+            tuple[str, bool, Any],
+            tuple[tuple[tuple[str, State | None], ...], RenderInfo],
+        ] = LRU(_TEMPLATE_RENDER_CACHE_SIZE)
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_render_to_info(
+        self,
+        track_template_: TrackTemplate,
+        strict: bool = False,
+        log_fn: Callable[[int, str], None] | None = None,
+        use_cached: bool = True,
+    ) -> RenderInfo:
+        """Render a tracked template or return the cached render.
+
+        If use_cached is False the template is always rendered and the
+        render is stored in the cache.
+        """
+        template = track_template_.template
+        if template.is_static:
+            return template.async_render_to_info(
+                track_template_.variables, strict=strict, log_fn=log_fn
+            )
+        key = _template_render_cache_key(template, track_template_.variables, strict)
+        if key is None:
+            return template.async_render_to_info(
+                track_template_.variables, strict=strict, log_fn=log_fn
+            )
+
+        states = self._hass.states
+        if use_cached and (cached := self._renders.get(key)) is not None:
+            read_states, info = cached
+            if all(states.get(entity_id) is state for entity_id, state in read_states):
+                self.hits += 1
+                return info
+
+        self.misses += 1
+        info = template.async_render_to_info(
+            track_template_.variables, strict=strict, log_fn=log_fn
+        )
+        if (
+            not info.entities
+            or info.has_time
+            or info.all_states
+            or info.all_states_lifecycle
+            or info.domains
+            or info.domains_lifecycle
+            or info.rate_limit is not None
+        ):
+            self._renders.pop(key, None)
+        else:
+            self._renders[key] = (
+                tuple(
+                    (entity_id, states.get(entity_id)) for entity_id in info.entities
+                ),
+                info,
+            )
+        return info
+
+    @callback
+    def async_clear(self, event: Event[Any] | None = None) -> None:
+        """Remove all cached renders."""
+        self._renders.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the cache hits and misses."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "size": len(self._renders),
+        }
+
+
+def _template_render_cache_key(
+    template: Template, variables: TemplateVarsType, strict: bool
+) -> tuple[str, bool, Any] | None:
+    """Return the render cache key or None if the variables can't be hashed."""
+    if not variables:
+        return (template.template, strict, None)
+    try:
+        variables_key = frozenset(
+            (name, type(value), value) for name, value in variables.items()
+        )
+        hash(variables_key)
+    except TypeError:
+        return None
+    return (template.template, strict, variables_key)
+
+
+@callback
+def async_get_template_render_cache(hass: HomeAssistant) -> TemplateRenderCache:
+    """Return the render cache shared by the template trackers."""
+    if (cache := hass.data.get(_TEMPLATE_RENDER_CACHE)) is None:
+        cache = hass.data[_TEMPLATE_RENDER_CACHE] = TemplateRenderCache(hass)
+        for event_type in _TEMPLATE_RENDER_CACHE_CLEARING_EVENTS:
+            hass.bus.async_listen(event_type, cache.async_clear)
+    return cache
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -947,6 +893,7 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_cache = async_get_template_render_cache(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -967,9 +914,8 @@ class TrackTemplateResultInfo:
         # Render the super template first
         if super_template is not None:
             template = super_template.template
-            variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_cache.async_render_to_info(
+                super_template, strict=strict, log_fn=log_fn, use_cached=False
             )
 
             # If the super template did not render to True, don't update other templates
@@ -988,9 +934,8 @@ class TrackTemplateResultInfo:
             if block_render or track_template_ == super_template:
                 continue
             template = track_template_.template
-            variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._render_cache.async_render_to_info(
+                track_template_, strict=strict, log_fn=log_fn, use_cached=False
             )
 
             if info.exception:
@@ -1114,8 +1059,10 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        # Forced refreshes always render as the template may read
+        # something that changed other than the tracked states
+        self._info[template] = info = self._render_cache.async_render_to_info(
+            track_template_, use_cached=event is not None
         )
 
         try:
@@ -14,6 +14,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import Event, HassJob, HomeAssistant, callback
 from homeassistant.loader import (
     Integration,
+    LazyPlatform,
     async_get_integrations,
     async_get_loaded_integration,
     async_register_preload_platform,
@@ -36,6 +37,7 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    lazy: bool
 
 
 @callback
@@ -51,12 +53,32 @@ def _async_integration_platform_component_loaded(
     integration = async_get_loaded_integration(hass, component_name)
     # First filter out platforms that the integration already processed.
     integration_platforms_by_name: dict[str, IntegrationPlatform] = {}
+    lazy_platforms_by_name: dict[str, IntegrationPlatform] = {}
     for integration_platform in integration_platforms:
         if component_name in integration_platform.seen_components:
             continue
         integration_platform.seen_components.add(component_name)
-        integration_platforms_by_name[integration_platform.platform_name] = (
-            integration_platform
+        if integration_platform.lazy:
+            lazy_platforms_by_name[integration_platform.platform_name] = (
+                integration_platform
+            )
+        else:
+            integration_platforms_by_name[integration_platform.platform_name] = (
+                integration_platform
+            )
+
+    # Lazy platforms are processed without importing them.
+    if lazy_platforms_by_name:
+        _process_integration_platforms(
+            hass,
+            integration,
+            {
+                platform_name: LazyPlatform(integration, platform_name)
+                for platform_name in integration.platforms_exists(
+                    lazy_platforms_by_name
+                )
+            },
+            lazy_platforms_by_name,
         )
 
     if not integration_platforms_by_name:
@@ -126,7 +148,7 @@ async def _async_process_integration_platforms_for_component(
 def _process_integration_platforms(
     hass: HomeAssistant,
     integration: Integration,
-    platforms: dict[str, ModuleType],
+    platforms: dict[str, ModuleType] | dict[str, LazyPlatform],
     integration_platforms_by_name: dict[str, IntegrationPlatform],
 ) -> list[asyncio.Future[Awaitable[None] | None]]:
     """Process integration platforms for a component.
@@ -160,8 +182,13 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    When lazy is set, the platforms are passed as a LazyPlatform and are only
+    imported when they are loaded by the processor.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,7 +202,6 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -185,12 +211,13 @@ async def async_process_integration_platforms(
         f"process_platform {platform_name}",
     )
     integration_platform = IntegrationPlatform(
-        platform_name, process_job, top_level_components
+        platform_name, process_job, top_level_components, lazy
     )
     # Tell the loader that it should try to pre-load the integration
     # for any future components that are loaded so we can reduce the
     # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
+    if not lazy:
+        async_register_preload_platform(hass, platform_name)
     integration_platforms.append(integration_platform)
     if not top_level_components:
         return
@@ -210,7 +237,7 @@ async def async_process_integration_platforms(
     #
     future = hass.async_create_task_internal(
         _async_process_integration_platforms(
-            hass, platform_name, top_level_components.copy(), process_job
+            hass, platform_name, top_level_components.copy(), process_job, lazy
         ),
         eager_start=True,
     )
@@ -223,6 +250,7 @@ async def _async_process_integration_platforms(
     platform_name: str,
     top_level_components: set[str],
     process_job: HassJob,
+    lazy: bool,
 ) -> None:
     """Process integration platforms for a component."""
     integrations = await async_get_integrations(hass, top_level_components)
@@ -239,15 +267,20 @@ async def _async_process_integration_platforms(
     for integration in loaded_integrations:
         if not integration.platforms_exists((platform_name,)):
             continue
-        try:
-            platform = await integration.async_get_platform(platform_name)
-        except ImportError:
-            _LOGGER.debug(
-                "Unexpected error importing %s for %s",
-                platform_name,
-                integration.domain,
+        if lazy:
+            platform: ModuleType | LazyPlatform = LazyPlatform(
+                integration, platform_name
             )
-            continue
+        else:
+            try:
+                platform = await integration.async_get_platform(platform_name)
+            except ImportError:
+                _LOGGER.debug(
+                    "Unexpected error importing %s for %s",
+                    platform_name,
+                    integration.domain,
+                )
+                continue
 
         if future := hass.async_run_hass_job(
             process_job, hass, integration.domain, platform
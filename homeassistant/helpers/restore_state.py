@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -28,6 +29,7 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+STORAGE_CHANGES_KEY = "core.restore_state_changes"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -35,6 +37,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between saving all states instead of only the changed states,
+# this also limits how outdated the last seen time of a saved state can be
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -137,8 +143,19 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        # States which changed since all states were last saved
+        self.changes_store = Store[dict[str, Any]](
+            hass, STORAGE_VERSION, STORAGE_CHANGES_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._dump_lock = asyncio.Lock()
+        self._last_compaction: datetime | None = None
+        self._has_saved_changes = False
+        # The state and extra data of each saved state
+        self._saved: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        self._changed_states: dict[str, dict[str, Any]] = {}
+        self._removed_states: dict[str, datetime] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -159,6 +176,12 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        try:
+            changes = await self.changes_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last state changes", exc_info=exc)
+            changes = None
+
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
@@ -170,6 +193,36 @@ class RestoreStateData:
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+        if changes is not None:
+            self._has_saved_changes = True
+            self._async_apply_changes(changes)
+
+    @callback
+    def _async_apply_changes(self, changes: dict[str, Any]) -> None:
+        """Apply the saved state changes to the last states.
+
+        Changes saved before all states were last saved are left over from
+        an interrupted compaction and are older than the saved states.
+        """
+        last_states = self.last_states
+        for item in changes["states"]:
+            entity_id = item["state"]["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = StoredState.from_dict(item)
+            if (
+                last_state := last_states.get(entity_id)
+            ) is None or stored_state.last_seen >= last_state.last_seen:
+                last_states[entity_id] = stored_state
+        for entity_id, removed in changes["removed"].items():
+            removed_at = dt_util.parse_datetime(removed)
+            if (
+                (last_state := last_states.get(entity_id)) is not None
+                and removed_at is not None
+                and last_state.last_seen <= removed_at
+            ):
+                del last_states[entity_id]
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -216,16 +269,100 @@ class RestoreStateData:
 
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
+        async with self._dump_lock:
+            await self._async_dump_all_states()
+
+    async def _async_dump_all_states(self) -> None:
+        """Save all states and forget the saved changes."""
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+        now = dt_util.utcnow()
+        saved: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        data: list[dict[str, Any]] = []
+        for stored_state in self.async_get_stored_states():
+            stored_state_dict = stored_state.as_dict()
+            data.append(stored_state_dict)
+            saved[stored_state.state.entity_id] = (
+                stored_state.state,
+                stored_state_dict["extra_data"],
             )
+        self._saved = saved
+        self._changed_states.clear()
+        self._removed_states.clear()
+        try:
+            await self.store.async_save(data)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            self._last_compaction = None
+            return
+        self._last_compaction = now
+        if self._has_saved_changes:
+            self._has_saved_changes = False
+            await self.changes_store.async_remove()
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states which changed since the last dump to storage.
+
+        The changes are saved next to the last saved states instead of
+        serializing and writing all states. All states are saved again
+        once a day or when most of the states have changed.
+        """
+        async with self._dump_lock:
+            stored_states = self.async_get_stored_states()
+            now = dt_util.utcnow()
+            if (
+                self._last_compaction is None
+                or now - self._last_compaction >= STATE_COMPACT_INTERVAL
+                or len(self._changed_states) * 2 > len(stored_states)
+            ):
+                await self._async_dump_all_states()
+                return
+
+            _LOGGER.debug("Dumping changed states")
+            saved = self._saved
+            changed_states = self._changed_states
+            removed_states = self._removed_states
+            changed = False
+            for stored_state in stored_states:
+                state = stored_state.state
+                entity_id = state.entity_id
+                stored_state_dict = stored_state.as_dict()
+                extra_data = stored_state_dict["extra_data"]
+                if (
+                    (last_saved := saved.get(entity_id)) is not None
+                    and last_saved[0] is state
+                    and last_saved[1] == extra_data
+                ):
+                    continue
+                saved[entity_id] = (state, extra_data)
+                changed_states[entity_id] = stored_state_dict
+                removed_states.pop(entity_id, None)
+                changed = True
+
+            if len(saved) > len(stored_states):
+                current_entity_ids = {
+                    stored_state.state.entity_id for stored_state in stored_states
+                }
+                for entity_id in saved.keys() - current_entity_ids:
+                    del saved[entity_id]
+                    changed_states.pop(entity_id, None)
+                    removed_states[entity_id] = now
+                    changed = True
+
+            if not changed:
+                return
+
+            self._has_saved_changes = True
+            try:
+                await self.changes_store.async_save(
+                    {
+                        "states": list(changed_states.values()),
+                        "removed": dict(removed_states),
+                    }
+                )
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error saving changed states", exc_info=exc)
+                # Save all states the next time
+                self._last_compaction = None
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -234,6 +371,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -244,14 +384,14 @@ class RestoreStateData:
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
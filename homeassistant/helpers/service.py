@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HomeAssistant,
     ServiceCall,
@@ -63,6 +64,7 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .trace import trace_stack_cv, trace_update_result
 from .typing import ConfigType, TemplateVarsType
 
 if TYPE_CHECKING:
@@ -78,6 +80,7 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+DATA_TARGET_INDEX: HassKey[_TargetIndex] = HassKey("service_target_index")
 
 
 @cache
@@ -495,8 +498,150 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+class _TargetIndex:
+    """Inverted index from the targets of service calls to what they reference.
+
+    The references of a floor, area, label or device are looked up in the
+    registries the first time they are needed and kept until one of the
+    registries is updated, so resolving the target of a service call is
+    a union of sets.
+    """
+
+    __slots__ = ("_references", "invalidations", "registries")
+
+    def __init__(
+        self,
+        registries: tuple[
+            entity_registry.EntityRegistry,
+            device_registry.DeviceRegistry,
+            area_registry.AreaRegistry,
+        ],
+    ) -> None:
+        """Initialize the index."""
+        self.registries = registries
+        self.invalidations = 0
+        self._references: dict[tuple[str, str], frozenset[str]] = {}
+
+    @callback
+    def async_invalidate(self, event: Event[Any] | None = None) -> None:
+        """Drop the indexed references after a registry update."""
+        self._references.clear()
+        self.invalidations += 1
+
+    @callback
+    def async_get(self, reference: str, target_id: str) -> frozenset[str]:
+        """Return the ids a floor, area, label or device references."""
+        key = (reference, target_id)
+        if (ids := self._references.get(key)) is None:
+            ids = self._references[key] = frozenset(
+                _TARGET_REFERENCES[reference](*self.registries, target_id)
+            )
+        return ids
+
+
+def _is_targetable(entry: entity_registry.RegistryEntry) -> bool:
+    """Return if an entity is targeted by the area, device or label it is in.
+
+    Entities which are hidden or which are config or diagnostic entities
+    are only targeted by their entity_id.
+    """
+    return entry.entity_category is None and entry.hidden_by is None
+
+
+_FLOOR_AREAS = "floor_areas"
+_AREA_DEVICES = "area_devices"
+_AREA_ENTITIES = "area_entities"
+_DEVICE_ENTITIES = "device_entities"
+_DEVICE_ENTITIES_WITHOUT_AREA = "device_entities_without_area"
+_LABEL_AREAS = "label_areas"
+_LABEL_DEVICES = "label_devices"
+_LABEL_ENTITIES = "label_entities"
+
+type _TargetReferences = Callable[
+    [
+        entity_registry.EntityRegistry,
+        device_registry.DeviceRegistry,
+        area_registry.AreaRegistry,
+        str,
+    ],
+    Iterable[str],
+]
+
+_TARGET_REFERENCES: dict[str, _TargetReferences] = {
+    _FLOOR_AREAS: lambda ent_reg, dev_reg, area_reg, floor_id: (
+        area_entry.id for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
+    ),
+    _AREA_DEVICES: lambda ent_reg, dev_reg, area_reg, area_id: (
+        device_entry.id
+        for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+    ),
+    _AREA_ENTITIES: lambda ent_reg, dev_reg, area_reg, area_id: (
+        entry.entity_id
+        for entry in ent_reg.entities.get_entries_for_area_id(area_id)
+        if _is_targetable(entry)
+    ),
+    _DEVICE_ENTITIES: lambda ent_reg, dev_reg, area_reg, device_id: (
+        entry.entity_id
+        for entry in ent_reg.entities.get_entries_for_device_id(device_id)
+        if _is_targetable(entry)
+    ),
+    # Entities of a device in a targeted area which are not moved to
+    # another area themselves
+    _DEVICE_ENTITIES_WITHOUT_AREA: lambda ent_reg, dev_reg, area_reg, device_id: (
+        entry.entity_id
+        for entry in ent_reg.entities.get_entries_for_device_id(device_id)
+        if not entry.area_id and _is_targetable(entry)
+    ),
+    _LABEL_AREAS: lambda ent_reg, dev_reg, area_reg, label_id: (
+        area_entry.id for area_entry in area_reg.areas.get_areas_for_label(label_id)
+    ),
+    _LABEL_DEVICES: lambda ent_reg, dev_reg, area_reg, label_id: (
+        device_entry.id
+        for device_entry in dev_reg.devices.get_devices_for_label(label_id)
+    ),
+    _LABEL_ENTITIES: lambda ent_reg, dev_reg, area_reg, label_id: (
+        entry.entity_id
+        for entry in ent_reg.entities.get_entries_for_label(label_id)
+        if _is_targetable(entry)
+    ),
+}
+
+_TARGET_INDEX_INVALIDATING_EVENTS = (
+    area_registry.EVENT_AREA_REGISTRY_UPDATED,
+    device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+    entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+    floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+    label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+)
+
+
+@callback
+def _async_get_target_index(
+    hass: HomeAssistant,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+) -> _TargetIndex:
+    """Return the target index of the registries."""
+    if (index := hass.data.get(DATA_TARGET_INDEX)) is None:
+        index = hass.data[DATA_TARGET_INDEX] = _TargetIndex(
+            (ent_reg, dev_reg, area_reg)
+        )
+        for event_type in _TARGET_INDEX_INVALIDATING_EVENTS:
+            hass.bus.async_listen(event_type, index.async_invalidate)
+    elif (
+        index.registries[0] is not ent_reg
+        or index.registries[1] is not dev_reg
+        or index.registries[2] is not area_reg
+    ):
+        # The registries were replaced without an update event
+        index.async_invalidate()
+        index.registries = (ent_reg, dev_reg, area_reg)
+    return index
+
+
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -520,9 +665,10 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
+    ent_reg = entity_registry.async_get(hass)
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
+    index = _async_get_target_index(hass, ent_reg, dev_reg, area_reg)
 
     if selector.floor_ids:
         floor_reg = floor_registry.async_get(hass)
@@ -544,71 +690,38 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
+            selected.indirectly_referenced.update(
+                index.async_get(_LABEL_ENTITIES, label_id)
+            )
+            selected.referenced_devices.update(
+                index.async_get(_LABEL_DEVICES, label_id)
+            )
+            selected.referenced_areas.update(index.async_get(_LABEL_AREAS, label_id))
 
     # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
+    for floor_id in selector.floor_ids:
+        selected.referenced_areas.update(index.async_get(_FLOOR_AREAS, floor_id))
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
 
     selected.referenced_areas.update(selector.area_ids)
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            selected.referenced_devices.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
-
-    if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
+    for area_id in selected.referenced_areas:
+        selected.referenced_devices.update(index.async_get(_AREA_DEVICES, area_id))
+        # Add indirectly referenced by area
+        selected.indirectly_referenced.update(index.async_get(_AREA_ENTITIES, area_id))
+
+    # Add indirectly referenced by device, a device referenced by an area
+    # only references the entities which have no explicitly set area
+    for device_id in selected.referenced_devices:
+        selected.indirectly_referenced.update(
+            index.async_get(
+                _DEVICE_ENTITIES
+                if device_id in selector.device_ids
+                else _DEVICE_ENTITIES_WITHOUT_AREA,
+                device_id,
             )
         )
-    )
     return selected
 
 
@@ -984,12 +1097,19 @@ async def entity_service_call(
             )
         return None
 
+    # The time each entity took is added to the trace of the calling script
+    durations: dict[str, float] | None = {} if trace_stack_cv.get() else None
+
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
+        start = hass.loop.time()
         single_response = await _handle_entity_call(
             hass, entity, func, data, call.context
         )
+        if durations is not None:
+            durations[entity.entity_id] = round(hass.loop.time() - start, 3)
+            trace_update_result(entity_durations=durations)
         if entity.should_poll:
             # Context expires if the turn on commands took a long time.
             # Set context again so it's there when we update
@@ -1001,16 +1121,22 @@ async def entity_service_call(
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
+            _async_request_entity_call(
+                hass, entity, func, data, call.context, durations
             )
             for entity in entities
         ],
         return_exceptions=True,
     )
+    if durations:
+        trace_update_result(entity_durations=durations)
 
     response_data: EntityServiceResponse = {}
+    timed_out: set[str] = set()
     for entity, result in zip(entities, results, strict=False):
+        if isinstance(result, _EntityCallDeadlineExceeded):
+            timed_out.add(entity.entity_id)
+            continue
         if isinstance(result, BaseException):
             raise result from None
         response_data[entity.entity_id] = result
@@ -1018,7 +1144,7 @@ async def entity_service_call(
     tasks: list[asyncio.Task[None]] = []
 
     for entity in entities:
-        if not entity.should_poll:
+        if not entity.should_poll or entity.entity_id in timed_out:
             continue
 
         # Context expires if the turn on commands took a long time.
@@ -1035,6 +1161,67 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+class _EntityCallDeadlineExceeded(Exception):
+    """Error to indicate the service call of an entity missed its deadline."""
+
+
+async def _async_request_entity_call(
+    hass: HomeAssistant,
+    entity: Entity,
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    context: Context,
+    durations: dict[str, float] | None,
+) -> ServiceResponse:
+    """Call the service method of an entity of a multi-entity call.
+
+    If the platform of the entity sets a service call deadline and the
+    entity misses it, _EntityCallDeadlineExceeded is raised and the call
+    continues in the background so the other entities are not held up.
+    """
+    start = hass.loop.time()
+    coro = entity.async_request_call(
+        _handle_entity_call(hass, entity, func, data, context)
+    )
+    try:
+        if (
+            entity.platform is None
+            or (deadline := entity.platform.service_call_deadline) is None
+        ):
+            return await coro
+        task = hass.async_create_task_internal(
+            coro, f"service call for {entity.entity_id}"
+        )
+        try:
+            async with asyncio.timeout(deadline):
+                return await asyncio.shield(task)
+        except TimeoutError:
+            task.add_done_callback(partial(_async_log_late_entity_call, entity))
+            _LOGGER.warning(
+                "Service call for %s did not finish within %s seconds,"
+                " it will continue in the background",
+                entity.entity_id,
+                deadline,
+            )
+            raise _EntityCallDeadlineExceeded(entity.entity_id) from None
+    finally:
+        if durations is not None:
+            durations[entity.entity_id] = round(hass.loop.time() - start, 3)
+
+
+@callback
+def _async_log_late_entity_call(
+    entity: Entity, task: asyncio.Task[ServiceResponse]
+) -> None:
+    """Log the error of a service call which missed its deadline."""
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.error(
+            "Service call for %s failed after missing its deadline",
+            entity.entity_id,
+            exc_info=err,
+        )
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -11,8 +11,10 @@ from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -48,6 +50,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -82,6 +85,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -99,6 +103,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -2677,6 +2686,7 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
     _get_hass_loader(hass).sources = custom_templates
+    await _get_bytecode_cache(hass).async_load(custom_templates)
 
 
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
@@ -2699,6 +2709,118 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+@singleton(_BYTECODE_CACHE)
+def _get_bytecode_cache(hass: HomeAssistant) -> TemplateBytecodeCache:
+    return TemplateBytecodeCache(hass)
+
+
+class TemplateBytecodeCache:
+    """Persist the code of compiled templates across restarts.
+
+    The code is keyed by the environment flavour and a hash of the template
+    source. The cache is discarded when Home Assistant, Python or jinja2 are
+    upgraded or when the custom templates change. Only the code of templates
+    compiled since the start is saved so templates no longer in use are
+    eventually dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        self._loaded = False
+        self._fingerprint: str | None = None
+        # Marshaled code from the last run, encoded as base64
+        self._stored: dict[str, str] = {}
+        # Marshaled code of the templates compiled since the start
+        self._used: dict[str, str] = {}
+        self._save_scheduled = False
+
+    async def async_load(self, custom_templates: dict[str, str]) -> None:
+        """Load the cache unless it was compiled for other sources."""
+        fingerprint = _bytecode_cache_fingerprint(custom_templates)
+        if self._loaded:
+            if fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                self._stored = {}
+                self._used = {}
+                self._async_schedule_save()
+            return
+        self._loaded = True
+        self._fingerprint = fingerprint
+        if (data := await self._store.async_load()) is not None and data[
+            "fingerprint"
+        ] == fingerprint:
+            self._stored = data["code"]
+
+    @staticmethod
+    def _key(flavour: str, source: str) -> str:
+        """Return the key of a template source."""
+        return f"{flavour}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+    def get(self, flavour: str, source: str) -> CodeType | None:
+        """Return the stored code of a template or None if not stored."""
+        if not self._stored:
+            return None
+        key = self._key(flavour, source)
+        if (encoded := self._stored.get(key)) is None:
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (ValueError, EOFError, TypeError):
+            del self._stored[key]
+            return None
+        self._add_used(key, encoded)
+        return cast(CodeType, code)
+
+    def set(self, flavour: str, source: str, code: CodeType) -> None:
+        """Store the code of a compiled template."""
+        if not self._loaded:
+            return
+        self._add_used(
+            self._key(flavour, source), base64.b64encode(marshal.dumps(code)).decode()
+        )
+
+    def _add_used(self, key: str, encoded: str) -> None:
+        """Mark code as used and save it later.
+
+        Templates may be compiled outside the event loop.
+        """
+        if key in self._used:
+            return
+        self._used[key] = encoded
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._save_scheduled = False
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"fingerprint": self._fingerprint, "code": dict(self._used)}
+
+
+def _bytecode_cache_fingerprint(custom_templates: dict[str, str]) -> str:
+    """Return the fingerprint the stored code is only valid for."""
+    fingerprint = hashlib.sha256()
+    for part in (HA_VERSION, sys.implementation.cache_tag, jinja2.__version__):
+        fingerprint.update(f"{part}\0".encode())
+    for name, source in sorted(custom_templates.items()):
+        fingerprint.update(f"{name}\0{source}\0".encode())
+    return fingerprint.hexdigest()
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -2740,6 +2862,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.flavour = "limited" if limited else "strict" if strict else "normal"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3090,7 +3213,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            if (cached := bytecode_cache.get(self.flavour, source)) is not None:
+                self.template_cache[source] = cached
+                return cached
+            compiled = super().compile(source)
+            bytecode_cache.set(self.flavour, source, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
@@ -16,6 +16,7 @@ import importlib
 import logging
 import os
 import pathlib
+from stat import S_ISREG
 import sys
 import time
 from types import ModuleType
@@ -29,7 +30,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__ as HA_VERSION
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +50,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,10 +66,13 @@ _LOGGER = logging.getLogger(__name__)
 #
 # This list can be extended by calling async_register_preload_platform
 #
+# Platforms which are only needed when they are requested, such as
+# diagnostics, repairs and system_health, are not preloaded. They are
+# imported on first use through a LazyPlatform instead.
+#
 BASE_PRELOAD_PLATFORMS = [
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "logbook",
@@ -75,8 +80,6 @@ BASE_PRELOAD_PLATFORMS = [
     "intent",
     "media_source",
     "recorder",
-    "repairs",
-    "system_health",
     "trigger",
 ]
 
@@ -115,6 +118,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_PLATFORM_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("platform_import_times")
+DATA_MANIFEST_INDEX: HassKey[ManifestIndex] = HassKey("manifest_index")
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 60
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -252,6 +260,8 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_PLATFORM_IMPORT_TIMES] = {}
+    hass.data[DATA_MANIFEST_INDEX] = ManifestIndex(hass)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -290,11 +300,13 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    manifest_index = await _async_get_manifest_index(hass)
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
         [comp.name for comp in dirs],
+        manifest_index,
     )
     return {
         integration.domain: integration
@@ -634,38 +646,69 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+@callback
+def async_get_platform_import_times(hass: HomeAssistant) -> dict[str, float]:
+    """Return the time in seconds it took to import each platform.
+
+    The keys are the full platform names such as hue.diagnostics.
+    """
+    return hass.data[DATA_PLATFORM_IMPORT_TIMES]
+
+
 class Integration:
     """An integration in Home Assistant."""
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: ManifestIndex | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        The manifest and the top level files are taken from the manifest
+        index if they were not modified since they were indexed.
+        """
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
 
-            if not manifest_path.is_file():
+            mtimes: tuple[int, int, int] | None = None
+            indexed: tuple[Manifest, set[str] | None] | None = None
+            if manifest_index is None:
+                if not manifest_path.is_file():
+                    continue
+            elif (mtimes := _manifest_mtimes(manifest_path)) is None:
                 continue
+            else:
+                indexed = manifest_index.get(manifest_path, mtimes)
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+            if indexed is not None:
+                manifest, top_level_files = indexed
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_index is not None and mtimes is not None:
+                    manifest_index.add(manifest_path, mtimes, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -758,6 +801,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._platform_import_times = hass.data[DATA_PLATFORM_IMPORT_TIMES]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1243,6 +1287,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1268,6 +1313,7 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        self._platform_import_times[full_name] = time.perf_counter() - start
         return cast(ModuleType, cache[full_name])
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -1283,6 +1329,35 @@ class Integration:
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+class LazyPlatform:
+    """A platform of an integration which is imported on first use.
+
+    Integration platforms which are only needed on request are handed out
+    as a LazyPlatform so loading the integration does not import them.
+    The module is imported in the import executor by async_load.
+    """
+
+    __slots__ = ("integration", "platform_name")
+
+    def __init__(self, integration: Integration, platform_name: str) -> None:
+        """Initialize the lazy platform."""
+        self.integration = integration
+        self.platform_name = platform_name
+
+    @property
+    def loaded(self) -> bool:
+        """Return if the platform module has been imported."""
+        return self.integration.get_platform_cached(self.platform_name) is not None
+
+    async def async_load(self) -> ModuleType:
+        """Return the platform module, importing it if needed."""
+        return await self.integration.async_get_platform(self.platform_name)
+
+    def __repr__(self) -> str:
+        """Text representation of the lazy platform."""
+        return f"<LazyPlatform {self.integration.domain}.{self.platform_name}>"
+
+
 def _version_blocked(
     integration_version: AwesomeVersion,
     blocked_integration: BlockedIntegration,
@@ -1297,14 +1372,151 @@ def _version_blocked(
     return True
 
 
+def _manifest_mtimes(manifest_path: pathlib.Path) -> tuple[int, int, int] | None:
+    """Return the modification times of a manifest and its directory.
+
+    The size of the manifest is included as well. Returns None if the
+    manifest is not a file.
+    """
+    try:
+        manifest_stat = manifest_path.stat()
+        dir_stat = manifest_path.parent.stat()
+    except OSError:
+        return None
+    if not S_ISREG(manifest_stat.st_mode):
+        return None
+    return (manifest_stat.st_mtime_ns, manifest_stat.st_size, dir_stat.st_mtime_ns)
+
+
+class ManifestIndex:
+    """Persist the manifests and top level files of resolved integrations.
+
+    An integration is resolved from the index on the next start without
+    reading its manifest or listing its directory, unless the manifest or
+    the directory were modified. The index is discarded when Home Assistant
+    is upgraded. Only the integrations resolved since the start are saved
+    so removed integrations are eventually dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] | None = None
+        self._load_future: asyncio.Future[None] | None = None
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._used: dict[str, dict[str, Any]] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the index, only the first call loads it from storage."""
+        if self._load_future is not None:
+            await self._load_future
+            return
+        self._load_future = self._hass.loop.create_future()
+        # pylint: disable-next=import-outside-toplevel
+        from .exceptions import HomeAssistantError
+
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store[dict[str, Any]](
+            self._hass,
+            MANIFEST_INDEX_STORAGE_VERSION,
+            MANIFEST_INDEX_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        try:
+            data = await self._store.async_load()
+            if data is not None and data["ha_version"] == HA_VERSION:
+                self._stored = data["integrations"]
+        except HomeAssistantError as err:
+            _LOGGER.warning("Error loading the manifest index: %s", err)
+        finally:
+            self._load_future.set_result(None)
+
+    def get(
+        self, manifest_path: pathlib.Path, mtimes: tuple[int, int, int]
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the indexed manifest and top level files of an integration.
+
+        Returns None if the integration is not indexed or was modified.
+        """
+        key = str(manifest_path)
+        if (entry := self._stored.get(key)) is None or tuple(entry["mtimes"]) != mtimes:
+            return None
+        self._add_used(key, entry)
+        files = entry["files"]
+        return (
+            cast(Manifest, entry["manifest"].copy()),
+            None if files is None else set(files),
+        )
+
+    def add(
+        self,
+        manifest_path: pathlib.Path,
+        mtimes: tuple[int, int, int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Index the manifest and top level files of an integration.
+
+        The manifest is copied because the integration adds keys to it.
+        """
+        self._add_used(
+            str(manifest_path),
+            {
+                "mtimes": mtimes,
+                "manifest": manifest.copy(),
+                "files": None if top_level_files is None else sorted(top_level_files),
+            },
+        )
+
+    def _add_used(self, key: str, entry: dict[str, Any]) -> None:
+        """Mark an entry as used and save the index later.
+
+        Integrations are resolved in the executor.
+        """
+        self._used[key] = entry
+        if self._store is not None and not self._save_scheduled:
+            self._save_scheduled = True
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the index."""
+        self._save_scheduled = False
+        if TYPE_CHECKING:
+            assert self._store is not None
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"ha_version": HA_VERSION, "integrations": dict(self._used)}
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex | None:
+    """Return the loaded manifest index."""
+    if (manifest_index := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        return None
+    await manifest_index.async_load()
+    return manifest_index
+
+
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    manifest_index: ManifestIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_index
+            )
         except Exception:
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -1390,8 +1602,9 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_index = await _async_get_manifest_index(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root, hass, components, needed, manifest_index
         )
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
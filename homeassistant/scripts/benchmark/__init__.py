@@ -225,6 +225,42 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def set_states(hass):
+    """Set the state of 10k entities 10 times with async_set."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(10**4)]
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Benchmark"}
+
+    start = timer()
+
+    for value in range(10):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(value), attributes)
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def set_many_states(hass):
+    """Set the state of 10k entities 10 times with async_set_many."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(10**4)]
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Benchmark"}
+
+    start = timer()
+
+    for value in range(10):
+        hass.states.async_set_many(
+            [
+                core.StateWrite(entity_id, str(value), attributes)
+                for entity_id in entity_ids
+            ]
+        )
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -312,6 +348,174 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_states_orm_insert(hass):
+    """Record 50k states with the ORM unit of work."""
+    return _recorder_insert_states(False)
+
+
+@benchmark
+async def recorder_states_bulk_insert(hass):
+    """Record 50k states with the recorder bulk insert."""
+    return _recorder_insert_states(True)
+
+
+def _recorder_insert_states(bulk: bool) -> float:
+    """Record 100 commits of 100 entities changing 5 times each into SQLite."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import PendingStatesWriter
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    writer = PendingStatesWriter()
+    metadata_ids: dict[str, int] = {}
+    attributes_ids: dict[str, int] = {}
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(100)]
+    timestamp = 1.0
+
+    start = timer()
+
+    with Session(engine) as session:
+        for _ in range(100):
+            rows: list[StatesMeta | StateAttributes | States] = []
+            pending_states_meta: dict[str, StatesMeta] = {}
+            pending_attributes: dict[str, StateAttributes] = {}
+            old_states: dict[str, States] = {}
+            for value in range(5):
+                shared_attrs = f'{{"unit_of_measurement":"W","value":{value}}}'
+                for entity_id in entity_ids:
+                    timestamp += 0.001
+                    dbstate = States(
+                        state=str(value),
+                        last_updated_ts=timestamp,
+                        old_state=old_states.get(entity_id),
+                        origin_idx=0,
+                    )
+                    if metadata_id := metadata_ids.get(entity_id):
+                        dbstate.metadata_id = metadata_id
+                    else:
+                        if not (states_meta := pending_states_meta.get(entity_id)):
+                            states_meta = StatesMeta(entity_id=entity_id)
+                            pending_states_meta[entity_id] = states_meta
+                            rows.append(states_meta)
+                        dbstate.states_meta_rel = states_meta
+                    if attributes_id := attributes_ids.get(shared_attrs):
+                        dbstate.attributes_id = attributes_id
+                    else:
+                        if not (attrs := pending_attributes.get(shared_attrs)):
+                            attrs = StateAttributes(shared_attrs=shared_attrs, hash=0)
+                            pending_attributes[shared_attrs] = attrs
+                            rows.append(attrs)
+                        dbstate.state_attributes = attrs
+                    old_states[entity_id] = dbstate
+                    rows.append(dbstate)
+            for row in rows:
+                if not bulk:
+                    session.add(row)
+                elif isinstance(row, StatesMeta):
+                    writer.add_states_meta(row)
+                elif isinstance(row, StateAttributes):
+                    writer.add_state_attributes(row)
+                else:
+                    writer.add_state(row)
+            if bulk:
+                writer.write(session)
+            session.commit()
+            metadata_ids.update(
+                (entity_id, states_meta.metadata_id)
+                for entity_id, states_meta in pending_states_meta.items()
+            )
+            attributes_ids.update(
+                (shared_attrs, attrs.attributes_id)
+                for shared_attrs, attrs in pending_attributes.items()
+            )
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_match(hass):
+    """Match 10k topics against 1k MQTT wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, WildcardSubscriptions
+
+    subscriptions = WildcardSubscriptions()
+    for idx in range(1000):
+        topic = (
+            f"homeassistant/+/device_{idx}/#"
+            if idx % 2
+            else f"zigbee2mqtt/device_{idx}/+/state"
+        )
+        subscriptions.add(Subscription(topic, False, None))
+    topics = [
+        f"homeassistant/sensor/device_{idx % 1000}/config"
+        if idx % 2
+        else f"zigbee2mqtt/device_{idx % 1000}/light/state"
+        for idx in range(10000)
+    ]
+
+    start = timer()
+    for topic in topics:
+        subscriptions.match(topic)
+    return timer() - start
+
+
+@benchmark
+async def resolve_service_targets(hass):
+    """Resolve 1k floor targets with 10k entities on 2k devices in 100 areas."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        service,
+    )
+
+    for registry in (ar, dr, er, fr, lr):
+        await registry.async_load(hass)
+    areas = ar.async_get(hass).areas
+    devices = dr.async_get(hass).devices
+    entities = er.async_get(hass).entities
+    for idx in range(100):
+        areas[f"area_{idx}"] = ar.AreaEntry(
+            aliases=set(),
+            floor_id=f"floor_{idx % 5}",
+            icon=None,
+            id=f"area_{idx}",
+            name=f"Area {idx}",
+            normalized_name=f"area {idx}",
+            picture=None,
+        )
+    for idx in range(2000):
+        device = dr.DeviceEntry(area_id=f"area_{idx % 100}")
+        devices[device.id] = device
+        for entity_idx in range(5):
+            entity_id = f"light.device_{idx}_{entity_idx}"
+            entities[entity_id] = er.RegistryEntry(
+                entity_id=entity_id,
+                unique_id=entity_id,
+                platform="benchmark",
+                device_id=device.id,
+            )
+    call = core.ServiceCall("light", "turn_off", {"floor_id": "floor_2"})
+
+    start = timer()
+    for _ in range(1000):
+        service.async_extract_referenced_entity_ids(hass, call)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
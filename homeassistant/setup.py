@@ -76,6 +76,12 @@ DATA_SETUP_TIME: HassKey[
 
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
+# DATA_SETUP_CRITICAL_PATH is a list of the integrations which delayed the
+# startup the longest, with the time their setup took in seconds
+DATA_SETUP_CRITICAL_PATH: HassKey[list[tuple[str, float]]] = HassKey(
+    "setup_critical_path"
+)
+
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
     "bootstrap_persistent_errors"
 )
@@ -804,6 +810,26 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_set_setup_critical_path(
+    hass: core.HomeAssistant, critical_path: list[tuple[str, float]]
+) -> None:
+    """Set the integrations which delayed the startup the longest."""
+    hass.data[DATA_SETUP_CRITICAL_PATH] = critical_path
+
+
+@callback
+def async_get_setup_critical_path(
+    hass: core.HomeAssistant,
+) -> list[tuple[str, float]]:
+    """Return the integrations which delayed the startup the longest.
+
+    The integrations are in the order they were set up, each started once
+    the previous one finished, with the time their setup took in seconds.
+    """
+    return hass.data.get(DATA_SETUP_CRITICAL_PATH, [])
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -34,7 +34,11 @@ from homeassistant.auth import (
     providers as auth_providers,
 )
 from homeassistant.auth.permissions import system_policies
-from homeassistant.components import device_automation, persistent_notification as pn
+from homeassistant.components import (
+    device_automation,
+    persistent_notification as pn,
+    system_health,
+)
 from homeassistant.components.device_automation import (  # noqa: F401
     _async_get_device_automation_capabilities as async_get_device_automation_capabilities,
 )
@@ -1421,6 +1425,7 @@ async def flush_store(store: storage.Store) -> None:
 
 async def get_system_health_info(hass: HomeAssistant, domain: str) -> dict[str, Any]:
     """Get system health info."""
+    await system_health.async_register_platforms(hass)
     return await hass.data["system_health"][domain].info_callback(hass)
 
 
@@ -9,9 +9,15 @@ import pytest
 from homeassistant import core as ha
 from homeassistant.components.demo import DOMAIN
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
-from homeassistant.const import Platform
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_UNIT_OF_MEASUREMENT,
+    Platform,
+    UnitOfTemperature,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 
 from tests.common import mock_restore_cache_with_extra_data
 
@@ -76,3 +82,38 @@ async def test_restore_state(
 
     state = hass.states.get(entity_id)
     assert state.state == str(2**20 + delta)
+
+
+async def test_state_attributes_reused(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the state attributes are reused until they change."""
+    assert await async_setup_component(
+        hass, SENSOR_DOMAIN, {SENSOR_DOMAIN: {"platform": DOMAIN}}
+    )
+    assert await async_setup_component(hass, "homeassistant", {})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.total_energy_kwh")
+    freezer.tick(timedelta(minutes=5, seconds=1))
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+
+    new_state = hass.states.get("sensor.total_energy_kwh")
+    assert new_state.state == "0.5"
+    assert new_state.attributes is state.attributes
+
+    entity_id = "sensor.outside_temperature"
+    state = hass.states.get(entity_id)
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.CELSIUS
+
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    await hass.services.async_call(
+        "homeassistant",
+        "update_entity",
+        {ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == "60.1"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.FAHRENHEIT
@@ -136,7 +136,7 @@ async def test_chain_history(
             return_value=fake_states,
         ),
         patch(
-            "homeassistant.components.recorder.history.get_last_state_changes",
+            "homeassistant.components.recorder.history.get_last_state_changes_for_entities",
             return_value=fake_states,
         ),
     ):
@@ -243,7 +243,7 @@ async def test_history_time(recorder_mock: Recorder, hass: HomeAssistant) -> Non
             return_value=fake_states,
         ),
         patch(
-            "homeassistant.components.recorder.history.get_last_state_changes",
+            "homeassistant.components.recorder.history.get_last_state_changes_for_entities",
             return_value=fake_states,
         ),
     ):
@@ -6,7 +6,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -2957,6 +2957,122 @@ async def test_get_events_with_context_state(
     assert "context_event_type" not in results[3]
 
 
+async def test_get_events_context_rows_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the rows contexts originate from are only selected once."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    with patch(
+        "homeassistant.components.logbook.processor.context_rows_stmt",
+        wraps=logbook.processor.context_rows_stmt,
+    ) as context_rows_stmt_mock:
+        for msg_id in (1, 2):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "logbook/get_events",
+                    "start_time": now.isoformat(),
+                    "entity_ids": ["light.kitchen"],
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            results = response["result"]
+            assert len(results) == 1
+            assert results[0]["entity_id"] == "light.kitchen"
+            assert results[0]["state"] == "on"
+            assert results[0]["context_event_type"] == EVENT_AUTOMATION_TRIGGERED
+            assert results[0]["context_entity_id"] == "automation.alarm"
+            assert results[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+    assert len(context_rows_stmt_mock.mock_calls) == 1
+
+
+async def test_get_events_context_rows_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the rows contexts originate from are selected within the bind limit."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    for context_id, entity_id, state in (
+        ("01GTDGKBCH00GW0X476W5TVAAA", "automation.alarm", STATE_ON),
+        ("01GTDGKBCH00GW0X476W5TVBBB", "automation.sunset", STATE_OFF),
+    ):
+        context = ha.Context(id=context_id)
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_TRIGGERED,
+            {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: entity_id},
+            context=context,
+        )
+        await hass.async_block_till_done()
+        hass.states.async_set("light.kitchen", state, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 2),
+        patch(
+            "homeassistant.components.logbook.processor.context_rows_stmt",
+            wraps=logbook.processor.context_rows_stmt,
+        ) as context_rows_stmt_mock,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+
+    assert response["success"]
+    results = response["result"]
+    assert [result["context_entity_id"] for result in results] == [
+        "automation.alarm",
+        "automation.sunset",
+    ]
+    # The contexts of the three light.kitchen states are selected one at a time
+    assert [len(call.args[0]) for call in context_rows_stmt_mock.mock_calls] == [
+        1,
+        1,
+        1,
+    ]
+
+
 async def test_logbook_with_empty_config(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1741,6 +1741,66 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.processor.EVENTS_CHUNK_SIZE", 2)
+async def test_logbook_stream_past_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are streamed in chunks."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_OFF)
+    states: list[State] = []
+    for light_state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.small", light_state)
+        states.append(hass.states.get("light.small"))
+    await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    events = [
+        {
+            "entity_id": "light.small",
+            "state": state.state,
+            "when": state.last_updated_timestamp,
+        }
+        for state in states
+    ]
+    for chunk in (events[0:2], events[2:4]):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["events"] == chunk
+        assert msg["event"]["partial"] is True
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["events"] == events[4:]
+    assert "partial" not in msg["event"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -25,6 +25,8 @@ from homeassistant.components.mqtt.client import (
     _LOGGER as CLIENT_LOGGER,
     RECONNECT_INTERVAL_SECONDS,
     EnsureJobAfterCooldown,
+    Subscription,
+    WildcardSubscriptions,
 )
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
@@ -1349,6 +1351,71 @@ async def test_subscribe_topic_level_wildcard_and_wildcard_level_no_match(
     assert len(recorded_calls) == 0
 
 
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("+", "test", True),
+        ("+", "test/topic", False),
+        ("+", "/test", False),
+        ("+/+", "/test", True),
+        ("test/+", "test", False),
+        ("test/+", "test/", True),
+        ("test/+/state", "test/light/state", True),
+        ("test/+/state", "test/light/attr/state", False),
+        ("#", "test/topic", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("test/#", "test", True),
+        ("test/#", "test/a/b/c", True),
+        ("test/#", "other/test", False),
+        ("test/+/#", "test/light", True),
+        ("test/+/#", "test", False),
+        ("+/+/#", "a/b/c/d", True),
+    ],
+)
+def test_wildcard_subscriptions_match(
+    topic_filter: str, topic: str, matches: bool
+) -> None:
+    """Test matching topics against wildcard subscriptions."""
+    subscriptions = WildcardSubscriptions()
+    subscription = Subscription(topic_filter, False, Mock())
+    subscriptions.add(subscription)
+
+    assert subscriptions.match(topic) == ([subscription] if matches else [])
+
+
+def test_wildcard_subscriptions_add_remove() -> None:
+    """Test adding and removing wildcard subscriptions."""
+    subscriptions = WildcardSubscriptions()
+    sub_level = Subscription("test/+/state", False, Mock())
+    sub_level_other = Subscription("test/+/state", False, Mock(), 1)
+    sub_tree = Subscription("test/#", False, Mock())
+    for subscription in (sub_level, sub_level_other, sub_tree):
+        subscriptions.add(subscription)
+
+    assert set(subscriptions) == {sub_level, sub_level_other, sub_tree}
+    assert set(subscriptions.match("test/light/state")) == {
+        sub_level,
+        sub_level_other,
+        sub_tree,
+    }
+    assert subscriptions.has_topic("test/+/state")
+    assert not subscriptions.has_topic("test/+")
+
+    subscriptions.remove(sub_level)
+    assert set(subscriptions.match("test/light/state")) == {sub_level_other, sub_tree}
+    with pytest.raises(KeyError):
+        subscriptions.remove(sub_level)
+
+    subscriptions.remove(sub_level_other)
+    assert not subscriptions.has_topic("test/+/state")
+    subscriptions.remove(sub_tree)
+    assert list(subscriptions) == []
+    # Empty topic levels are pruned
+    assert not subscriptions._root.children
+
+
 async def test_subscribe_topic_level_wildcard_and_wildcard_no_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from copy import copy
 from datetime import datetime, timedelta
 import json
@@ -418,6 +419,59 @@ async def test_get_last_state_changes(hass: HomeAssistant) -> None:
     assert_multiple_states_equal_without_context(states, hist[entity_id])
 
 
+async def test_get_last_state_changes_for_entities(hass: HomeAssistant) -> None:
+    """Test the last state changes of multiple entities."""
+    entity_ids = ["sensor.test1", "sensor.test2", "sensor.test3"]
+    start = dt_util.utcnow() - timedelta(minutes=5)
+    states: dict[str, list[State]] = {entity_id: [] for entity_id in entity_ids}
+
+    with freeze_time(start) as freezer:
+        for idx in range(4):
+            freezer.tick(timedelta(minutes=1))
+            for entity_id in entity_ids[: idx + 1]:
+                hass.states.async_set(entity_id, str(idx))
+                states[entity_id].append(hass.states.get(entity_id))
+    await async_wait_recording_done(hass)
+
+    hist = history.get_last_state_changes_for_entities(
+        hass, 2, [*entity_ids, "sensor.nonexistent"]
+    )
+
+    assert list(hist) == entity_ids
+    for entity_id in entity_ids:
+        assert_multiple_states_equal_without_context(
+            states[entity_id][-2:], hist[entity_id]
+        )
+        assert [state.as_dict() for state in hist[entity_id]] == [
+            state.as_dict()
+            for state in history.get_last_state_changes(hass, 2, entity_id)[entity_id]
+        ]
+
+
+async def test_async_get_last_state_changes_merged(hass: HomeAssistant) -> None:
+    """Test requests for the last state changes made at once are merged."""
+    entity_ids = ["sensor.test1", "sensor.test2"]
+    for state in ("1", "2", "3"):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, state)
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.get_last_state_changes_for_entities",
+        wraps=history.get_last_state_changes_for_entities,
+    ) as get_last_state_changes_for_entities_mock:
+        hist1, hist2, hist_nonexistent = await asyncio.gather(
+            history.async_get_last_state_changes(hass, 2, "sensor.test1"),
+            history.async_get_last_state_changes(hass, 2, "sensor.test2"),
+            history.async_get_last_state_changes(hass, 2, "sensor.nonexistent"),
+        )
+
+    assert len(get_last_state_changes_for_entities_mock.mock_calls) == 1
+    assert [state.state for state in hist1["sensor.test1"]] == ["2", "3"]
+    assert [state.state for state in hist2["sensor.test2"]] == ["2", "3"]
+    assert hist_nonexistent == {}
+
+
 async def test_get_last_state_changes_last_reported(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,207 @@
+"""The tests for the recorder history cache."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import product
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.history_cache import (
+    CachedStateRow,
+    StatesHistoryCache,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def _as_dicts(
+    result: dict[str, list[State | dict[str, Any]]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Convert history results to comparable dicts."""
+    return {
+        entity_id: [
+            state.as_dict() if isinstance(state, State) else state for state in states
+        ]
+        for entity_id, states in result.items()
+    }
+
+
+def test_cache_rows() -> None:
+    """Test the rows returned by the cache."""
+    cache = StatesHistoryCache(10)
+    cache.add("sensor.test", "1", 10.0, None, "{}")
+    cache.add("sensor.test", "1", 20.0, 10.0, '{"a":1}')
+    cache.add("sensor.test", "2", 30.0, None, '{"a":1}')
+
+    assert cache.get_rows("sensor.other", 0, 15, None, True, False, True, False) is None
+    # The state at the start time is not known
+    assert cache.get_rows("sensor.test", 0, 10, None, True, False, True, False) is None
+
+    assert cache.get_rows("sensor.test", 0, 15, None, True, False, True, False) == [
+        CachedStateRow(0, "1", 0, 0, "{}"),
+        CachedStateRow(0, "1", 20.0, 10.0, '{"a":1}'),
+        CachedStateRow(0, "2", 30.0, None, '{"a":1}'),
+    ]
+    assert (
+        cache.get_rows("sensor.test", 1, 15, 30, False, True, False, True)
+        == [
+            # Attribute only changes are not significant and
+            # the end time is not included
+        ]
+    )
+    assert cache.get_rows("sensor.test", 1, 20, None, False, True, False, True) == [
+        CachedStateRow(1, "2", 30.0, None, None),
+    ]
+
+
+def test_cache_trim_and_evict() -> None:
+    """Test the cache is bounded and can be evicted."""
+    cache = StatesHistoryCache(2)
+    for idx in range(4):
+        cache.add("sensor.test", str(idx), float(idx), None, "{}")
+    # Trimmed to the newest 2 states once twice the size is reached
+    assert cache.get_rows("sensor.test", 0, 1.5, None, True, False, True, True) is None
+    assert cache.get_rows("sensor.test", 0, 2.5, None, True, False, True, True) == [
+        CachedStateRow(0, "2", 0, 0, None),
+        CachedStateRow(0, "3", 3.0, None, None),
+    ]
+
+    cache.add("sensor.other", "on", 1.0, None, "{}")
+    cache.evict_before(3.0)
+    assert cache.get_rows("sensor.other", 0, 5, None, True, False, True, True) is None
+    assert cache.get_rows("sensor.test", 0, 5, None, True, False, True, True) == [
+        CachedStateRow(0, "3", 0, 0, None),
+    ]
+
+    cache.add("sensor.other", "on", 4.0, None, "{}")
+    cache.evict_matching(lambda entity_id: entity_id == "sensor.test")
+    assert cache.get_rows("sensor.test", 0, 5, None, True, False, True, True) is None
+    assert cache.get_rows("sensor.other", 0, 5, None, True, False, True, True)
+
+    cache.evict_entities(["sensor.other"])
+    assert cache.get_rows("sensor.other", 0, 5, None, True, False, True, True) is None
+
+    cache.add("sensor.other", "on", 5.0, None, "{}")
+    cache.clear()
+    assert cache.get_rows("sensor.other", 0, 6, None, True, False, True, True) is None
+
+
+def test_cache_clock_going_backwards() -> None:
+    """Test states older than the newest cached state are not served."""
+    cache = StatesHistoryCache(10)
+    cache.add("sensor.test", "1", 10.0, None, "{}")
+    cache.add("sensor.test", "2", 5.0, None, "{}")
+    cache.add("sensor.test", "3", 7.0, None, "{}")
+    assert cache.get_rows("sensor.test", 0, 8, None, True, False, True, True) is None
+    cache.add("sensor.test", "4", 11.0, None, "{}")
+    assert cache.get_rows("sensor.test", 0, 12, None, True, False, True, True) == [
+        CachedStateRow(0, "4", 0, 0, None),
+    ]
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 100}])
+async def test_get_significant_states_from_cache(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test history served from the cache matches the database."""
+    assert recorder_mock.states_history_cache is not None
+    entity_ids = ["sensor.test", "climate.test", "sensor.removed", "sensor.old"]
+
+    freezer.tick(1)
+    hass.states.async_set("sensor.old", "on")
+    hass.states.async_set("sensor.test", "1", {"unit": "W"})
+    hass.states.async_set("climate.test", "heat", {"temperature": 20})
+    hass.states.async_set("sensor.removed", "on")
+    await async_wait_recording_done(hass)
+    freezer.tick(1)
+    start = dt_util.utcnow()
+    freezer.tick(1)
+    hass.states.async_set("sensor.test", "1", {"unit": "kW"})
+    hass.states.async_set("climate.test", "heat", {"temperature": 21})
+    hass.states.async_remove("sensor.removed")
+    freezer.tick(1)
+    hass.states.async_set("sensor.test", "2", {"unit": "kW"})
+    hass.states.async_set("climate.test", "cool", {"temperature": 21})
+    freezer.tick(1)
+    end = dt_util.utcnow()
+    freezer.tick(1)
+    hass.states.async_set("sensor.test", "3", {"unit": "kW"})
+    await async_wait_recording_done(hass)
+    # The state of sensor.old at the start time is not cached
+    recorder_mock.states_history_cache.evict_entities(["sensor.old"])
+
+    for (
+        end_time,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    ) in product((None, end), *([(True, False)] * 5)):
+        kwargs = {
+            "end_time": end_time,
+            "entity_ids": entity_ids,
+            "include_start_time_state": include_start_time_state,
+            "significant_changes_only": significant_changes_only,
+            "minimal_response": minimal_response,
+            "no_attributes": no_attributes,
+            "compressed_state_format": compressed_state_format,
+        }
+        with session_scope(hass=hass, read_only=True) as session:
+            with patch(
+                "homeassistant.components.recorder.history.modern._get_significant_states_from_db",
+                wraps=history.modern._get_significant_states_from_db,
+            ) as db_mock:
+                cached = history.get_significant_states_with_session(
+                    hass, session, start, **kwargs
+                )
+            # Only the entity missing from the cache is queried
+            assert db_mock.call_count == 1
+            assert db_mock.call_args[0][5] == ["sensor.old"]
+            with patch.object(recorder_mock, "states_history_cache", None):
+                from_db = history.get_significant_states_with_session(
+                    hass, session, start, **kwargs
+                )
+        assert "sensor.test" in cached
+        assert list(cached) == list(from_db)
+        assert _as_dicts(cached) == _as_dicts(from_db)
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_size": 100}])
+async def test_history_cache_cleared_on_rename(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the cache forgets entities that are renamed."""
+    assert recorder_mock.states_history_cache is not None
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    start = dt_util.utcnow() + timedelta(seconds=1)
+    assert recorder_mock.states_history_cache.get_rows(
+        "sensor.test", 0, start.timestamp(), None, True, False, True, True
+    )
+
+    recorder_mock.async_update_states_metadata("sensor.test", "sensor.renamed")
+    await async_wait_recording_done(hass)
+    assert (
+        recorder_mock.states_history_cache.get_rows(
+            "sensor.test", 0, start.timestamp(), None, True, False, True, True
+        )
+        is None
+    )
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm.session import Session
 from sqlalchemy.pool import QueuePool
 from typing_extensions import Generator
 
@@ -28,6 +29,7 @@ from homeassistant.components.recorder import (
     DOMAIN,
     SQLITE_URL_PREFIX,
     Recorder,
+    bulk_insert,
     db_schema,
     get_instance,
     migration,
@@ -399,19 +401,17 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    original_insert_rows = bulk_insert._insert_rows
+
+    def _throw_if_inserting_states(session: Session, rows: list[Any]) -> None:
+        if isinstance(rows[0], States):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        original_insert_rows(session, rows)
 
     with (
         patch("time.sleep"),
         patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+            bulk_insert, "_insert_rows", side_effect=_throw_if_inserting_states
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -442,19 +442,17 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    original_insert_rows = bulk_insert._insert_rows
+
+    def _throw_if_inserting_states(session: Session, rows: list[Any]) -> None:
+        if isinstance(rows[0], States):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        original_insert_rows(session, rows)
 
     with (
         patch("time.sleep"),
         patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+            bulk_insert, "_insert_rows", side_effect=_throw_if_inserting_states
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -1471,6 +1469,77 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 30}])
+@pytest.mark.parametrize("executemany_returning", [True, False])
+async def test_saving_sets_old_state_in_one_commit(
+    hass: HomeAssistant, recorder_mock: Recorder, executemany_returning: bool
+) -> None:
+    """Test saving sets old state when an entity changes many times per commit."""
+    assert recorder_mock.engine is not None
+    with patch.object(
+        recorder_mock.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        executemany_returning,
+    ):
+        hass.states.async_set("test.one", "s1", {"attr": 1})
+        hass.states.async_set("test.two", "s2", {"attr": 1})
+        hass.states.async_set("test.one", "s3", {"attr": 2})
+        hass.states.async_set("test.one", "s4", {"attr": 1})
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes,
+                States.attributes_id == StateAttributes.attributes_id,
+            )
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+
+        assert states_by_state["s1"].shared_attrs == '{"attr":1}'
+        assert states_by_state["s2"].shared_attrs == '{"attr":1}'
+        assert states_by_state["s3"].shared_attrs == '{"attr":2}'
+        assert states_by_state["s4"].shared_attrs == '{"attr":1}'
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+
+    hass.states.async_set("test.one", "s5", {"attr": 2})
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        state = (
+            session.query(States.old_state_id, States.attributes_id)
+            .filter(States.state == "s5")
+            .one()
+        )
+        assert state.old_state_id == states_by_state["s4"].state_id
+        assert (
+            session.query(StateAttributes.shared_attrs)
+            .filter(StateAttributes.attributes_id == state.attributes_id)
+            .scalar()
+            == '{"attr":2}'
+        )
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
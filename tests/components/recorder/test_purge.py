@@ -330,6 +330,37 @@ async def test_purge_old_events(
         assert events.count() == 2
 
 
+async def test_purge_old_events_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge returns once its time budget is used up."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass)
+
+    with (
+        session_scope(hass=hass) as session,
+        patch.object(instance, "max_bind_vars", 1),
+        patch("homeassistant.components.recorder.purge.PURGE_SLICE_SECONDS", 0),
+    ):
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+        )
+        assert events.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        # Only one batch of one event fits in the time budget
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert events.count() == 5
+        assert instance.metrics.purge_remaining_seconds > 0
+
+        for _ in range(3):
+            purge_old_data(instance, purge_before, repack=False)
+        assert events.count() == 2
+
+
 async def test_purge_old_recorder_runs(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
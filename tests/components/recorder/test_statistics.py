@@ -1,10 +1,11 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
@@ -374,6 +375,30 @@ async def test_compile_periodic_statistics_exception(
     }
 
 
+async def test_compile_periodic_statistics_insert_exception(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    mock_sensor_statistics,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the statistic ids are logged when inserting statistics fails."""
+    await async_setup_component(hass, "sensor", {})
+
+    now = dt_util.utcnow()
+    with patch.object(
+        statistics, "insert_statistics", side_effect=SQLAlchemyError("failed")
+    ):
+        do_adhoc_statistics(hass, start=now)
+        await async_wait_recording_done(hass)
+
+    assert (
+        "Unexpected exception when inserting statistics for "
+        f"{process_timestamp(now)}-{process_timestamp(now + timedelta(minutes=5))} "
+        "of sensor.test1, sensor.test2, sensor.test3"
+    ) in caplog.text
+    assert statistics_during_period(hass, now, period="5minute") == {}
+
+
 async def test_rename_entity(
     hass: HomeAssistant, entity_registry: er.EntityRegistry, setup_recorder: None
 ) -> None:
@@ -1824,6 +1849,166 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2021-12-15 00:00:00+00:00")
+async def test_monthly_statistics_cached(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test statistics of months which have ended are reduced once."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    statistic_id = "test:total_energy_import"
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [
+            {
+                "start": datetime(2021, month, 15, tzinfo=dt_util.UTC),
+                "last_reset": None,
+                "state": month,
+                "sum": month,
+            }
+            for month in (9, 10, 11)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    def monthly_sums() -> list[float]:
+        stats = statistics_during_period(
+            hass,
+            datetime(2021, 9, 1, tzinfo=dt_util.UTC),
+            period="month",
+            statistic_ids={statistic_id},
+            types={"sum"},
+        )
+        return [row["sum"] for row in stats[statistic_id]]
+
+    with patch.object(
+        statistics,
+        "_sorted_statistics_to_dict",
+        wraps=statistics._sorted_statistics_to_dict,
+    ) as sorted_statistics_mock:
+        assert monthly_sums() == [9, 10, 11]
+        assert sorted_statistics_mock.call_count == 1
+        assert monthly_sums() == [9, 10, 11]
+        assert sorted_statistics_mock.call_count == 1
+
+        recorder.get_instance(hass).async_adjust_statistics(
+            statistic_id, datetime(2021, 10, 15, tzinfo=dt_util.UTC), 100, "kWh"
+        )
+        await async_wait_recording_done(hass)
+        assert monthly_sums() == [9, 110, 111]
+        assert sorted_statistics_mock.call_count == 2
+
+        async_add_external_statistics(
+            hass,
+            external_metadata,
+            [
+                {
+                    "start": datetime(2021, 9, 15, tzinfo=dt_util.UTC),
+                    "last_reset": None,
+                    "state": 9,
+                    "sum": 5,
+                }
+            ],
+        )
+        await async_wait_recording_done(hass)
+        assert monthly_sums() == [5, 110, 111]
+        assert sorted_statistics_mock.call_count == 3
+
+
+@pytest.mark.freeze_time("2021-12-15 00:00:00+00:00")
+@pytest.mark.parametrize("period", ["day", "week"])
+async def test_reduced_statistics_cached_unaligned(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    period: str,
+) -> None:
+    """Test queries not starting or ending at a period start are repeatable."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    statistic_id = "test:total_energy_import"
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+    first_start = datetime(2021, 11, 20, tzinfo=dt_util.UTC)
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [
+            {
+                "start": first_start + timedelta(hours=6 * idx),
+                "last_reset": None,
+                "state": idx,
+                "sum": idx,
+            }
+            for idx in range(4 * 24)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    def reduced_sums(
+        start_time: datetime, end_time: datetime | None = None
+    ) -> list[tuple[float, float]]:
+        stats = statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            period=period,
+            statistic_ids={statistic_id},
+            types={"sum"},
+        )
+        return [(row["start"], row["sum"]) for row in stats[statistic_id]]
+
+    def cached_reduced_sums(
+        start_time: datetime, end_time: datetime | None = None
+    ) -> list[tuple[float, float]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            metadata = recorder.get_instance(hass).statistics_meta_manager.get_many(
+                session, statistic_ids={statistic_id}
+            )
+            stats = statistics._reduced_statistics_during_period(
+                hass, session, start_time, end_time, {statistic_id}, metadata, period
+            )
+        return [(row["start"], row["sum"]) for row in stats[statistic_id]]
+
+    unaligned_start = datetime(2021, 12, 1, 12, tzinfo=dt_util.UTC)
+    unaligned_end = datetime(2021, 12, 8, 12, tzinfo=dt_util.UTC)
+    rows = reduced_sums(unaligned_start, unaligned_end)
+    assert reduced_sums(unaligned_start, unaligned_end) == rows
+    rows = reduced_sums(unaligned_start)
+    assert reduced_sums(unaligned_start) == rows
+
+    # The first period is reduced from the statistics after the start
+    rows = cached_reduced_sums(unaligned_start)
+    assert rows[0][0] < unaligned_start.timestamp()
+    assert cached_reduced_sums(unaligned_start) == rows
+
+    # The last period is reduced from the statistics before the end
+    aligned_start = datetime(2021, 11, 22, tzinfo=dt_util.UTC)
+    rows_until_end = cached_reduced_sums(aligned_start, unaligned_end)
+    assert cached_reduced_sums(aligned_start, unaligned_end) == rows_until_end
+    rows = cached_reduced_sums(aligned_start)
+    assert cached_reduced_sums(aligned_start) == rows
+    assert len({start for start, _ in rows}) == len(rows)
+    assert rows_until_end[:-1] == rows[: len(rows_until_end) - 1]
+    assert rows_until_end[-1][0] == rows[len(rows_until_end) - 1][0]
+    assert rows_until_end[-1][1] < rows[len(rows_until_end) - 1][1]
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -32,6 +32,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2437,6 +2438,53 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_metrics(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting recorder metrics."""
+    client = await hass_ws_client()
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "W"})
+    hass.bus.async_fire("custom_event", {"data": 1})
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    metrics = response["result"]
+    assert metrics["backlog"] == 0
+    assert metrics["pending_events"] == 0
+    assert metrics["commits"] >= 1
+    assert metrics["committed_events"] >= 3
+    assert metrics["max_commit_events"] >= metrics["last_commit_events"]
+    assert metrics["average_commit_duration"] > 0
+    assert metrics["state_processing_time"] > 0
+    assert metrics["event_processing_time"] > 0
+    assert metrics["commit_duration_histogram"]["buckets"][-1] is None
+    assert sum(metrics["commit_duration_histogram"]["counts"]) == metrics["commits"]
+    assert metrics["state_attributes_cache_hits"] >= 1
+    assert 0 < metrics["state_attributes_cache_hit_rate"] <= 1
+    assert metrics["purged_rows"] == 0
+    assert metrics["purged_rows_per_second"] is None
+    assert metrics["purge_slices"] == 0
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_purge_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    metrics = response["result"]
+    assert metrics["purged_rows"] >= 3
+    assert metrics["purged_rows_per_second"] > 0
+    assert metrics["purge_slices"] >= 1
+    assert metrics["purge_in_progress"] is False
+    assert metrics["purge_remaining_seconds"] is None
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 import math
+import random
 from statistics import mean
 from typing import Literal
 from unittest.mock import patch
@@ -34,7 +35,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -5265,3 +5271,47 @@ async def test_exclude_attributes(hass: HomeAssistant) -> None:
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+def _time_weighted_average_per_state(
+    values: list[float],
+    last_updated: list[datetime],
+    start: datetime,
+    end: datetime,
+) -> float:
+    """Calculate a time weighted average one state change at a time."""
+    old_value: float | None = None
+    old_start_time: datetime | None = None
+    accumulated = 0.0
+    for value, updated in zip(values, last_updated, strict=True):
+        start_time = start if updated < start else updated
+        if old_start_time is None:
+            start = start_time
+        else:
+            assert old_value is not None
+            accumulated += old_value * (start_time - old_start_time).total_seconds()
+        old_value = value
+        old_start_time = start_time
+    assert old_value is not None and old_start_time is not None
+    accumulated += old_value * (end - old_start_time).total_seconds()
+    if (period_seconds := (end - start).total_seconds()) == 0:
+        return 0.0
+    return accumulated / period_seconds
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_time_weighted_average_matches_per_state(seed: int) -> None:
+    """Test the time weighted average is identical to averaging per state."""
+    rng = random.Random(seed)
+    start = dt_util.utcnow().replace(second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+    for _ in range(200):
+        count = rng.randint(1, 20)
+        last_updated = sorted(
+            start + timedelta(microseconds=rng.randint(-300_000_000, 300_000_000 - 1))
+            for _ in range(count)
+        )
+        values = [rng.uniform(-1e6, 1e6) / rng.choice((1, 3, 7)) for _ in range(count)]
+        assert sensor_recorder._time_weighted_average(
+            values, last_updated, start, end
+        ) == _time_weighted_average_per_state(values, last_updated, start, end)
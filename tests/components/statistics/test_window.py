@@ -0,0 +1,89 @@
+"""The tests for the statistics sample window."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+from homeassistant.util import dt as dt_util
+
+
+def _assert_matches_recomputation(window: SampleWindow, percentile: int) -> None:
+    """Assert the window aggregates match computing them over all samples."""
+    states = list(window.states)
+    ages = list(window.ages)
+    approx = pytest.approx
+    assert window.sum == approx(sum(states))
+    assert window.mean() == approx(statistics.mean(states))
+    assert window.sin_sum == approx(
+        sum(math.sin(math.radians(x)) for x in states), abs=1e-9
+    )
+    assert window.cos_sum == approx(
+        sum(math.cos(math.radians(x)) for x in states), abs=1e-9
+    )
+    assert window.value_max() == max(states)
+    assert window.value_min() == min(states)
+    assert window.max_index() == states.index(max(states))
+    assert window.min_index() == states.index(min(states))
+    assert window.median() == statistics.median(states)
+    if len(states) < 2:
+        return
+    assert window.variance() == approx(statistics.variance(states))
+    assert (
+        window.percentile(percentile)
+        == statistics.quantiles(states, n=100, method="exclusive")[percentile - 1]
+    )
+    assert window.sum_differences == approx(
+        sum(abs(j - i) for i, j in zip(states, states[1:], strict=False))
+    )
+    assert window.sum_differences_nonnegative == approx(
+        sum(j - i if j >= i else j for i, j in zip(states, states[1:], strict=False))
+    )
+    assert window.step_area == approx(
+        sum(
+            states[i - 1] * (ages[i] - ages[i - 1]).total_seconds()
+            for i in range(1, len(states))
+        )
+    )
+    assert window.linear_area == approx(
+        sum(
+            0.5 * (states[i] + states[i - 1]) * (ages[i] - ages[i - 1]).total_seconds()
+            for i in range(1, len(states))
+        )
+    )
+
+
+@pytest.mark.parametrize("maxlen", [None, 1, 2, 20])
+def test_window_matches_recomputation(maxlen: int | None) -> None:
+    """Test the incremental aggregates while samples are added and removed."""
+    rng = random.Random(maxlen)
+    window = SampleWindow(maxlen, track_extremes=True, track_order=True)
+    age: datetime = dt_util.utcnow()
+    for _ in range(200):
+        age += timedelta(seconds=rng.randint(1, 10))
+        # Repeated values check the oldest extreme is found
+        window.append(float(rng.randint(-50, 50)) / rng.choice((1, 3)), age)
+        if maxlen is None and rng.random() < 0.4:
+            window.popleft()
+        if window.states:
+            _assert_matches_recomputation(window, rng.randint(1, 99))
+
+
+def test_window_non_finite_values() -> None:
+    """Test the aggregates recover once a non finite sample is removed."""
+    window = SampleWindow(None, track_extremes=True, track_order=True)
+    age = dt_util.utcnow()
+    for value in (1.0, math.nan, math.inf, 2.0, 3.0):
+        age += timedelta(seconds=1)
+        window.append(value, age)
+    assert math.isnan(window.sum)
+
+    window.popleft()
+    window.popleft()
+    window.popleft()
+    _assert_matches_recomputation(window, 50)
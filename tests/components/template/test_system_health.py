@@ -0,0 +1,31 @@
+"""Test template system health."""
+
+from homeassistant.components.template.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_get_template_render_cache
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_template_system_health(hass: HomeAssistant) -> None:
+    """Test template system health reports the render cache stats."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info == {
+        "render_cache_hits": 0,
+        "render_cache_misses": 0,
+        "render_cache_hit_rate": None,
+        "render_cache_size": 0,
+    }
+
+    cache = async_get_template_render_cache(hass)
+    cache.hits = 3
+    cache.misses = 1
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["render_cache_hits"] == 3
+    assert info["render_cache_misses"] == 1
+    assert info["render_cache_hit_rate"] == "75.0%"
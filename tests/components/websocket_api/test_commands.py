@@ -1261,6 +1261,44 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_share_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities subscriptions share one state changed listener."""
+    init_count = sum(hass.bus.async_listeners().values())
+    hass.states.async_set("light.permitted", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+    for msg_id in (7, 7, 8, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    received = []
+    for _ in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+        received.append((msg["id"], *msg["event"]))
+    assert sorted(received) == [(7, "a"), (7, "c"), (8, "c")]
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+import json
 from typing import Any, cast
 from unittest.mock import patch
 
@@ -16,10 +17,15 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -433,6 +439,50 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+@pytest.mark.usefixtures("socket_enabled")
+async def test_compressed_coalesced_burst(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test a burst of messages is sent as one compressed frame."""
+
+    @callback
+    @websocket_command({"type": "burst"})
+    def burst_handler(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        for idx in range(50):
+            connection.send_event(msg["id"], {"idx": idx})
+
+    assert await async_setup_component(hass, "websocket_api", {})
+    async_register_command(hass, burst_handler)
+    client = await aiohttp_client(hass.http.app)
+    websocket = await client.ws_connect(const.URL, compress=15)
+    # permessage-deflate was negotiated with context takeover
+    assert websocket.compress == 15
+    assert (await websocket.receive_json())["type"] == "auth_required"
+    await websocket.send_json({"type": "auth", "access_token": hass_access_token})
+    assert (await websocket.receive_json())["type"] == "auth_ok"
+    await websocket.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket.receive_json())["success"] is True
+
+    await websocket.send_json({"id": 2, "type": "burst"})
+    msg = await websocket.receive()
+    assert msg.type is WSMsgType.TEXT
+    messages = json.loads(msg.data)
+    assert len(messages) == 51
+    assert messages[-1] == {"id": 2, "type": "event", "event": {"idx": 49}}
+    await websocket.close()
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -505,3 +555,48 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_merge_state_diffs_when_behind(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test state diffs of an entity are merged once the client falls behind."""
+    hass.states.async_set("light.permanent", "off", {"color": "red"})
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 1, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.permanent"]["s"] == "off"
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_MERGE_STATE_DIFFS", 0
+    ):
+        hass.states.async_set("light.permanent", "on", {"color": "red"})
+        hass.states.async_set("light.permanent", "on", {"color": "blue"})
+        hass.states.async_set("light.added", "on")
+        hass.states.async_set("light.added", "off")
+        hass.states.async_set("light.transient", "on")
+        hass.states.async_remove("light.transient")
+        await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permanent": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": msg["event"]["c"]["light.permanent"]["+"]["c"],
+                    "lc": msg["event"]["c"]["light.permanent"]["+"]["lc"],
+                    "s": "on",
+                }
+            }
+        }
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.added"]["s"] == "off"
+
+    hass.states.async_set("light.permanent", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.permanent"]["+"]["s"] == "off"
@@ -2640,3 +2640,47 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_track_dirty_attributes(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the state attributes are reused until an _attr_ property changes."""
+
+    class TrackedEntity(entity.Entity):
+        """An entity which tracks changes of its state attributes."""
+
+        _track_dirty_attributes = True
+        _attr_should_poll = False
+        _attr_unique_id = "tracked"
+
+    platform = MockEntityPlatform(hass)
+    ent = TrackedEntity()
+    ent._attr_extra_state_attributes = {"level": 1}
+    await platform.async_add_entities([ent])
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {"level": 1}
+
+    ent._attr_state = "changed"
+    ent.async_write_ha_state()
+    new_state = hass.states.get(ent.entity_id)
+    assert new_state.state == "changed"
+    assert new_state.attributes is state.attributes
+
+    ent._attr_extra_state_attributes = {"level": 2}
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {"level": 2}
+
+    entity_registry.async_update_entity(ent.entity_id, icon="mdi:icon")
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).attributes == {
+        "icon": "mdi:icon",
+        "level": 2,
+    }
+
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == STATE_UNAVAILABLE
+    assert state.attributes == {"icon": "mdi:icon"}
@@ -9,7 +9,11 @@ from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+)
 from homeassistant.core import (
     CoreState,
     HomeAssistant,
@@ -44,6 +48,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_platform,
     mock_registry,
@@ -1779,6 +1784,52 @@ async def test_invalid_entity_id(
     assert entity2.platform is not None
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the state of multiple entities at once."""
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(entity_id="test.one")
+    entity2 = MockEntity(entity_id="test.two")
+    await platform.async_add_entities([entity1, entity2])
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    entity1._attr_state = "off"
+    entity2._attr_state = "on"
+    platform.async_write_ha_states([entity1, entity2])
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.one").state == "off"
+    assert hass.states.get("test.two").state == "on"
+    assert [event.data["entity_id"] for event in events] == ["test.one", "test.two"]
+    assert (
+        events[0].data["new_state"].last_updated
+        == events[1].data["new_state"].last_updated
+    )
+
+    # Nothing to write
+    platform.async_write_ha_states([])
+    await hass.async_block_till_done()
+    assert len(events) == 2
+
+
+async def test_async_write_ha_states_invalid_state(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test writing multiple states falls back if one of the states is invalid."""
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(entity_id="test.one")
+    entity2 = MockEntity(entity_id="test.two")
+    await platform.async_add_entities([entity1, entity2])
+
+    entity1._attr_state = "off"
+    entity2._attr_state = "x" * 256
+    platform.async_write_ha_states([entity1, entity2])
+    await hass.async_block_till_done()
+
+    assert hass.states.get("test.one").state == "off"
+    assert hass.states.get("test.two").state == "unknown"
+    assert "Failed to set state for test.two, fall back to unknown" in caplog.text
+
+
 class MockBlockingEntity(MockEntity):
     """Class to mock an entity that will block adding entities."""
 
@@ -4,7 +4,8 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
-from unittest.mock import patch
+import logging
+from unittest.mock import Mock, patch
 
 from astral import LocationInfo
 import astral.sun
@@ -17,6 +18,7 @@ from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import area_registry as ar, entity_registry as er
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
@@ -24,6 +26,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_cache,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -1060,6 +1063,118 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_render_cache(hass: HomeAssistant) -> None:
+    """Test identical tracked templates share their renders."""
+    render_cache = async_get_template_render_cache(hass)
+    runs: list[list[str]] = [[], [], [], []]
+
+    def _run_callback(idx: int) -> Callable[..., None]:
+        def _callback(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            runs[idx].append(updates.pop().result)
+
+        return _callback
+
+    hass.states.async_set("sensor.test", "1")
+    template_str = "{{ states('sensor.test') | int + offset }}"
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), {"offset": offset})],
+            _run_callback(idx),
+        )
+        for idx, offset in enumerate((1, 1, 2))
+    ]
+    time_info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ now() and states('sensor.test') }}", hass), None)],
+        _run_callback(3),
+    )
+    await hass.async_block_till_done()
+    # Templates are always rendered when the tracking starts
+    assert render_cache.get_stats() == {
+        "hits": 0,
+        "misses": 4,
+        "hit_rate": 0.0,
+        "size": 2,
+    }
+
+    hass.states.async_set("sensor.test", "2")
+    await hass.async_block_till_done()
+    assert runs[:3] == [[3], [3], [4]]
+    assert render_cache.hits == 1
+    assert render_cache.misses == 7
+
+    # Attributes changes are new states and render again
+    hass.states.async_set("sensor.test", "2", {"unit": "W"})
+    await hass.async_block_till_done()
+    assert render_cache.hits == 2
+    assert render_cache.misses == 10
+
+    # Forced refreshes always render
+    infos[0].async_refresh()
+    assert render_cache.misses == 11
+    assert runs[:3] == [[3], [3], [4]]
+
+    for info in (*infos, time_info):
+        info.async_remove()
+    render_cache.async_clear()
+    assert render_cache.get_stats()["size"] == 0
+
+
+async def test_track_template_result_render_cache_invalidation(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test renders using the registries or reading no entity are not reused."""
+    render_cache = async_get_template_render_cache(hass)
+    entity_registry.async_get_or_create("sensor", "test", "1234")
+    hass.states.async_set("sensor.test_1234", "1")
+    template_str = (
+        "{{ states('sensor.test_1234') }} {{ area_name('sensor.test_1234') }}"
+    )
+    track_template = TrackTemplate(Template(template_str, hass), None)
+
+    info = render_cache.async_render_to_info(track_template)
+    assert info.result() == "1 None"
+    assert render_cache.get_stats()["size"] == 1
+
+    area = area_registry.async_create("Kitchen")
+    entity_registry.async_update_entity("sensor.test_1234", area_id=area.id)
+    await hass.async_block_till_done()
+    assert render_cache.get_stats()["size"] == 0
+    info = render_cache.async_render_to_info(track_template)
+    assert info.result() == "1 Kitchen"
+    assert render_cache.misses == 2
+
+    # Renders reading no entity are not cached
+    no_entity_template = TrackTemplate(
+        Template("{{ area_entities('Kitchen') }}", hass), None
+    )
+    info = render_cache.async_render_to_info(no_entity_template)
+    assert info.result() == ["sensor.test_1234"]
+    assert render_cache.get_stats()["size"] == 1
+
+    # A new tracker renders the template and logs its warnings
+    warning_template_str = "{{ states('sensor.test_1234') }}{{ missing }}"
+    render_cache.async_render_to_info(
+        TrackTemplate(Template(warning_template_str, hass), None)
+    )
+    log_fn = Mock()
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template(warning_template_str, hass), None)],
+        Mock(),
+        log_fn=log_fn,
+    )
+    await hass.async_block_till_done()
+    log_fn.assert_called_once_with(logging.WARNING, "'missing' is undefined")
+    info.async_remove()
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
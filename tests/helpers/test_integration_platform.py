@@ -55,6 +55,41 @@ async def test_process_integration_platforms_with_wait(hass: HomeAssistant) -> N
     assert len(processed) == 2
 
 
+async def test_process_integration_platforms_lazy(hass: HomeAssistant) -> None:
+    """Test processing lazy integration platforms does not import them."""
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    processed = []
+
+    @callback
+    def _process_platform(hass, domain, platform):
+        """Process platform."""
+        processed.append((domain, platform))
+
+    with patch.object(loader.Integration, "async_get_platform") as mock_get_platform:
+        await async_process_integration_platforms(
+            hass,
+            "platform_to_check",
+            _process_platform,
+            wait_for_platforms=True,
+            lazy=True,
+        )
+        hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+        await hass.async_block_till_done()
+
+    assert not mock_get_platform.called
+    assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+    assert [domain for domain, _ in processed] == ["loaded", "event"]
+    assert all(isinstance(platform, loader.LazyPlatform) for _, platform in processed)
+    assert await processed[0][1].async_load() == loaded_platform
+    assert await processed[1][1].async_load() == event_platform
+
+
 async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     """Test processing integrations."""
     loaded_platform = Mock()
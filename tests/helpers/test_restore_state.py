@@ -17,6 +17,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_COMPACT_INTERVAL,
+    STORAGE_CHANGES_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -130,7 +132,9 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
     assert mock_write_data.called
+    data.async_restore_entity_added(entity)
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -139,6 +143,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -147,6 +152,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -196,7 +202,9 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
     assert mock_write_data.called
+    data.async_restore_entity_added(entity)
 
+    hass.states.async_set("input_boolean.b1", "on")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -205,6 +213,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -358,6 +367,150 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the changed states are saved between saving all states."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for object_id in ("b1", "b2", "b3", "b4", "b5"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_changed_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 5
+    assert STORAGE_CHANGES_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await entities[1].async_remove()
+    await data.async_dump_changed_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 5
+    changes = hass_storage[STORAGE_CHANGES_KEY]["data"]
+    assert [
+        json_round_trip(item)["state"]["entity_id"] for item in changes["states"]
+    ] == ["input_boolean.b1", "input_boolean.b2"]
+    assert changes["removed"] == {}
+
+    # Nothing changed
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_changed_states()
+    assert not mock_write_data.called
+
+    hass.states.async_remove("input_boolean.b2")
+    data.last_states.pop("input_boolean.b2")
+    await data.async_dump_changed_states()
+    changes = hass_storage[STORAGE_CHANGES_KEY]["data"]
+    assert [
+        json_round_trip(item)["state"]["entity_id"] for item in changes["states"]
+    ] == ["input_boolean.b1"]
+    assert list(changes["removed"]) == ["input_boolean.b2"]
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in data.last_states.items()
+    } == {
+        "input_boolean.b1": "off",
+        "input_boolean.b3": "on",
+        "input_boolean.b4": "on",
+        "input_boolean.b5": "on",
+    }
+
+    # The first dump saves all states and removes the changes
+    await data.async_dump_changed_states()
+    assert STORAGE_CHANGES_KEY not in hass_storage
+
+
+async def test_dump_changed_states_compaction(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test all states are saved again once a day."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for object_id in ("b1", "b2", "b3"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_changed_states()
+    assert STORAGE_CHANGES_KEY in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "on")
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + STATE_COMPACT_INTERVAL,
+    ):
+        await data.async_dump_changed_states()
+    assert STORAGE_CHANGES_KEY not in hass_storage
+    assert [
+        json_round_trip(item)["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    ] == ["on", "on", "on"]
+
+
+async def test_load_outdated_changes(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test changes saved before all states were saved are ignored."""
+    now = dt_util.utcnow()
+    before = now - timedelta(minutes=15)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": json_round_trip(
+            [
+                StoredState(State("input_boolean.b1", "on"), None, now).as_dict(),
+                StoredState(State("input_boolean.b2", "on"), None, now).as_dict(),
+                StoredState(State("input_boolean.b3", "on"), None, before).as_dict(),
+            ]
+        ),
+    }
+    hass_storage[STORAGE_CHANGES_KEY] = {
+        "version": 1,
+        "key": STORAGE_CHANGES_KEY,
+        "data": json_round_trip(
+            {
+                "states": [
+                    StoredState(
+                        State("input_boolean.b1", "off"), None, before
+                    ).as_dict(),
+                    StoredState(State("input_boolean.b4", "off"), None, now).as_dict(),
+                ],
+                "removed": {"input_boolean.b2": before, "input_boolean.b3": now},
+            }
+        ),
+    }
+
+    await async_load(hass)
+    data = async_get(hass)
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in data.last_states.items()
+    } == {
+        "input_boolean.b1": "on",
+        "input_boolean.b2": "on",
+        "input_boolean.b4": "off",
+    }
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -32,6 +32,7 @@ from homeassistant.core import (
     HassJob,
     HomeAssistant,
     ServiceCall,
+    ServiceResponse,
     SupportsResponse,
 )
 from homeassistant.helpers import (
@@ -42,6 +43,7 @@ from homeassistant.helpers import (
     template,
 )
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.trace import TraceElement, trace_stack_cv
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
@@ -723,6 +725,35 @@ async def test_extract_entity_ids_from_devices(
     )
 
 
+async def test_extract_entity_ids_after_registry_update(
+    hass: HomeAssistant, floor_area_mock, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the resolved targets follow updates of the registries."""
+    own_area = ServiceCall("light", "turn_on", {"area_id": "own-area"})
+    test_area = ServiceCall("light", "turn_on", {"area_id": "test-area"})
+    assert await service.async_extract_entity_ids(hass, own_area) == {
+        "light.in_own_area"
+    }
+    assert await service.async_extract_entity_ids(hass, test_area) == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+    index = hass.data[service.DATA_TARGET_INDEX]
+    invalidations = index.invalidations
+
+    entity_registry.async_update_entity("light.in_area", area_id="own-area")
+
+    assert index.invalidations == invalidations + 1
+    assert await service.async_extract_entity_ids(hass, own_area) == {
+        "light.in_own_area",
+        "light.in_area",
+    }
+    assert await service.async_extract_entity_ids(hass, test_area) == {
+        "light.assigned_to_area"
+    }
+    assert index.invalidations == invalidations + 1
+
+
 @pytest.mark.usefixtures("floor_area_mock")
 async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with floors."""
@@ -1451,6 +1482,47 @@ async def test_call_with_omit_entity_id(
     assert len(mock_handle_entity_call.mock_calls) == 0
 
 
+async def test_call_with_platform_deadline(
+    hass: HomeAssistant,
+    mock_entities: dict[str, MockEntity],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an entity missing the deadline of its platform is left behind."""
+    mock_entities["light.kitchen"].platform = Mock(service_call_deadline=0.01)
+    release = asyncio.Event()
+
+    async def mock_service(entity: MockEntity, call: ServiceCall) -> ServiceResponse:
+        if entity.entity_id == "light.kitchen":
+            await release.wait()
+            raise exceptions.HomeAssistantError("Late failure")
+        return {"entity": entity.entity_id}
+
+    element = TraceElement(None, "action/0")
+    trace_stack_cv.set([element])
+    response = await service.entity_service_call(
+        hass,
+        mock_entities,
+        HassJob(mock_service),
+        ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": "all"},
+            return_response=True,
+        ),
+    )
+
+    assert response == {
+        entity_id: {"entity": entity_id}
+        for entity_id in ("light.living_room", "light.bedroom", "light.bathroom")
+    }
+    assert element.as_dict()["result"]["entity_durations"].keys() == set(mock_entities)
+    assert "Service call for light.kitchen did not finish within 0.01" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done()
+    assert "Service call for light.kitchen failed after missing" in caplog.text
+
+
 async def test_register_admin_service(
     hass: HomeAssistant, hass_read_only_user: MockUser, hass_admin_user: MockUser
 ) -> None:
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 import voluptuous as vol
@@ -341,6 +342,40 @@ async def test_import_change(hass: HomeAssistant) -> None:
     assert to_test.async_render() == "macro2 variable2"
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the code of compiled templates is persisted."""
+    await template.async_load_custom_templates(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert template.Template("{{ 2 + 2 }}", hass).async_render(limited=True) == 4
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert len(hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]["code"]) == 2
+
+    # Restart with the same custom templates
+    custom_templates = template._get_hass_loader(hass).sources
+    bytecode_cache = template.TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load(custom_templates)
+    env = template.TemplateEnvironment(hass)
+    assert bytecode_cache.get("limited", "{{ 1 + 1 }}") is None
+    code = bytecode_cache.get("normal", "{{ 1 + 1 }}")
+    assert jinja2.Template.from_code(env, code, env.globals, None).render() == "2"
+
+    # A change of the custom templates invalidates the cache
+    await bytecode_cache.async_load({"other.jinja": "{% set other = 1 %}"})
+    assert bytecode_cache.get("normal", "{{ 1 + 1 }}") is None
+
+    # Restart after an upgrade
+    with patch("homeassistant.helpers.template.HA_VERSION", "1.0.0"):
+        bytecode_cache = template.TemplateBytecodeCache(hass)
+        await bytecode_cache.async_load(custom_templates)
+    assert bytecode_cache.get("normal", "{{ 1 + 1 }}") is None
+
+
 def test_loop_controls(hass: HomeAssistant) -> None:
     """Test that loop controls are enabled."""
     assert (
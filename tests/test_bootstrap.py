@@ -23,7 +23,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
-from homeassistant.setup import BASE_PLATFORMS
+from homeassistant.setup import BASE_PLATFORMS, async_get_setup_critical_path
 
 from .common import (
     MockConfigEntry,
@@ -297,6 +297,67 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@patch("homeassistant.bootstrap.DEFAULT_INTEGRATIONS", set())
+async def test_setup_stage_2_not_waiting_on_stage_1(hass: HomeAssistant) -> None:
+    """Test stage 2 integrations not depending on stage 1 are set up early."""
+    # This test relies on this
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    cloud_setup = asyncio.Event()
+    normal_started = asyncio.Event()
+    normal_setup = asyncio.Event()
+
+    async def async_setup_cloud(hass, config):
+        order.append("cloud")
+        await cloud_setup.wait()
+        return True
+
+    async def async_setup_after_dep(hass, config):
+        order.append("an_after_dep")
+        return True
+
+    async def async_setup_normal(hass, config):
+        order.append("normal_integration")
+        normal_started.set()
+        await normal_setup.wait()
+        return True
+
+    mock_integration(hass, MockModule(domain="cloud", async_setup=async_setup_cloud))
+    mock_integration(
+        hass, MockModule(domain="an_after_dep", async_setup=async_setup_after_dep)
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration",
+            async_setup=async_setup_normal,
+            partial_manifest={"after_dependencies": ["an_after_dep"]},
+        ),
+    )
+
+    setup_task = hass.async_create_task(
+        bootstrap._async_set_up_integrations(
+            hass, {"cloud": {}, "normal_integration": {}, "an_after_dep": {}}
+        )
+    )
+    await normal_started.wait()
+    assert order == ["cloud", "an_after_dep", "normal_integration"]
+    assert "an_after_dep" in hass.config.components
+    assert "cloud" not in hass.config.components
+
+    cloud_setup.set()
+    while "cloud" not in hass.config.components:
+        await asyncio.sleep(0)
+    normal_setup.set()
+    await setup_task
+
+    assert "normal_integration" in hass.config.components
+    assert [domain for domain, _ in async_get_setup_critical_path(hass)] == [
+        "an_after_dep",
+        "normal_integration",
+    ]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_manifests_are_loaded_even_if_not_setup(
     hass: HomeAssistant,
@@ -1160,6 +1160,90 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen to events indexed by key."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def all_listener(event):
+        """Mock listener for all keys."""
+        all_calls.append(event)
+
+    @ha.callback
+    def key_getter(event_data):
+        """Mock key getter."""
+        return event_data.get("key")
+
+    listeners_before = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed("test", key_getter, ["a", "b"], listener)
+    unsub_all = hass.bus.async_listen_keyed("test", key_getter, MATCH_ALL, all_listener)
+    assert hass.bus.async_listeners()["test"] == listeners_before + 1
+
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "b"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {"other": "a"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["key"] for event in calls] == ["a", "b"]
+    assert [event.data["key"] for event in all_calls] == ["a", "b", "c"]
+
+    unsub()
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert len(all_calls) == 4
+
+    unsub_all()
+    assert hass.bus.async_listeners().get("test", 0) == listeners_before
+
+
+async def test_eventbus_keyed_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test errors in keyed listeners and key getters are logged."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def bad_key_getter(event_data):
+        """Mock key getter that raises."""
+        raise ValueError("bad key")
+
+    def not_a_callback(event_data):
+        """Mock key getter that is not a callback."""
+        return "a"
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed("test", not_a_callback, "a", listener)
+
+    unsub_bad = hass.bus.async_listen_keyed("test", bad_key_getter, "a", listener)
+    unsub = hass.bus.async_listen_keyed(
+        "test", ha.callback(lambda data: data["key"]), "a", listener
+    )
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert "Error in event key getter" in caplog.text
+
+    unsub_bad()
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1555,6 +1639,78 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    attrs = {"some_attr": "attr_value"}
+    hass.states.async_set("light.bowl", "on", attrs)
+    hass.states.async_set("light.kitchen", "off", {})
+    bowl = hass.states.get("light.bowl")
+    kitchen = hass.states.get("light.kitchen")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    state_reported_events = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        # All states in the batch are written before the first event is fired
+        assert hass.states.get("light.Hall") is not None
+        state_reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        listener,
+        event_filter=ha.callback(lambda data: "old_last_reported" in data),
+    )
+
+    own_context = ha.Context()
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("light.kitchen", "off"),
+            ha.StateWrite("light.bowl", "off", attrs),
+            ha.StateWrite("light.Hall", "on", None, False, own_context),
+            ha.StateWrite("light.hall", "on", None, True),
+        ],
+        timestamp=1234.0,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.hall",
+        "light.hall",
+    ]
+    assert len(state_reported_events) == 1
+    assert state_reported_events[0].data["new_state"] is kitchen
+    assert kitchen.last_reported_timestamp == 1234.0
+
+    new_bowl = hass.states.get("light.bowl")
+    assert new_bowl.state == "off"
+    assert new_bowl.attributes is bowl.attributes
+    assert new_bowl.last_updated_timestamp == 1234.0
+    assert events[0].context is events[2].context
+    assert events[1].context is own_context
+    assert events[2].data["old_state"] is events[1].data["new_state"]
+    assert hass.states.get("light.hall") is events[2].data["new_state"]
+
+
+async def test_statemachine_async_set_many_invalid_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test async_set_many does not write any state if one is invalid."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ha.StateWrite("light.bowl", "on"),
+                ha.StateWrite("light.kitchen", "x" * 256),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl") is None
+    assert len(events) == 0
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
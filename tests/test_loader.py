@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from datetime import timedelta
 import os
 import pathlib
 import sys
@@ -11,15 +12,21 @@ from unittest.mock import MagicMock, Mock, patch
 from awesomeversion import AwesomeVersion
 import pytest
 
-from homeassistant import loader
+from homeassistant import components as hass_components, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -249,6 +256,18 @@ async def test_async_get_component(hass: HomeAssistant) -> None:
     assert integration.get_platform("light") == hue_light
 
 
+async def test_lazy_platform(hass: HomeAssistant) -> None:
+    """Test a lazy platform is imported on first use."""
+    integration = await loader.async_get_integration(hass, "hue")
+    lazy_platform = loader.LazyPlatform(integration, "light")
+    assert not lazy_platform.loaded
+    assert "hue.light" not in loader.async_get_platform_import_times(hass)
+
+    assert await lazy_platform.async_load() == hue_light
+    assert lazy_platform.loaded
+    assert loader.async_get_platform_import_times(hass)["hue.light"] >= 0
+
+
 async def test_get_integration_exceptions(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "hue")
@@ -1987,3 +2006,67 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_index(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are resolved from the persisted manifest index."""
+    integration = await loader.async_get_integration(hass, "hue")
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    manifest_path = str(integration.file_path / "manifest.json")
+    assert list(data["integrations"]) == [manifest_path]
+
+    # Emulate a fresh start
+    manifest_index = loader.ManifestIndex(hass)
+    await manifest_index.async_load()
+    with (
+        patch("homeassistant.loader.json_loads") as mock_json_loads,
+        patch("homeassistant.loader.os.listdir") as mock_listdir,
+    ):
+        indexed = await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root,
+            hass,
+            hass_components,
+            "hue",
+            manifest_index,
+        )
+    assert not mock_json_loads.called
+    assert not mock_listdir.called
+    assert indexed.manifest == integration.manifest
+    assert indexed._top_level_files == integration._top_level_files
+
+    # A modified manifest is read again
+    data["integrations"][manifest_path]["mtimes"][0] -= 1
+    manifest_index = loader.ManifestIndex(hass)
+    await manifest_index.async_load()
+    with patch("homeassistant.loader.json_loads", wraps=json_loads) as mock_json_loads:
+        await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root,
+            hass,
+            hass_components,
+            "hue",
+            manifest_index,
+        )
+    assert mock_json_loads.called
+
+    # The index is discarded when Home Assistant is upgraded
+    data["integrations"][manifest_path]["mtimes"][0] += 1
+    data["ha_version"] = "2000.1.0"
+    manifest_index = loader.ManifestIndex(hass)
+    await manifest_index.async_load()
+    with patch("homeassistant.loader.json_loads", wraps=json_loads) as mock_json_loads:
+        await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root,
+            hass,
+            hass_components,
+            "hue",
+            manifest_index,
+        )
+    assert mock_json_loads.called